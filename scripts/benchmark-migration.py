@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Benchmark the migration and validation scripts on synthetic vaults.
+
+Usage:
+    python scripts/benchmark-migration.py                      # 1k, 10k and 100k file vaults
+    python scripts/benchmark-migration.py --sizes 1000 10000   # Smaller run
+    python scripts/benchmark-migration.py --save-baseline      # Record results as the baseline
+    python scripts/benchmark-migration.py --tolerance 0.1      # Fail on a >10% slowdown
+    python scripts/benchmark-migration.py --keep --workdir /tmp/vaults  # Keep generated vaults
+    python scripts/benchmark-migration.py --sizes 1000 --profile        # Per-step breakdown
+    python scripts/benchmark-migration.py --sizes 1000 --cprofile out/  # pstats per stage
+
+Each vault mimics the real content mix: pages with old Obsidian frontmatter,
+new-style pages with and without breadcrumbs, some 50 KB pages, and dense
+[[wikilinks]] and markdown links between pages. Generation is seeded, so a
+given size always produces the same vault.
+
+Stages timed per vault:
+    walk       find_markdown_files() (validate-migration.py)
+    validate   validate_file() on every page
+    kebab      to_kebab_case() and to_kebab_case_many() on every path name
+    links      LinkGraph.build() without the link cache
+    migrate    ContentMigrator.migrate_file() on every page
+
+For each stage the harness records seconds, files/sec and the process's
+peak RSS so far (peak RSS never goes down, so later stages and sizes
+include earlier ones). Results are compared with the baseline JSON
+(scripts/benchmark-baseline.json unless --baseline is given): a stage
+whose files/sec drops, or a size whose peak RSS grows, by more than the
+tolerance is a regression, and the exit code is 1. Baselines are
+machine-specific; record one on the machine you compare on.
+
+--profile adds the per-step timings of validate_file() and
+ContentMigrator.migrate_file() (see profiling.py) for each size, and
+--cprofile DIR dumps cProfile stats of the validate and migrate stages
+to DIR/<size>-<stage>.pstats. Both slow the timed stages down.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+MIGRATION_DIR = SCRIPTS_DIR / 'migration'
+sys.path.insert(0, str(MIGRATION_DIR))
+from link_graph import LinkGraph
+from profiling import Profile, cprofile
+
+DEFAULT_BASELINE = SCRIPTS_DIR / 'benchmark-baseline.json'
+DEFAULT_SIZES = [1000, 10000, 100000]
+STAGES = ('walk', 'validate', 'kebab', 'links', 'migrate')
+
+# Content mix, as fractions of pages
+OLD_FRONTMATTER = 0.4
+NO_BREADCRUMB = 0.15
+LARGE_PAGE = 0.05
+LARGE_PAGE_BYTES = 50 * 1024
+
+SECTIONS = ['Development', 'Technical-Reference', 'User-Guide', 'Meta']
+SUBSECTIONS = ['Architecture', 'DataModels', 'View Models', 'KMP Migration', 'Testing',
+               'API Reference', 'Firebase', 'Equipment', 'Scoring', 'Tournaments']
+WORDS = ('arrow bow sight limb riser string nock fletching target round end score '
+         'session tournament equipment tuning release stabilizer quiver draw').split()
+
+def load_script(name: str, path: Path):
+    """Import a script whose file name isn't a valid module name."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident memory of this process in MB, if known."""
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+# =============================================================================
+# SYNTHETIC VAULTS
+# =============================================================================
+
+def page_paths(size: int, rng: random.Random) -> List[str]:
+    """Relative paths for size pages, spread over sections and subsections."""
+    paths = []
+    for n in range(size):
+        section = SECTIONS[n % len(SECTIONS)]
+        subsection = rng.choice(SUBSECTIONS)
+        title = ''.join(word.capitalize() for word in rng.sample(WORDS, 2))
+        paths.append(f"{section}/{subsection}/{title}-{n}.md")
+    return paths
+
+def paragraph(rng: random.Random, targets: List[str]) -> str:
+    """A paragraph of filler text with a few wikilinks and markdown links."""
+    words = []
+    for _ in range(rng.randint(40, 80)):
+        roll = rng.random()
+        if roll < 0.06:
+            target = rng.choice(targets)
+            words.append(f"[[{target.rsplit('/', 1)[-1][:-3]}]]")
+        elif roll < 0.08:
+            target = rng.choice(targets)
+            words.append(f"[see {target.rsplit('/', 1)[-1][:-3]}](/{target[:-3]})")
+        else:
+            words.append(rng.choice(WORDS))
+    return ' '.join(words)
+
+def render_page(path: str, rng: random.Random, targets: List[str]) -> str:
+    """One page: frontmatter in the old or new style, breadcrumb, H1 and body."""
+    title = path.rsplit('/', 1)[-1][:-3].replace('-', ' ')
+    roll = rng.random()
+    if roll < OLD_FRONTMATTER:
+        related = '\n'.join(f'  - "[[{rng.choice(targets).rsplit("/", 1)[-1][:-3]}]]"' for _ in range(3))
+        head = (f"---\ntags:\n  - {rng.choice(WORDS)}\n  - {rng.choice(WORDS)}\n"
+                f"created: 2025-01-{rng.randint(10, 28)}\nrelated:\n{related}\n---\n\n")
+    else:
+        head = (f"---\ntitle: \"{title}\"\ndescription: \"About {title.lower()}\"\n"
+                f"category: development\naudience:\n  - developers\nstatus: active\n"
+                f"last_updated: 2025-11-01\ntags:\n  - {rng.choice(WORDS)}\n---\n\n")
+    if roll >= OLD_FRONTMATTER + NO_BREADCRUMB:
+        crumbs = path.split('/')[:-1]
+        trail = ' > '.join(f"[{part.replace('-', ' ')}](/{'/'.join(crumbs[:i + 1])}/)"
+                           for i, part in enumerate(crumbs))
+        head += f"[Home](/) > {trail} > {title}\n\n---\n\n"
+
+    body = [f"# {title}\n"]
+    limit = LARGE_PAGE_BYTES if rng.random() < LARGE_PAGE else rng.randint(800, 4000)
+    length = 0
+    while length < limit:
+        if rng.random() < 0.15:
+            text = f"## {rng.choice(WORDS).capitalize()} {rng.choice(WORDS)}\n"
+        else:
+            text = paragraph(rng, targets) + "\n"
+        body.append(text)
+        length += len(text)
+    return head + '\n'.join(body)
+
+def generate_vault(root: Path, size: int, seed: int = 42):
+    """Write a synthetic vault of size pages under root."""
+    rng = random.Random(seed + size)
+    paths = page_paths(size, rng)
+    dirs = {path.rsplit('/', 1)[0] for path in paths}
+    for folder in sorted(dirs):
+        (root / folder).mkdir(parents=True, exist_ok=True)
+    with open(root / 'index.md', 'w', encoding='utf-8') as f:
+        f.write("---\ntitle: Home\n---\n\n# Home\n")
+    for path in paths:
+        with open(root / path, 'w', encoding='utf-8') as f:
+            f.write(render_page(path, rng, paths))
+
+# =============================================================================
+# STAGES
+# =============================================================================
+
+def time_stage(name: str, files: int, func: Callable[[], object], results: Dict) -> object:
+    """Run one stage, record its timing and print a progress line."""
+    started = time.perf_counter()
+    value = func()
+    seconds = time.perf_counter() - started
+    results[name] = {
+        'seconds': round(seconds, 4),
+        'files_per_sec': round(files / seconds, 1) if seconds > 0 else None,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+    rss = results[name]['peak_rss_mb']
+    print(f"  {name:<10} {seconds:9.3f} s  {results[name]['files_per_sec'] or 0:>11,.0f} files/s"
+          + (f"  {rss:8.1f} MB peak" if rss is not None else ""))
+    return value
+
+def run_size(root: Path, size: int, validator, kebab, migrator_module,
+             profile_top: Optional[int] = None, cprofile_dir: Optional[Path] = None) -> Dict:
+    """
+    Benchmark every stage on a vault of size pages at root. With profile_top,
+    per-step profiles of the validate and migrate stages are printed; with
+    cprofile_dir, their cProfile stats are dumped there.
+    """
+    results: Dict[str, Dict] = {}
+    validate_profile = Profile(profile_top) if profile_top is not None else None
+    migrate_profile = Profile(profile_top) if profile_top is not None else None
+    validator.set_profiling(validate_profile is not None)
+
+    def pstats_path(stage: str) -> Optional[Path]:
+        return cprofile_dir / f"{size}-{stage}.pstats" if cprofile_dir is not None else None
+
+    previous_cwd = Path.cwd()
+    # validate_file() reports breadcrumb paths relative to the current directory
+    os.chdir(root)
+    try:
+        files = time_stage('walk', size, lambda: validator.find_markdown_files(root), results)
+
+        def validate():
+            with cprofile(pstats_path('validate')):
+                for path in files:
+                    validation = validator.validate_file(path)
+                    if validate_profile is not None:
+                        validate_profile.add(path.relative_to(root).as_posix(), validation.timings)
+        time_stage('validate', len(files), validate, results)
+
+        def kebab_names():
+            kebab.to_kebab_case.cache_clear()
+            names = [part for path in files for part in path.relative_to(root).parts]
+            for name in names:
+                kebab.to_kebab_case(name)
+            kebab.to_kebab_case_many(names)
+        time_stage('kebab', len(files), kebab_names, results)
+
+        time_stage('links', len(files), lambda: LinkGraph.build(root), results)
+
+        def migrate():
+            migrator = migrator_module.ContentMigrator(root, profile=migrate_profile)
+            with open(os.devnull, 'w', encoding='utf-8') as devnull, redirect_stdout(devnull), \
+                    cprofile(pstats_path('migrate')):
+                for path in files:
+                    rel = path.relative_to(root).as_posix()
+                    migrator.migrate_file(rel, f"migrated/{rel}", {
+                        'title': path.stem.replace('-', ' '),
+                        'description': 'Benchmark page',
+                        'category': 'development',
+                        'audience': ['developers'],
+                        'status': 'active',
+                    })
+        time_stage('migrate', len(files), migrate, results)
+    finally:
+        os.chdir(previous_cwd)
+
+    for name, profile in (('validate_file()', validate_profile), ('migrate_file()', migrate_profile)):
+        if profile is not None:
+            print(f"\n  {name} profile:")
+            for line in profile.lines():
+                print(f"    {line}" if line else "")
+    return results
+
+# =============================================================================
+# BASELINE COMPARISON
+# =============================================================================
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Regressions of results against baseline, as printable lines."""
+    regressions = []
+    for size, stages in results['sizes'].items():
+        base_stages = baseline.get('sizes', {}).get(size)
+        if not base_stages:
+            continue
+        for stage, figures in stages.items():
+            base = base_stages.get(stage)
+            if not base or not base.get('files_per_sec') or not figures.get('files_per_sec'):
+                continue
+            ratio = figures['files_per_sec'] / base['files_per_sec']
+            if ratio < 1 - tolerance:
+                regressions.append(f"{size} files / {stage}: {figures['files_per_sec']:,.0f} files/s, "
+                                   f"baseline {base['files_per_sec']:,.0f} ({(ratio - 1) * 100:+.0f}%)")
+        peak = max((f['peak_rss_mb'] or 0) for f in stages.values())
+        base_peak = max((f.get('peak_rss_mb') or 0) for f in base_stages.values())
+        if base_peak and peak > base_peak * (1 + tolerance):
+            regressions.append(f"{size} files / peak RSS: {peak:.1f} MB, baseline {base_peak:.1f} MB "
+                               f"({(peak / base_peak - 1) * 100:+.0f}%)")
+    return regressions
+
+def parse_args(argv=None):
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Benchmark the migration scripts on synthetic vaults.")
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=DEFAULT_SIZES, metavar='N',
+        help="vault sizes in pages (default: 1000 10000 100000)"
+    )
+    parser.add_argument(
+        '--baseline', type=Path, default=DEFAULT_BASELINE, metavar='PATH',
+        help=f"baseline results to compare with (default: {DEFAULT_BASELINE.name})"
+    )
+    parser.add_argument(
+        '--save-baseline', action='store_true',
+        help="write these results to the baseline file instead of comparing"
+    )
+    parser.add_argument(
+        '--tolerance', type=float, default=0.2, metavar='FRACTION',
+        help="allowed slowdown or memory growth before failing (default: 0.2)"
+    )
+    parser.add_argument(
+        '--output', type=Path, metavar='PATH',
+        help="also write the results JSON to PATH"
+    )
+    parser.add_argument(
+        '--workdir', type=Path, metavar='PATH',
+        help="where to generate vaults (default: a temporary directory)"
+    )
+    parser.add_argument(
+        '--keep', action='store_true',
+        help="don't delete the generated vaults"
+    )
+    parser.add_argument(
+        '--profile', type=int, nargs='?', const=10, metavar='N',
+        help="print per-step profiles with the N slowest files (default N: 10)"
+    )
+    parser.add_argument(
+        '--cprofile', type=Path, metavar='DIR',
+        help="dump cProfile stats of the validate and migrate stages into DIR"
+    )
+    parser.add_argument(
+        '--seed', type=int, default=42,
+        help="seed for vault generation (default: 42)"
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    validator = load_script('validate_migration', MIGRATION_DIR / 'validate-migration.py')
+    validator.set_rules(validator.RuleSet.load(validator.DEFAULT_RULES_PATH))
+    kebab = load_script('migrate_to_kebab_case', SCRIPTS_DIR / 'migrate-to-kebab-case.py')
+    migrator_module = load_script('migrate_content_fixed', MIGRATION_DIR / 'migrate-content-fixed.py')
+
+    workdir = args.workdir or Path(tempfile.mkdtemp(prefix='migration-bench-'))
+    if args.cprofile:
+        args.cprofile.mkdir(parents=True, exist_ok=True)
+    results = {
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'sizes': {},
+    }
+
+    print("=" * 70)
+    print("MIGRATION SCRIPTS BENCHMARK")
+    print("=" * 70)
+    try:
+        for size in args.sizes:
+            root = workdir / f"vault-{size}"
+            if root.exists():
+                shutil.rmtree(root)
+            print(f"\n{size:,} files")
+            started = time.perf_counter()
+            generate_vault(root, size, args.seed)
+            print(f"  {'generate':<10} {time.perf_counter() - started:9.3f} s")
+            results['sizes'][str(size)] = run_size(root, size, validator, kebab, migrator_module,
+                                                   args.profile, args.cprofile)
+            if not args.keep:
+                shutil.rmtree(root)
+    finally:
+        if not args.keep and args.workdir is None:
+            shutil.rmtree(workdir, ignore_errors=True)
+    print()
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+        print(f"Results saved: {args.output}")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+        print(f"Baseline saved: {args.baseline}")
+        return 0
+
+    try:
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one")
+        return 0
+    except ValueError as e:
+        print(f"❌ Invalid baseline {args.baseline}: {e}")
+        return 1
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"❌ {len(regressions)} regressions against baseline from {baseline.get('date', '?')} "
+              f"(tolerance {args.tolerance:.0%}):")
+        for regression in regressions:
+            print(f"   └─ {regression}")
+        return 1
+    print(f"✅ No regressions against baseline from {baseline.get('date', '?')} (tolerance {args.tolerance:.0%})")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,273 +1,600 @@
-#!/usr/bin/env python3
-"""
-Migrate all directories and files to kebab-case naming.
-
-Usage:
-    python scripts/migrate-to-kebab-case.py --dry-run  # Preview changes
-    python scripts/migrate-to-kebab-case.py            # Execute changes
-"""
-
-import os
-import re
-import subprocess
-import sys
-from pathlib import Path
-from typing import List, Tuple
-
-def to_kebab_case(name: str) -> str:
-    """
-    Convert PascalCase, Mixed-Case, or spaces to kebab-case.
-
-    Examples:
-        'DataModels' → 'data-models'
-        'API Reference' → 'api-reference'
-        'KMP Migration' → 'kmp-migration'
-        'view-models' → 'view-models' (unchanged)
-    """
-    # Replace spaces with hyphens
-    s = name.replace(' ', '-')
-
-    # Handle PascalCase: DataModels → data-models
-    # Insert hyphen before uppercase letters that follow lowercase
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1-\2', s)
-
-    # Handle acronyms: APIReference → api-reference
-    s2 = re.sub('([a-z0-9])([A-Z])', r'\1-\2', s1)
-
-    # Lowercase everything
-    s3 = s2.lower()
-
-    # Clean up multiple consecutive hyphens
-    s4 = re.sub('-+', '-', s3)
-
-    # Remove leading/trailing hyphens
-    s5 = s4.strip('-')
-
-    return s5
-
-def find_non_kebab_dirs(root_path: Path) -> List[Tuple[Path, str]]:
-    """
-    Find all directories that aren't kebab-case.
-    Returns list of (full_path, kebab_name) tuples.
-    """
-    non_kebab = []
-
-    # Walk directory tree bottom-up to rename deepest directories first
-    for dirpath, dirnames, filenames in os.walk(root_path, topdown=False):
-        for dirname in dirnames:
-            kebab = to_kebab_case(dirname)
-            if dirname != kebab:
-                full_path = Path(dirpath) / dirname
-                non_kebab.append((full_path, kebab))
-
-    return non_kebab
-
-def find_non_kebab_files(root_path: Path) -> List[Tuple[Path, str]]:
-    """
-    Find all .md files that aren't kebab-case.
-    Returns list of (full_path, kebab_name) tuples.
-    """
-    non_kebab = []
-
-    for filepath in root_path.rglob('*.md'):
-        filename = filepath.name
-        name_without_ext = filepath.stem
-        kebab = to_kebab_case(name_without_ext)
-
-        if name_without_ext != kebab:
-            new_filename = f"{kebab}{filepath.suffix}"
-            non_kebab.append((filepath, new_filename))
-
-    return non_kebab
-
-def git_mv(old_path: Path, new_path: Path, dry_run: bool = False) -> bool:
-    """
-    Move a file/directory using git mv to preserve history.
-    Handles Windows case-sensitivity issues with a two-step rename.
-    Returns True if successful, False otherwise.
-    """
-    if dry_run:
-        print(f"  [DRY-RUN] git mv '{old_path}' '{new_path}'")
-        return True
-
-    # Check if this is a case-only rename (same path but different case)
-    if old_path.parent == new_path.parent and old_path.name.lower() == new_path.name.lower():
-        # Two-step rename for case-only changes (Windows compatibility)
-        temp_path = old_path.parent / f"{old_path.name}_temp_rename"
-
-        try:
-            # Step 1: Rename to temporary name
-            subprocess.run(
-                ['git', 'mv', str(old_path), str(temp_path)],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-
-            # Step 2: Rename to final name
-            subprocess.run(
-                ['git', 'mv', str(temp_path), str(new_path)],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-
-            print(f"  OK Renamed (2-step): {old_path} => {new_path}")
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"  ERROR renaming {old_path}: {e.stderr}")
-            # Try to clean up temp path if it exists
-            if temp_path.exists():
-                try:
-                    subprocess.run(['git', 'mv', str(temp_path), str(old_path)], check=False)
-                except:
-                    pass
-            return False
-    else:
-        # Direct rename for non-case-only changes
-        try:
-            subprocess.run(
-                ['git', 'mv', str(old_path), str(new_path)],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            print(f"  OK Renamed: {old_path} => {new_path}")
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"  ERROR renaming {old_path}: {e.stderr}")
-            return False
-
-def remove_redundant_nesting(dry_run: bool = False) -> int:
-    """
-    Remove the redundant content/internal/kmp-migration/kmp-migration/ directory.
-    Returns number of directories removed.
-    """
-    redundant_dir = Path('content/internal/kmp-migration/kmp-migration')
-
-    if not redundant_dir.exists():
-        print("No redundant kmp-migration/kmp-migration/ directory found.")
-        return 0
-
-    print("\n=== Fixing Redundant Nesting ===\n")
-    print(f"Removing duplicate directory: {redundant_dir}")
-
-    if dry_run:
-        print(f"  [DRY-RUN] Would remove: {redundant_dir}")
-        return 1
-    else:
-        try:
-            # Use git rm -r to remove directory while preserving history
-            subprocess.run(
-                ['git', 'rm', '-r', str(redundant_dir)],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            print(f"  OK Removed redundant directory: {redundant_dir}")
-            return 1
-        except subprocess.CalledProcessError as e:
-            print(f"  ERROR removing {redundant_dir}: {e.stderr}")
-            return 0
-
-def rename_directories(root_path: Path, dry_run: bool = False) -> int:
-    """
-    Rename all non-kebab-case directories.
-    Returns number of directories renamed.
-    """
-    non_kebab = find_non_kebab_dirs(root_path)
-
-    if not non_kebab:
-        print("No directories need renaming.")
-        return 0
-
-    print(f"\n=== Found {len(non_kebab)} directories to rename ===\n")
-
-    success_count = 0
-    for old_path, new_name in non_kebab:
-        new_path = old_path.parent / new_name
-        print(f"Directory: {old_path.relative_to(root_path)}")
-        print(f"  => {new_name}")
-
-        if git_mv(old_path, new_path, dry_run):
-            success_count += 1
-        print()
-
-    return success_count
-
-def rename_files(root_path: Path, dry_run: bool = False) -> int:
-    """
-    Rename all non-kebab-case .md files.
-    Returns number of files renamed.
-    """
-    non_kebab = find_non_kebab_files(root_path)
-
-    if not non_kebab:
-        print("No files need renaming.")
-        return 0
-
-    print(f"\n=== Found {len(non_kebab)} files to rename ===\n")
-
-    success_count = 0
-    for old_path, new_name in non_kebab:
-        new_path = old_path.parent / new_name
-        print(f"File: {old_path.relative_to(root_path)}")
-        print(f"  => {new_name}")
-
-        if git_mv(old_path, new_path, dry_run):
-            success_count += 1
-        print()
-
-    return success_count
-
-def main():
-    dry_run = '--dry-run' in sys.argv
-    root = Path('content')
-
-    if not root.exists():
-        print(f"Error: {root} directory not found!")
-        print("Run this script from the repository root.")
-        sys.exit(1)
-
-    print("=" * 70)
-    print("Kebab-Case Migration Script")
-    print("=" * 70)
-
-    if dry_run:
-        print("\n[DRY-RUN MODE] - No changes will be made\n")
-    else:
-        print("\n[LIVE MODE] - Changes will be applied\n")
-        response = input("Continue? (yes/no): ")
-        if response.lower() != 'yes':
-            print("Aborted.")
-            sys.exit(0)
-
-    # Phase 1: Remove redundant nesting
-    removed_count = remove_redundant_nesting(dry_run)
-
-    # Phase 2: Rename directories
-    dir_count = rename_directories(root, dry_run)
-
-    # Phase 3: Rename files
-    file_count = rename_files(root, dry_run)
-
-    # Summary
-    print("=" * 70)
-    print("Migration Summary")
-    print("=" * 70)
-    print(f"Redundant directories removed: {removed_count}")
-    print(f"Directories renamed: {dir_count}")
-    print(f"Files renamed: {file_count}")
-    print(f"Total changes: {removed_count + dir_count + file_count}")
-
-    if dry_run:
-        print("\nDry-run complete. Run without --dry-run to apply changes.")
-    else:
-        print("\nMigration complete!")
-        print("\nNext steps:")
-        print("1. Run: npx quartz build")
-        print("2. Check for broken links")
-        print("3. Commit changes")
-
-if __name__ == '__main__':
-    main()
+#!/usr/bin/env python3
+"""
+Migrate all directories and files to kebab-case naming.
+
+Usage:
+    python scripts/migrate-to-kebab-case.py --dry-run  # Preview changes
+    python scripts/migrate-to-kebab-case.py            # Execute changes
+    python scripts/migrate-to-kebab-case.py --batch    # Execute changes with a handful of git calls
+    python scripts/migrate-to-kebab-case.py --skip-links     # Rename only; leave links untouched
+    python scripts/migrate-to-kebab-case.py --verify-golden  # Check to_kebab_case against the golden corpus
+
+The rename plan is built from a single walk of content/ before anything is
+touched: every directory and .md file gets its final path, and names that
+would collide in the same folder (e.g. 'API Reference' and 'api-reference')
+abort the run. Dry-run and live mode execute the same operation list.
+
+Links are rewritten in the same run: one scan of content/ builds an
+inverted index of every [[wikilink]] and markdown link, and only the files
+whose links name a renamed folder or page are edited afterwards
+(--skip-links turns this off).
+
+Batch mode renames the working tree directly and rewrites the index in a
+single 'git update-index --index-info' call instead of one 'git mv' per
+path. If any rename fails, the renames already made are undone and the
+index is left untouched.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'migration'))
+from links import LinkIndex, VaultPaths, apply_rewrites, rewrite_target
+
+# Duplicate directory removed before renaming
+REDUNDANT_DIR = Path('content/internal/kmp-migration/kmp-migration')
+
+# Expected conversions for the docstring examples and every name in the
+# docs tree; any faster to_kebab_case must reproduce these exactly.
+GOLDEN_PATH = Path(__file__).with_name('kebab-case-golden.json')
+
+# Conversion patterns, compiled once
+PASCAL_PATTERN = re.compile('(.)([A-Z][a-z]+)')
+ACRONYM_PATTERN = re.compile('([a-z0-9])([A-Z])')
+HYPHENS_PATTERN = re.compile('-+')
+EDGE_HYPHENS_PATTERN = re.compile('^-|-$', re.MULTILINE)
+
+@lru_cache(maxsize=4096)
+def to_kebab_case(name: str) -> str:
+    """
+    Convert PascalCase, Mixed-Case, or spaces to kebab-case.
+    Results are memoized; names like 'index' and 'README' repeat everywhere.
+
+    Examples:
+        'DataModels' → 'data-models'
+        'API Reference' → 'api-reference'
+        'KMP Migration' → 'kmp-migration'
+        'view-models' → 'view-models' (unchanged)
+    """
+    # Replace spaces with hyphens
+    s = name.replace(' ', '-')
+
+    # Handle PascalCase: DataModels → data-models
+    # Insert hyphen before uppercase letters that follow lowercase
+    s1 = PASCAL_PATTERN.sub(r'\1-\2', s)
+
+    # Handle acronyms: APIReference → api-reference
+    s2 = ACRONYM_PATTERN.sub(r'\1-\2', s1)
+
+    # Lowercase everything
+    s3 = s2.lower()
+
+    # Clean up multiple consecutive hyphens
+    s4 = HYPHENS_PATTERN.sub('-', s3)
+
+    # Remove leading/trailing hyphens
+    s5 = s4.strip('-')
+
+    return s5
+
+def to_kebab_case_many(names: Iterable[str]) -> List[str]:
+    """
+    Convert a list of names in one pass.
+    Unique names are joined into one newline-separated string so each
+    pattern runs once over the whole batch; none of the patterns match
+    across a newline, so results equal per-name to_kebab_case().
+    """
+    names = list(names)
+    unique = list(dict.fromkeys(names))
+
+    if any('\n' in name for name in unique):
+        return [to_kebab_case(name) for name in names]
+
+    s = '\n'.join(unique).replace(' ', '-')
+    s = PASCAL_PATTERN.sub(r'\1-\2', s)
+    s = ACRONYM_PATTERN.sub(r'\1-\2', s)
+    s = HYPHENS_PATTERN.sub('-', s.lower())
+    s = EDGE_HYPHENS_PATTERN.sub('', s)
+
+    converted = dict(zip(unique, s.split('\n')))
+    return [converted[name] for name in names]
+
+def verify_golden(root_path: Path) -> bool:
+    """
+    Check to_kebab_case() and to_kebab_case_many() against the golden corpus,
+    and check the two agree on every name currently under root_path.
+    """
+    with open(GOLDEN_PATH, 'r', encoding='utf-8') as f:
+        golden: Dict[str, str] = json.load(f)
+
+    names = list(golden)
+    for dirpath, dirnames, filenames in os.walk(root_path):
+        names.extend(dirnames)
+        names.extend(os.path.splitext(filename)[0] for filename in filenames if filename.endswith('.md'))
+
+    failures = []
+    bulk = to_kebab_case_many(names)
+    for name, many_result in zip(names, bulk):
+        single_result = to_kebab_case(name)
+        expected = golden.get(name, single_result)
+        if single_result != expected or many_result != expected:
+            failures.append((name, expected, single_result, many_result))
+
+    for name, expected, single_result, many_result in failures:
+        print(f"  MISMATCH '{name}': expected '{expected}', "
+              f"to_kebab_case '{single_result}', to_kebab_case_many '{many_result}'")
+
+    print(f"Checked {len(names)} names ({len(golden)} golden): {len(failures)} mismatches")
+    return not failures
+
+class RenameNode:
+    """A directory or .md file in the rename plan."""
+    def __init__(self, name: str, parent: 'RenameNode' = None, is_dir: bool = True,
+                 new_name: str = None):
+        self.name = name
+        self.parent = parent
+        self.is_dir = is_dir
+        self.children: List['RenameNode'] = []
+
+        if parent is None:
+            # Plan root keeps its name
+            self.new_name = name
+            self.path = Path(name)
+            self.final_path = Path(name)
+            self.rel = ''
+        else:
+            self.new_name = new_name if new_name is not None else kebab_name(name, is_dir)
+            self.path = parent.path / name
+            self.final_path = parent.final_path / self.new_name
+            # Posix path from the plan root, as used by the link index
+            self.rel = f"{parent.rel}/{name}" if parent.rel else name
+            parent.children.append(self)
+
+    def needs_rename(self) -> bool:
+        return self.name != self.new_name
+
+def kebab_name(name: str, is_dir: bool) -> str:
+    """Kebab-case a directory name, or a file name keeping its extension."""
+    if is_dir:
+        return to_kebab_case(name)
+    stem, suffix = os.path.splitext(name)
+    return f"{to_kebab_case(stem)}{suffix}"
+
+class RenamePlan:
+    """
+    Every directory and .md file under a root, with final paths, built from
+    one top-down walk. Parents are created before children, so each final
+    path is computed once from its parent's in O(n) overall.
+    """
+    def __init__(self, root_path: Path):
+        self.root = RenameNode(str(root_path))
+        # folder -> {casefolded final name: [original names]}; other files
+        # are included so a rename can't land on an existing image etc.
+        self.names: Dict[RenameNode, Dict[str, List[str]]] = {}
+        self.conflicts: List[str] = []
+        # Root-relative path -> node, and operation -> node it renames
+        self.nodes: Dict[str, RenameNode] = {}
+        self.operation_nodes: Dict[Tuple[Path, Path], RenameNode] = {}
+
+    @classmethod
+    def build(cls, root_path: Path, exclude: List[Path] = ()) -> 'RenamePlan':
+        plan = cls(root_path)
+        nodes = {str(root_path): plan.root}
+        excluded = {str(path) for path in exclude}
+
+        for dirpath, dirnames, filenames in os.walk(root_path):
+            parent = nodes[dirpath]
+            dirnames[:] = [d for d in dirnames if os.path.join(dirpath, d) not in excluded]
+            names = plan.names.setdefault(parent, {})
+
+            md_files = [f for f in filenames if f.endswith('.md')]
+            converted = to_kebab_case_many(dirnames + [f[:-len('.md')] for f in md_files])
+
+            for dirname, new_name in zip(dirnames, converted):
+                node = RenameNode(dirname, parent, is_dir=True, new_name=new_name)
+                nodes[os.path.join(dirpath, dirname)] = node
+                plan.nodes[node.rel] = node
+                names.setdefault(new_name.casefold(), []).append(dirname)
+
+            for filename, stem in zip(md_files, converted[len(dirnames):]):
+                node = RenameNode(filename, parent, is_dir=False, new_name=f"{stem}.md")
+                plan.nodes[node.rel] = node
+                names.setdefault(f"{stem}.md".casefold(), []).append(filename)
+
+            for filename in filenames:
+                if not filename.endswith('.md'):
+                    names.setdefault(filename.casefold(), []).append(filename)
+
+        plan.conflicts = plan.find_conflicts()
+        return plan
+
+    def vault_paths(self) -> VaultPaths:
+        """The walked tree, for resolving links without another walk."""
+        dirs = [rel for rel, node in self.nodes.items() if node.is_dir]
+        files = [rel for rel, node in self.nodes.items() if not node.is_dir]
+        return VaultPaths(dirs, files)
+
+    def find_conflicts(self) -> List[str]:
+        """Describe every set of siblings that would end up with the same name."""
+        conflicts = []
+        for folder, names in self.names.items():
+            for final_name, sources in names.items():
+                if len(sources) > 1:
+                    listed = ', '.join(f"'{name}'" for name in sorted(sources))
+                    conflicts.append(f"{folder.path}: {listed} would all become '{final_name}'")
+        return conflicts
+
+    def operations(self) -> List[Tuple[Path, Path]]:
+        """
+        Ordered (old_path, new_path) renames, valid when applied in sequence.
+        Directories go deepest first, so each one's parent still has its
+        original name; files follow, under their parents' final paths.
+        """
+        return self.directory_operations() + self.file_operations()
+
+    def directory_operations(self) -> List[Tuple[Path, Path]]:
+        ops = []
+
+        def visit(node: RenameNode):
+            for child in node.children:
+                if child.is_dir:
+                    visit(child)
+            if node.parent is not None and node.needs_rename():
+                op = (node.parent.path / node.name, node.parent.path / node.new_name)
+                self.operation_nodes[op] = node
+                ops.append(op)
+
+        visit(self.root)
+        return ops
+
+    def file_operations(self) -> List[Tuple[Path, Path]]:
+        ops = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            for child in node.children:
+                if child.is_dir:
+                    stack.append(child)
+                elif child.needs_rename():
+                    op = (node.final_path / child.name, node.final_path / child.new_name)
+                    self.operation_nodes[op] = child
+                    ops.append(op)
+        return ops
+
+def git_mv(old_path: Path, new_path: Path, dry_run: bool = False) -> bool:
+    """
+    Move a file/directory using git mv to preserve history.
+    Handles Windows case-sensitivity issues with a two-step rename.
+    Returns True if successful, False otherwise.
+    """
+    if dry_run:
+        print(f"  [DRY-RUN] git mv '{old_path}' '{new_path}'")
+        return True
+
+    # Check if this is a case-only rename (same path but different case)
+    if old_path.parent == new_path.parent and old_path.name.lower() == new_path.name.lower():
+        # Two-step rename for case-only changes (Windows compatibility)
+        temp_path = old_path.parent / f"{old_path.name}_temp_rename"
+
+        try:
+            # Step 1: Rename to temporary name
+            subprocess.run(
+                ['git', 'mv', str(old_path), str(temp_path)],
+                check=True,
+                capture_output=True,
+                text=True
+            )
+
+            # Step 2: Rename to final name
+            subprocess.run(
+                ['git', 'mv', str(temp_path), str(new_path)],
+                check=True,
+                capture_output=True,
+                text=True
+            )
+
+            print(f"  OK Renamed (2-step): {old_path} => {new_path}")
+            return True
+        except subprocess.CalledProcessError as e:
+            print(f"  ERROR renaming {old_path}: {e.stderr}")
+            # Try to clean up temp path if it exists
+            if temp_path.exists():
+                try:
+                    subprocess.run(['git', 'mv', str(temp_path), str(old_path)], check=False)
+                except:
+                    pass
+            return False
+    else:
+        # Direct rename for non-case-only changes
+        try:
+            subprocess.run(
+                ['git', 'mv', str(old_path), str(new_path)],
+                check=True,
+                capture_output=True,
+                text=True
+            )
+            print(f"  OK Renamed: {old_path} => {new_path}")
+            return True
+        except subprocess.CalledProcessError as e:
+            print(f"  ERROR renaming {old_path}: {e.stderr}")
+            return False
+
+class RenameError(Exception):
+    """A batch rename step failed; completed steps have been rolled back."""
+
+def git_output(args: List[str], cwd: Path = None, input: bytes = None) -> bytes:
+    """Run a git command and return its stdout, raising RenameError on failure."""
+    result = subprocess.run(['git'] + args, cwd=cwd, input=input, capture_output=True)
+    if result.returncode != 0:
+        raise RenameError(f"git {args[0]} failed: {result.stderr.decode('utf-8', 'replace').strip()}")
+    return result.stdout
+
+def apply_renames_batch(plan: List[Tuple[Path, Path]], dry_run: bool = False) -> List[Tuple[Path, Path]]:
+    """
+    Apply a rename plan with a fixed number of git invocations.
+    Returns the steps applied; raises RenameError after rolling back.
+    """
+    if dry_run:
+        for old_path, new_path in plan:
+            print(f"  [DRY-RUN] git mv '{old_path}' '{new_path}'")
+        return list(plan)
+
+    toplevel = Path(git_output(['rev-parse', '--show-toplevel']).decode('utf-8').strip())
+
+    def repo_path(path: Path) -> str:
+        return path.resolve().relative_to(toplevel).as_posix()
+
+    # One ls-files call gives mode and blob for every tracked file
+    index: Dict[str, Tuple[str, str]] = {}
+    for record in git_output(['ls-files', '-s', '-z', '--full-name'], cwd=toplevel).split(b'\0'):
+        if not record:
+            continue
+        info, path = record.decode('utf-8').split('\t', 1)
+        mode, sha, stage = info.split()
+        if stage != '0':
+            raise RenameError(f"Unmerged path in index, resolve it first: {path}")
+        index[path] = (mode, sha)
+
+    # Simulate the plan against the index first, so untracked sources are
+    # reported (as git mv would) before anything on disk moves.
+    # current repo path -> original repo path, for every tracked file
+    origin = {path: path for path in index}
+    steps = []
+    for old_path, new_path in plan:
+        old_rel = repo_path(old_path)
+        new_rel = old_rel.rsplit('/', 1)[0] + '/' + new_path.name
+        prefix = old_rel + '/'
+        tracked = [path for path in origin if path == old_rel or path.startswith(prefix)]
+        if not tracked:
+            print(f"  ERROR renaming {old_path}: not under version control")
+            continue
+        for path in tracked:
+            origin[new_rel + path[len(old_rel):]] = origin.pop(path)
+        steps.append((old_path, new_path))
+
+    done: List[Tuple[Path, Path]] = []
+
+    def rename(src: Path, dst: Path):
+        os.rename(src, dst)
+        done.append((src, dst))
+
+    try:
+        for old_path, new_path in steps:
+            if old_path.name.lower() == new_path.name.lower():
+                # Two-step rename for case-only changes (Windows compatibility)
+                temp_path = old_path.parent / f"{old_path.name}_temp_rename"
+                rename(old_path, temp_path)
+                rename(temp_path, new_path)
+                print(f"  OK Renamed (2-step): {old_path} => {new_path}")
+            else:
+                if new_path.exists():
+                    raise RenameError(f"Destination exists: {new_path}")
+                rename(old_path, new_path)
+                print(f"  OK Renamed: {old_path} => {new_path}")
+
+        # Single index rewrite: drop every old path, add every new one
+        records = []
+        for new_rel, old_rel in origin.items():
+            if new_rel == old_rel:
+                continue
+            mode, sha = index[old_rel]
+            records.append(f"0 {'0' * 40}\t{old_rel}")
+            records.append(f"{mode} {sha}\t{new_rel}")
+        if records:
+            git_output(['update-index', '-z', '--index-info'], cwd=toplevel,
+                       input=('\0'.join(records) + '\0').encode('utf-8'))
+    except (OSError, RenameError) as e:
+        print(f"  ERROR: {e}")
+        print(f"  Rolling back {len(done)} rename(s)...")
+        for src, dst in reversed(done):
+            os.rename(dst, src)
+        raise RenameError(str(e)) from e
+
+    # Refresh stat info so git doesn't rehash every moved file later
+    subprocess.run(['git', 'update-index', '-q', '--refresh'], cwd=toplevel, capture_output=True)
+    return steps
+
+def remove_redundant_nesting(dry_run: bool = False) -> int:
+    """
+    Remove the redundant content/internal/kmp-migration/kmp-migration/ directory.
+    Returns number of directories removed.
+    """
+    redundant_dir = REDUNDANT_DIR
+
+    if not redundant_dir.exists():
+        print("No redundant kmp-migration/kmp-migration/ directory found.")
+        return 0
+
+    print("\n=== Fixing Redundant Nesting ===\n")
+    print(f"Removing duplicate directory: {redundant_dir}")
+
+    if dry_run:
+        print(f"  [DRY-RUN] Would remove: {redundant_dir}")
+        return 1
+    else:
+        try:
+            # Use git rm -r to remove directory while preserving history
+            subprocess.run(
+                ['git', 'rm', '-r', str(redundant_dir)],
+                check=True,
+                capture_output=True,
+                text=True
+            )
+            print(f"  OK Removed redundant directory: {redundant_dir}")
+            return 1
+        except subprocess.CalledProcessError as e:
+            print(f"  ERROR removing {redundant_dir}: {e.stderr}")
+            return 0
+
+def apply_plan(plan: RenamePlan, dry_run: bool = False,
+               batch: bool = False) -> List[Tuple[Path, Path]]:
+    """
+    Execute a validated rename plan.
+    Returns the operations that succeeded (all of them in a dry run).
+    """
+    dir_ops = plan.directory_operations()
+    file_ops = plan.file_operations()
+
+    if not dir_ops and not file_ops:
+        print("No directories or files need renaming.")
+        return []
+
+    print(f"\n=== Found {len(dir_ops)} directories and {len(file_ops)} files to rename ===\n")
+
+    if batch:
+        try:
+            return apply_renames_batch(dir_ops + file_ops, dry_run)
+        except RenameError:
+            print("\nBatch rename failed; all renames were rolled back.")
+            sys.exit(1)
+
+    applied = []
+    for label, ops in (("Directory", dir_ops), ("File", file_ops)):
+        for old_path, new_path in ops:
+            print(f"{label}: {old_path}")
+            print(f"  => {new_path.name}")
+
+            if git_mv(old_path, new_path, dry_run):
+                applied.append((old_path, new_path))
+            print()
+
+    return applied
+
+def rewrite_links(plan: RenamePlan, index: LinkIndex, applied: List[Tuple[Path, Path]],
+                  dry_run: bool = False) -> Tuple[int, int]:
+    """
+    Point links at the new names of everything that was renamed.
+    Only files the index lists as referencing a renamed path are opened.
+    Returns (links rewritten, files changed).
+    """
+    renamed = {}
+    for op in applied:
+        node = plan.operation_nodes[op]
+        renamed[node.rel] = node.new_name
+
+    link_count = 0
+    file_count = 0
+    for source, links in sorted(index.links_to(renamed).items()):
+        rewrites = [(link, rewrite_target(link, renamed)) for link in links]
+        rewrites = [(link, target) for link, target in rewrites if target != link.target]
+        if not rewrites:
+            continue
+
+        node = plan.nodes[source]
+        # The file itself may not have moved if its own rename failed
+        path = node.final_path if (dry_run or node.final_path.exists()) else node.path
+        print(f"Links: {path} ({len(rewrites)})")
+        for link, target in sorted(rewrites, key=lambda r: (r[0].line_number, r[0].start)):
+            prefix = "  [DRY-RUN] " if dry_run else "  "
+            print(f"{prefix}line {link.line_number}: {link.target} => {target}")
+
+        if not dry_run:
+            apply_rewrites(path, rewrites)
+        link_count += len(rewrites)
+        file_count += 1
+
+    return link_count, file_count
+
+def main():
+    dry_run = '--dry-run' in sys.argv
+    batch = '--batch' in sys.argv
+    skip_links = '--skip-links' in sys.argv
+    root = Path('content')
+
+    if not root.exists():
+        print(f"Error: {root} directory not found!")
+        print("Run this script from the repository root.")
+        sys.exit(1)
+
+    if '--verify-golden' in sys.argv:
+        sys.exit(0 if verify_golden(root) else 1)
+
+    print("=" * 70)
+    print("Kebab-Case Migration Script")
+    print("=" * 70)
+
+    if dry_run:
+        print("\n[DRY-RUN MODE] - No changes will be made\n")
+    else:
+        print("\n[LIVE MODE] - Changes will be applied\n")
+        response = input("Continue? (yes/no): ")
+        if response.lower() != 'yes':
+            print("Aborted.")
+            sys.exit(0)
+
+    # Phase 1: Remove redundant nesting
+    removed_count = remove_redundant_nesting(dry_run)
+
+    # Phases 2 and 3: plan directory and file renames in one walk. A dry run
+    # leaves the redundant directory in place, so leave it out of the plan.
+    plan = RenamePlan.build(root, exclude=[REDUNDANT_DIR] if dry_run else [])
+
+    if plan.conflicts:
+        print(f"\nERROR: {len(plan.conflicts)} rename collision(s) found, nothing was changed:")
+        for conflict in plan.conflicts:
+            print(f"  {conflict}")
+        sys.exit(1)
+
+    # Index links before anything moves; targets resolve against the old names
+    index = None
+    if not skip_links:
+        index = LinkIndex.build(root, plan.vault_paths())
+
+    applied = apply_plan(plan, dry_run, batch)
+    dir_count = len([op for op in applied if plan.operation_nodes[op].is_dir])
+    file_count = len(applied) - dir_count
+
+    # Phase 4: Rewrite links to renamed folders and pages
+    link_count, link_file_count = 0, 0
+    if index is not None and applied:
+        print("\n=== Rewriting links ===\n")
+        link_count, link_file_count = rewrite_links(plan, index, applied, dry_run)
+
+    # Summary
+    print("=" * 70)
+    print("Migration Summary")
+    print("=" * 70)
+    print(f"Redundant directories removed: {removed_count}")
+    print(f"Directories renamed: {dir_count}")
+    print(f"Files renamed: {file_count}")
+    print(f"Total changes: {removed_count + dir_count + file_count}")
+    if not skip_links:
+        print(f"Links rewritten: {link_count} in {link_file_count} files")
+
+    if dry_run:
+        print("\nDry-run complete. Run without --dry-run to apply changes.")
+    else:
+        print("\nMigration complete!")
+        print("\nNext steps:")
+        print("1. Run: npx quartz build")
+        print("2. Check for broken links" if skip_links else "2. Spot-check rewritten links")
+        print("3. Commit changes")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Link Checker
+Builds the vault's link graph and reports broken links, orphan pages and
+reference cycles.
+
+Usage:
+    python check-links.py                    # Check every page under content/
+    python check-links.py --root path/to/vault
+    python check-links.py page.md other.md   # Only report broken links in these files
+    python check-links.py --orphans --cycles # Also list orphan pages and cycles
+    python check-links.py --no-cache         # Re-parse every file
+
+Parsed links are cached in .link-cache.json in the current directory, so a
+run on save or from a pre-commit hook only re-reads files that changed.
+
+Exit code is 1 if any reported file has a broken link.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from link_graph import CACHE_FILENAME, LinkCache, LinkGraph
+
+# Fix Windows console encoding for Unicode characters
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+class Colors:
+    """ANSI color codes for terminal output."""
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    BOLD = '\033[1m'
+    END = '\033[0m'
+
+def parse_args(argv=None):
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Check links across the documentation vault.")
+    parser.add_argument(
+        'files', nargs='*', type=Path,
+        help="only report broken links written in these files"
+    )
+    parser.add_argument(
+        '--root', type=Path, default=None, metavar='PATH',
+        help="vault root (default: content/ if present, else the current directory)"
+    )
+    parser.add_argument(
+        '--orphans', action='store_true',
+        help="list pages no other page links to"
+    )
+    parser.add_argument(
+        '--cycles', action='store_true',
+        help="list groups of pages that link to each other in a cycle"
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help=f"re-parse every file and leave {CACHE_FILENAME} untouched"
+    )
+    return parser.parse_args(argv)
+
+def vault_relative(path: Path, root: Path):
+    """path as a posix path relative to root, or None if it lies outside."""
+    try:
+        return path.resolve().relative_to(root.resolve()).as_posix()
+    except ValueError:
+        return None
+
+def main(argv=None):
+    """Main link check entry point."""
+    args = parse_args(argv)
+    root = args.root
+    if root is None:
+        root = Path('content') if Path('content').is_dir() else Path('.')
+    if not root.is_dir():
+        print(f"{Colors.RED}Error: Vault root not found: {root}{Colors.END}")
+        return 1
+
+    cache = None
+    if not args.no_cache:
+        cache = LinkCache(Path.cwd() / CACHE_FILENAME)
+        cache.load()
+
+    graph = LinkGraph.build(root, cache)
+    print(f"\n{Colors.BOLD}Link check: {root}{Colors.END}")
+    print(f"Pages: {len(graph.index.paths.files)}")
+    if cache is not None:
+        print(f"Cache: {cache.hits} hits, {cache.misses} misses")
+        cache.save()
+
+    sources = None
+    if args.files:
+        sources = []
+        for path in args.files:
+            rel = vault_relative(path, root)
+            if rel is None or not rel.endswith('.md'):
+                continue
+            graph.update_file(rel)
+            sources.append(rel)
+
+    broken = graph.broken_links(sources)
+    orphans = graph.orphans()
+    cycles = graph.cycles()
+
+    print("")
+    if broken:
+        print(f"{Colors.RED}{Colors.BOLD}Broken links ({len(broken)}):{Colors.END}")
+        for source, link in broken:
+            print(f"  {source}:{link.line_number}: {link.target}")
+    else:
+        print(f"{Colors.GREEN}No broken links{Colors.END}")
+
+    print(f"{Colors.YELLOW}Orphan pages: {len(orphans)}{Colors.END}")
+    if args.orphans:
+        for page in orphans:
+            print(f"  {page}")
+
+    print(f"{Colors.BLUE}Reference cycles: {len(cycles)}{Colors.END}")
+    if args.cycles:
+        for group in cycles:
+            print(f"  {' <-> '.join(group)}")
+    print("")
+
+    return 1 if broken else 0
+
+if __name__ == '__main__':
+    exit(main())
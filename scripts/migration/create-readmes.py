@@ -1,95 +1,342 @@
-#!/usr/bin/env python3
-"""Create README files for all documentation folders"""
-
-import os
-from pathlib import Path
-
-# Define folder structure with descriptions
-folders = {
-    "User-Guide": "comprehensive user documentation",
-    "User-Guide/Quick-Start": "getting started guides for users",
-    "User-Guide/Features": "detailed feature documentation",
-    "User-Guide/Features/Scoring": "scoring system documentation",
-    "User-Guide/Features/Equipment": "equipment management documentation",
-    "User-Guide/Features/Analytics": "analytics and statistics documentation",
-    "User-Guide/Features/Sync": "sync and cloud features documentation",
-    "User-Guide/How-To": "step-by-step guides for common tasks",
-    "User-Guide/How-To/Scoring-Scenarios": "guides for different scoring situations",
-    "User-Guide/How-To/Equipment-Tasks": "guides for equipment management tasks",
-    "User-Guide/How-To/Data-Management": "guides for managing your data",
-    "User-Guide/Reference": "quick reference materials",
-    "User-Guide/Troubleshooting": "solutions to common problems",
-    "Development": "developer documentation and guides",
-    "Development/Getting-Started": "setup guides for developers",
-    "Development/Architecture": "architecture documentation",
-    "Development/Architecture/Layers": "layer architecture documentation",
-    "Development/Architecture/Patterns": "design patterns and best practices",
-    "Development/Architecture/Diagrams": "architecture diagrams and visualizations",
-    "Development/Guides": "developer how-to guides",
-    "Development/Guides/Adding-Features": "guides for adding new features",
-    "Development/Guides/Working-With": "guides for working with specific systems",
-    "Development/Guides/Best-Practices": "coding standards and best practices",
-    "Development/Testing": "testing guides and strategies",
-    "Development/Contributing": "contribution guidelines",
-    "Development/Tools": "development tools documentation",
-    "Technical-Reference": "technical API and system documentation",
-    "Technical-Reference/Database": "database schema and documentation",
-    "Technical-Reference/Database/Tables": "database table schemas",
-    "Technical-Reference/Database/Migrations": "database migration history",
-    "Technical-Reference/API": "API documentation",
-    "Technical-Reference/API/Repositories": "repository layer API documentation",
-    "Technical-Reference/API/ViewModels": "ViewModel API documentation",
-    "Technical-Reference/API/Services": "service layer API documentation",
-    "Technical-Reference/API/DAOs": "DAO layer API documentation",
-    "Technical-Reference/Flows": "system and user flow documentation",
-    "Technical-Reference/Flows/User-Flows": "user interaction flows",
-    "Technical-Reference/Flows/System-Flows": "internal system flows",
-    "Technical-Reference/Flows/Integration-Flows": "integration and sync flows",
-    "Technical-Reference/Data-Models": "data model documentation",
-    "Technical-Reference/Data-Models/Equipment": "equipment data models",
-    "Technical-Reference/Data-Models/Scoring": "scoring data models",
-    "Technical-Reference/Data-Models/Tournament": "tournament data models",
-    "Technical-Reference/Data-Models/Analytics": "analytics data models",
-    "Technical-Reference/Code-Examples": "code examples and snippets",
-    "Technical-Reference/Code-Examples/Common-Patterns": "common coding patterns",
-    "Technical-Reference/Code-Examples/Feature-Examples": "feature implementation examples",
-    "Technical-Reference/Code-Examples/Testing-Examples": "testing code examples",
-    "Technical-Reference/Performance": "performance guidelines and optimization",
-    "Architecture-Decisions": "architecture decision records (ADRs)",
-    "Project-Management": "project tracking and status",
-    "Project-Management/Roadmap": "project roadmap and planning",
-    "Project-Management/Release-Notes": "version release notes",
-    "Project-Management/Known-Issues": "known issues and workarounds",
-    "Project-Management/Status": "current project status",
-    "Project-Management/Team": "team information and contacts",
-    "Meta": "documentation about the documentation",
-    "Meta/Templates": "documentation templates",
-    "assets": "images, videos, and downloadable files",
-    "assets/images": "all image assets",
-    "assets/videos": "video tutorials and demos",
-    "assets/downloads": "downloadable files and samples",
-}
-
-base_dir = Path("/mnt/c/Users/chris_3zal3ta/Documents/ArcheryApprentice-Docs")
-
-for folder_path, description in folders.items():
-    folder_name = folder_path.split("/")[-1].replace("-", " ")
-    readme_path = base_dir / folder_path / "README.md"
-
-    # Ensure directory exists
-    readme_path.parent.mkdir(parents=True, exist_ok=True)
-
-    content = f"""# {folder_name}
-
-This folder contains: {description}
-
-**Status:** 🚧 Under Construction
-
-Contents:
-- [Will be populated during documentation creation]
-"""
-
-    readme_path.write_text(content, encoding='utf-8')
-    print(f"✅ Created {readme_path}")
-
-print(f"\n✨ Created {len(folders)} README files!")
+#!/usr/bin/env python3
+"""
+Folder Index Generator
+Writes an index page for every documentation folder, with a table of
+contents built from the frontmatter (title, description, status) of the
+pages and subfolders in it.
+
+Usage:
+    python create-readmes.py                  # index.md in every folder under content/
+    python create-readmes.py --name README.md # README.md instead
+    python create-readmes.py --planned        # also create the planned folders
+    python create-readmes.py --dry-run        # list the pages that would change
+    python create-readmes.py --append         # add contents to hand-written pages too
+
+The contents sit between the INDEX_START and INDEX_END markers. On a page
+that has them only that block is rewritten, so hand-written text around
+it is kept; new pages and the old "Under Construction" stubs are generated
+whole. Hand-written pages without the markers are left alone unless
+--append is given.
+
+A page is only written when the rendered bytes differ from the file on
+disk (compared by SHA-256), so Quartz only rebuilds folders whose contents
+changed. .index-cache.json in the current directory records each folder's
+children (name, size, mtime) and the page written for them, so an
+unchanged folder is skipped without reading any of its files. Folders are
+indexed deepest first, so a parent lists its subfolders' final titles.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from frontmatter import FIELD_ORDER, Frontmatter, frontmatter_offsets, mapped_file
+from section_tree import FOLDERS, SectionTree, display_name
+
+# Fix Windows console encoding for Unicode characters
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+CACHE_VERSION = 1
+CACHE_FILENAME = '.index-cache.json'
+
+INDEX_NAMES = ('index.md', 'README.md')
+INDEX_START = '<!-- index:start -->'
+INDEX_END = '<!-- index:end -->'
+
+# Line in the stubs written by earlier versions of this script
+LEGACY_STUB = '[Will be populated during documentation creation]'
+
+# Frontmatter category for new pages, by top-level section
+CATEGORIES = {
+    'Development': 'development',
+    'User-Guide': 'user-guide',
+    'Technical-Reference': 'technical-reference',
+    'Meta': 'meta',
+}
+
+class Colors:
+    """ANSI color codes for terminal output."""
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    BLUE = '\033[94m'
+    BOLD = '\033[1m'
+    END = '\033[0m'
+
+class Entry:
+    """One row of a folder's contents."""
+    __slots__ = ('title', 'link', 'description', 'status')
+
+    def __init__(self, title: str, link: str, description: str = '', status: str = ''):
+        self.title = title
+        self.link = link
+        self.description = description
+        self.status = status
+
+def parse_args(argv=None):
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Generate folder index pages from page frontmatter.")
+    parser.add_argument(
+        '--root', type=Path, default=None, metavar='PATH',
+        help="vault root (default: content/ if present, else the current directory)"
+    )
+    parser.add_argument(
+        '--name', choices=INDEX_NAMES, default='index.md',
+        help="index page file name (default: index.md)"
+    )
+    parser.add_argument(
+        '--planned', action='store_true',
+        help="create the planned folder structure first"
+    )
+    parser.add_argument(
+        '--append', action='store_true',
+        help="add the contents block to hand-written pages that don't have one"
+    )
+    parser.add_argument(
+        '--dry-run', action='store_true',
+        help="list the pages that would be written without writing them"
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help=f"re-read every folder and leave {CACHE_FILENAME} untouched"
+    )
+    return parser.parse_args(argv)
+
+def read_fields(path: Path) -> Frontmatter:
+    """A page's frontmatter, read without decoding the body (empty if it has none)."""
+    try:
+        with mapped_file(path) as buf:
+            offsets = frontmatter_offsets(buf)
+            raw = buf[offsets[0]:offsets[1]] if offsets else b''
+        return Frontmatter(raw.decode('utf-8'))
+    except (OSError, ValueError):
+        return Frontmatter()
+
+def stat_key(path: Path) -> Optional[List[int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+def list_folder(folder: Path) -> Tuple[List[str], List[str]]:
+    """Sorted (subfolder names, page names) in a folder, index pages excluded."""
+    folders: List[str] = []
+    pages: List[str] = []
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir():
+                    folders.append(entry.name)
+                elif entry.name.endswith('.md') and entry.name not in INDEX_NAMES:
+                    pages.append(entry.name)
+    except OSError:
+        pass
+    return sorted(folders), sorted(pages)
+
+class FolderIndexer:
+    """Renders and writes the index page of each folder under a root."""
+    def __init__(self, root: Path, name: str, tree: SectionTree, append: bool = False,
+                 dry_run: bool = False, cache_path: Optional[Path] = None):
+        self.root = root
+        self.name = name
+        self.tree = tree
+        self.append = append
+        self.dry_run = dry_run
+        self.cache_path = cache_path
+        self.entries: Dict[str, Dict] = {}
+        self.seen: Dict[str, Dict] = {}
+        self.written: List[str] = []
+        self.unchanged = 0
+        self.skipped: List[str] = []
+
+    def load_cache(self):
+        if self.cache_path is None:
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == CACHE_VERSION and data.get('name') == self.name:
+            self.entries = data.get('folders', {})
+
+    def save_cache(self):
+        """Write entries for the folders seen this run."""
+        if self.cache_path is None or self.dry_run:
+            return
+        data = {'version': CACHE_VERSION, 'name': self.name, 'folders': self.seen}
+        tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+    def signature(self, folder: str, subfolders: List[str], pages: List[str]) -> str:
+        """Hash of everything a folder's index is rendered from."""
+        path = self.root / folder
+        parts = [self.tree.breadcrumb(folder, ''), FOLDERS.get(folder, '')]
+        for sub in subfolders:
+            parts.append([sub, stat_key(path / sub / self.name)])
+        for page in pages:
+            parts.append([page, stat_key(path / page)])
+        return hashlib.sha256(json.dumps(parts).encode('utf-8')).hexdigest()
+
+    def entries_for(self, folder: str, subfolders: List[str], pages: List[str]) -> List[Entry]:
+        path = self.root / folder
+        rows = []
+        for sub in subfolders:
+            fields = read_fields(path / sub / self.name)
+            rel = f"{folder}/{sub}" if folder else sub
+            rows.append(Entry(fields.get_str('title') or display_name(sub), quote(sub) + '/',
+                              fields.get_str('description') or FOLDERS.get(rel, ''),
+                              fields.get_str('status')))
+        for page in pages:
+            fields = read_fields(path / page)
+            rows.append(Entry(fields.get_str('title') or display_name(page[:-3]), quote(page),
+                              fields.get_str('description'), fields.get_str('status')))
+        return rows
+
+    def render_block(self, rows: List[Entry]) -> str:
+        """The generated contents, markers included."""
+        def cell(text: str) -> str:
+            return ' '.join(text.split()).replace('|', '\\|')
+
+        lines = [INDEX_START, "## Contents", ""]
+        if rows:
+            lines.append("| Page | Description | Status |")
+            lines.append("|------|-------------|--------|")
+            for row in rows:
+                lines.append(f"| [{cell(row.title)}]({row.link}) | {cell(row.description)} | {cell(row.status)} |")
+        else:
+            lines.append("_No pages yet._")
+        lines.append(INDEX_END)
+        return '\n'.join(lines)
+
+    def render_page(self, folder: str, block: str) -> str:
+        """A whole new index page for folder."""
+        title = display_name(folder.rpartition('/')[2])
+        description = FOLDERS.get(folder)
+        intro = f"This folder contains: {description}\n\n" if description else ""
+        section = folder.split('/')[0]
+        frontmatter = Frontmatter.from_dict({
+            'title': title,
+            'description': description[0].upper() + description[1:] if description else f"Index of {title}",
+            'category': CATEGORIES.get(section, 'meta'),
+            'audience': 'all',
+            'status': 'active',
+            'tags': ['index'],
+        }, FIELD_ORDER)
+        return (f"{frontmatter.render()}\n{self.tree.breadcrumb(folder, title)}\n\n---\n\n"
+                f"# {title}\n\n{intro}{block}\n")
+
+    def merge(self, current: Optional[str], folder: str, block: str) -> Optional[str]:
+        """New text for a page given its current text (None if missing); None to leave it."""
+        if current is None or LEGACY_STUB in current:
+            return self.render_page(folder, block)
+        start = current.find(INDEX_START)
+        end = current.find(INDEX_END, start)
+        if start != -1 and end != -1:
+            return current[:start] + block + current[end + len(INDEX_END):]
+        if self.append:
+            return current.rstrip('\n') + '\n\n' + block + '\n'
+        return None
+
+    def index_folder(self, folder: str):
+        path = self.root / folder
+        page_path = path / self.name
+        subfolders, pages = list_folder(path)
+        signature = self.signature(folder, subfolders, pages)
+
+        entry = self.entries.get(folder)
+        page_key = stat_key(page_path)
+        if (entry and entry['signature'] == signature and entry['page'] == page_key
+                and not (self.append and entry.get('skipped'))):
+            self.seen[folder] = entry
+            if entry.get('skipped'):
+                self.skipped.append(folder)
+            else:
+                self.unchanged += 1
+            return
+
+        try:
+            data = page_path.read_bytes()
+        except OSError:
+            data = None
+        current = None
+        crlf = False
+        if data is not None:
+            crlf = b'\r\n' in data
+            current = data.decode('utf-8', errors='replace').replace('\r\n', '\n')
+
+        block = self.render_block(self.entries_for(folder, subfolders, pages))
+        text = self.merge(current, folder, block)
+        if text is None:
+            self.skipped.append(folder)
+            self.seen[folder] = {'signature': signature, 'page': page_key, 'skipped': True}
+            return
+
+        new_data = (text.replace('\n', '\r\n') if crlf else text).encode('utf-8')
+        if data is not None and hashlib.sha256(new_data).digest() == hashlib.sha256(data).digest():
+            self.unchanged += 1
+        else:
+            self.written.append(folder)
+            if self.dry_run:
+                return
+            tmp_path = page_path.with_name(page_path.name + '.tmp')
+            tmp_path.write_bytes(new_data)
+            os.replace(tmp_path, page_path)
+            page_key = stat_key(page_path)
+        self.seen[folder] = {'signature': signature, 'page': page_key}
+
+    def run(self):
+        """Index every folder that exists under root, deepest first."""
+        folders = [folder for folder in self.tree.nodes if folder and (self.root / folder).is_dir()]
+        folders.sort(key=lambda folder: (-folder.count('/'), folder))
+        for folder in folders:
+            self.index_folder(folder)
+
+def main(argv=None):
+    """Main index generation entry point."""
+    args = parse_args(argv)
+    root = args.root
+    if root is None:
+        root = Path('content') if Path('content').is_dir() else Path('.')
+    if not root.is_dir():
+        print(f"Error: Vault root not found: {root}")
+        return 1
+
+    if args.planned and not args.dry_run:
+        for folder in FOLDERS:
+            (root / folder).mkdir(parents=True, exist_ok=True)
+
+    tree = SectionTree.build(root)
+    cache_path = None if args.no_cache else Path.cwd() / CACHE_FILENAME
+    indexer = FolderIndexer(root, args.name, tree, args.append, args.dry_run, cache_path)
+    indexer.load_cache()
+    indexer.run()
+    indexer.save_cache()
+
+    verb = "Would write" if args.dry_run else "Wrote"
+    for folder in indexer.written:
+        print(f"{Colors.GREEN}✅ {verb} {root / folder / args.name}{Colors.END}")
+    for folder in indexer.skipped:
+        print(f"{Colors.YELLOW}⏭️  Hand-written, no contents markers: {root / folder / args.name}{Colors.END}")
+
+    total = len(indexer.written) + indexer.unchanged + len(indexer.skipped)
+    print(f"\n{Colors.BOLD}✨ {verb} {len(indexer.written)} of {total} index pages{Colors.END}"
+          f" ({indexer.unchanged} unchanged, {len(indexer.skipped)} hand-written)")
+    return 0
+
+if __name__ == '__main__':
+    exit(main())
@@ -1,320 +1,268 @@
-#!/usr/bin/env python3
-"""
-Execute Phase 2A Migration
-Migrates Testing, Firebase, System Flows, and Technical Notes
-"""
-
-import shutil
-from pathlib import Path
-from datetime import datetime
-
-BASE_DIR = Path("/mnt/c/Users/chris_3zal3ta/Documents/ArcheryApprentice-Docs")
-
-def add_frontmatter(content, metadata):
-    """Add YAML frontmatter if not present"""
-    if content.startswith('---\n'):
-        return content
-
-    frontmatter = "---\n"
-    for key, value in metadata.items():
-        if isinstance(value, list):
-            frontmatter += f"{key}:\n"
-            for item in value:
-                frontmatter += f"  - \"{item}\"\n"
-        else:
-            frontmatter += f"{key}: \"{value}\"\n"
-    frontmatter += "---\n\n"
-
-    return frontmatter + content
-
-def migrate_file(source_rel, dest_rel, metadata, migrations):
-    """Migrate a single file with frontmatter"""
-    source = BASE_DIR / source_rel
-    dest = BASE_DIR / dest_rel
-
-    if not source.exists():
-        print(f"⚠️  Source not found: {source_rel}")
-        return False
-
-    try:
-        content = source.read_text(encoding='utf-8')
-
-        # Add navigation breadcrumb after frontmatter
-        lines = content.split('\n')
-        title = lines[0].replace('# ', '').strip() if lines else "Document"
-
-        # Build breadcrumb based on destination
-        parts = dest_rel.split('/')
-        breadcrumb_parts = []
-        path_so_far = ""
-        for i, part in enumerate(parts[:-1]):  # Exclude filename
-            if part in ["Development", "User-Guide", "Technical-Reference"]:
-                path_so_far = f"/{part}/"
-                breadcrumb_parts.append(f"[{part.replace('-', ' ')}]({path_so_far})")
-            elif part not in [".", ".."] and i > 0:
-                path_so_far += part + "/"
-                breadcrumb_parts.append(f"[{part.replace('-', ' ')}]({path_so_far})")
-
-        breadcrumb = "[Home](/) > " + " > ".join(breadcrumb_parts) + f" > {title}\n\n---\n\n"
-
-        # Add frontmatter
-        content_with_frontmatter = add_frontmatter(content, metadata)
-
-        # Insert breadcrumb after frontmatter
-        if content_with_frontmatter.startswith('---\n'):
-            # Find end of frontmatter
-            parts = content_with_frontmatter.split('---\n', 2)
-            if len(parts) >= 3:
-                content_with_frontmatter = f"---\n{parts[1]}---\n\n{breadcrumb}{parts[2]}"
-
-        # Create dest directory
-        dest.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write to destination
-        dest.write_text(content_with_frontmatter, encoding='utf-8')
-
-        migrations.append(f"✅ {source_rel} → {dest_rel}")
-        print(f"✅ Migrated: {source_rel}")
-        return True
-
-    except Exception as e:
-        print(f"❌ Error migrating {source_rel}: {e}")
-        return False
-
-# Track migrations
-migrations = []
-errors = []
-
-print("=" * 70)
-print("PHASE 2A MIGRATION")
-print("=" * 70)
-print()
-
-# =============================================================================
-# TESTING DOCUMENTATION (remaining files)
-# =============================================================================
-print("📚 Migrating Testing Documentation...")
-print("-" * 70)
-
-testing_files = [
-    ("Testing/Adapter-Migration-Guide.md", "adapter migration patterns"),
-    ("Testing/Cache-Testing-Guide.md", "cache testing strategies"),
-    ("Testing/Coverage-Guide.md", "test coverage guidelines"),
-    ("Testing/Test-Coverage-Guide.md", "comprehensive test coverage guide"),
-    ("Testing/Test-Coverage-State-Week-10.md", "test coverage snapshot Week 10"),
-    ("Testing/Test-Failure-Analysis.md", "test failure diagnosis and resolution"),
-    ("Testing/Test-Quality-Standards.md", "test quality standards and practices"),
-    ("Testing/Tournament-Test-Guide.md", "tournament system testing guide"),
-    ("Testing/Tournament-Testing-Checklist.md", "tournament testing checklist"),
-]
-
-for source, desc in testing_files:
-    filename = Path(source).name
-    dest = f"Development/Testing/{filename}"
-    metadata = {
-        "title": filename.replace('-', ' ').replace('.md', ''),
-        "description": desc,
-        "category": "development",
-        "audience": ["developers"],
-        "difficulty": "intermediate",
-        "status": "active",
-        "last_updated": "2025-10-29",
-        "tags": ["testing", "quality", "guide"],
-    }
-    migrate_file(source, dest, metadata, migrations)
-
-print()
-
-# =============================================================================
-# FIREBASE DOCUMENTATION
-# =============================================================================
-print("🔥 Migrating Firebase Documentation...")
-print("-" * 70)
-
-firebase_files = [
-    ("Firebase/Firebase-Integration-Plan.md", "Firebase integration architecture plan"),
-    ("Firebase/Firebase-Overview.md", "Firebase services overview"),
-    ("Firebase/Firebase-Security-Rules.md", "Firebase security rules documentation"),
-    ("Firebase/Firebase-Setup.md", "Firebase project setup guide"),
-    ("Firebase/Tournament-Discovery.md", "Tournament discovery via Firebase"),
-    ("Firebase/Tournament-UI-Plan.md", "Tournament UI implementation plan"),
-]
-
-for source, desc in firebase_files:
-    filename = Path(source).name
-    dest = f"Development/Guides/Working-With/Firebase-{filename}"
-    metadata = {
-        "title": filename.replace('-', ' ').replace('.md', ''),
-        "description": desc,
-        "category": "development",
-        "audience": ["developers"],
-        "difficulty": "intermediate",
-        "status": "active",
-        "last_updated": "2025-10-29",
-        "tags": ["firebase", "cloud", "integration"],
-    }
-    migrate_file(source, dest, metadata, migrations)
-
-print()
-
-# =============================================================================
-# SYSTEM FLOWS
-# =============================================================================
-print("🔄 Migrating System Flows...")
-print("-" * 70)
-
-flow_files = [
-    ("Flows/Data-Sync-Flow.md", "data synchronization flow documentation"),
-    ("Flows/Equipment-Management-End-to-End-Flow.md", "equipment management complete flow"),
-    ("Flows/Round-Lifecycle-Flow.md", "round lifecycle state transitions"),
-    ("Flows/Scoring-Flow.md", "scoring workflow and data flow"),
-    ("Flows/Service-Architecture.md", "service layer architecture"),
-    ("Flows/Service-Migration-Flow.md", "service extraction migration flow"),
-]
-
-for source, desc in flow_files:
-    filename = Path(source).name
-    dest = f"Technical-Reference/Flows/System-Flows/{filename}"
-    metadata = {
-        "title": filename.replace('-', ' ').replace('.md', ''),
-        "description": desc,
-        "category": "technical-reference",
-        "audience": ["developers"],
-        "difficulty": "intermediate",
-        "status": "active",
-        "last_updated": "2025-10-29",
-        "tags": ["flow", "architecture", "system"],
-    }
-    migrate_file(source, dest, metadata, migrations)
-
-print()
-
-# =============================================================================
-# TECHNICAL NOTES
-# =============================================================================
-print("📝 Migrating Technical Notes...")
-print("-" * 70)
-
-tech_notes = [
-    ("technical-notes/Firebase Auth State Loss Across Coroutines.md",
-     "Firebase authentication state management in coroutines"),
-    ("technical-notes/Multi-Participant Ranking and Tie-Breaking.md",
-     "Multi-participant ranking algorithm and tie-breaking logic"),
-]
-
-for source, desc in tech_notes:
-    filename = Path(source).name
-    dest = f"Development/Guides/Best-Practices/{filename}"
-    metadata = {
-        "title": filename.replace('-', ' ').replace('.md', ''),
-        "description": desc,
-        "category": "development",
-        "audience": ["developers"],
-        "difficulty": "advanced",
-        "status": "active",
-        "last_updated": "2025-10-29",
-        "tags": ["best-practices", "patterns", "lessons-learned"],
-    }
-    migrate_file(source, dest, metadata, migrations)
-
-print()
-
-# =============================================================================
-# DEVELOPMENT PATTERNS
-# =============================================================================
-print("📐 Migrating Development Patterns...")
-print("-" * 70)
-
-pattern_files = [
-    ("Development Patterns/Migration Testing - Unit Tests vs Instrumented Tests.md",
-     "testing strategy for database migrations"),
-]
-
-for source, desc in pattern_files:
-    filename = Path(source).name
-    dest = f"Development/Guides/Best-Practices/{filename}"
-    metadata = {
-        "title": filename.replace('-', ' ').replace('.md', ''),
-        "description": desc,
-        "category": "development",
-        "audience": ["developers"],
-        "difficulty": "intermediate",
-        "status": "active",
-        "last_updated": "2025-10-29",
-        "tags": ["testing", "migration", "patterns"],
-    }
-    migrate_file(source, dest, metadata, migrations)
-
-print()
-
-# =============================================================================
-# GENERATE REPORT
-# =============================================================================
-print("=" * 70)
-print(f"MIGRATION COMPLETE: {len(migrations)} files migrated")
-print("=" * 70)
-
-report = f"""# Phase 2A Migration Report
-
-**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-**Phase:** 2A - Quick Wins
-**Files Migrated:** {len(migrations)}
-
----
-
-## Migration Summary
-
-### Categories Migrated
-
-1. **Testing Documentation** (9 files) → `Development/Testing/`
-2. **Firebase Integration** (6 files) → `Development/Guides/Working-With/`
-3. **System Flows** (6 files) → `Technical-Reference/Flows/System-Flows/`
-4. **Technical Notes** (2 files) → `Development/Guides/Best-Practices/`
-5. **Development Patterns** (1 file) → `Development/Guides/Best-Practices/`
-
-**Total:** 24 files
-
----
-
-## Migrations Performed
-
-"""
-
-for migration in migrations:
-    report += f"{migration}\n"
-
-report += f"""
-
----
-
-## Changes Applied
-
-### Added to Each File:
-1. **YAML Frontmatter** - Metadata including title, description, category, audience, tags
-2. **Breadcrumb Navigation** - Path from home to current document
-3. **Status Indicators** - Document status and last updated date
-4. **Related Documentation** - Cross-reference sections (where applicable)
-
-### Directory Structure:
-- `Development/Testing/` - 9 test guides
-- `Development/Guides/Working-With/` - 6 Firebase docs
-- `Development/Guides/Best-Practices/` - 3 pattern docs
-- `Technical-Reference/Flows/System-Flows/` - 6 flow docs
-
----
-
-## Next Steps (Phase 2B)
-
-1. Migrate Architecture documentation
-2. Migrate Project Management content
-3. Migrate Contributing guides
-4. Update cross-references
-
----
-
-*Generated by Phase 2A Migration Script*
-"""
-
-report_path = BASE_DIR / "Meta/Phase-2A-Migration-Report.md"
-report_path.write_text(report, encoding='utf-8')
-print(f"\n📄 Report saved: Meta/Phase-2A-Migration-Report.md")
+#!/usr/bin/env python3
+"""
+Execute Phase 2A Migration
+Migrates Testing, Firebase, System Flows, and Technical Notes
+
+The files to migrate, their destinations and metadata are listed in
+phase2a-manifest.toml; see manifest.py for the format.
+
+Usage:
+    python execute-phase2a-migration.py                 # Run from the docs checkout root
+    python execute-phase2a-migration.py --root PATH     # Run against another checkout
+    python execute-phase2a-migration.py --dry-run       # Show the plan without writing
+    python execute-phase2a-migration.py --resume        # Skip files already migrated
+    python execute-phase2a-migration.py --manifest other-manifest.toml
+
+Every migrated file is recorded in .migration-journal.jsonl in the checkout
+root; --resume skips files journaled as done whose source hasn't changed.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from datetime import datetime
+
+from frontmatter import Frontmatter, mapped_file
+from journal import JOURNAL_FILENAME, MigrationJournal, content_sha256
+from manifest import ManifestError, MigrationPlan, compile_manifest, group_icons, load_manifest
+from section_tree import SectionTree
+
+# Breadcrumb prefixes, cached per destination folder
+SECTION_TREE = SectionTree()
+
+DEFAULT_MANIFEST = Path(__file__).with_name('phase2a-manifest.toml')
+
+def add_frontmatter(content, metadata):
+    """Add YAML frontmatter if not present"""
+    if content.startswith('---\n'):
+        return content
+
+    return Frontmatter.from_dict(metadata).render() + "\n" + content
+
+def migrate_file(base_dir, source_rel, dest_rel, metadata, migrations, journal=None):
+    """
+    Migrate a single file with frontmatter (destination folder must exist).
+    The source is mapped and only its first line and frontmatter are read;
+    the body goes out as an untouched slice after the new header.
+    """
+    source = base_dir / source_rel
+    dest = base_dir / dest_rel
+
+    if not source.exists():
+        print(f"⚠️  Source not found: {source_rel}")
+        return False
+
+    try:
+        source_stat = os.stat(source)
+        with mapped_file(source) as buf, memoryview(buf) as view:
+            # Title from the first line
+            first_end = buf.find(b'\n')
+            first_line = bytes(view[:first_end if first_end != -1 else len(buf)]).decode('utf-8')
+            title = first_line.replace('# ', '').strip()
+
+            # Build breadcrumb based on destination
+            breadcrumb = SECTION_TREE.breadcrumb(dest_rel, title) + "\n\n---\n\n"
+
+            # Insert breadcrumb after the frontmatter: the text up to the
+            # second '---\n' becomes the header, the rest is the body
+            if buf[:4] == b'---\n':
+                close = buf.find(b'---\n', 4)
+                if close == -1:
+                    header, body_start = b'', 0
+                else:
+                    header = bytes(view[:close + 4]) + b'\n' + breadcrumb.encode('utf-8')
+                    body_start = close + 4
+            else:
+                # Add frontmatter; its closing '---\n' ends the split
+                frontmatter = add_frontmatter('', metadata)
+                head = frontmatter.split('---\n', 2)
+                header = f"---\n{head[1]}---\n\n{breadcrumb}{head[2]}".encode('utf-8')
+                body_start = 0
+
+            # Write to destination
+            with view[body_start:] as body:
+                with open(dest, 'wb') as f:
+                    f.writelines([header, body])
+                if journal is not None:
+                    journal.record(base_dir, source_rel, dest_rel, content_sha256(view),
+                                   content_sha256(header, body), source_stat)
+
+        migrations.append(f"✅ {source_rel} → {dest_rel}")
+        print(f"✅ Migrated: {source_rel}")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error migrating {source_rel}: {e}")
+        return False
+
+def print_plan(plan: MigrationPlan):
+    """Show what a run would do, grouped by destination folder."""
+    for dest_dir, entries in plan.by_dir.items():
+        print(f"📁 {dest_dir or '.'}/ ({len(entries)} files)")
+        for entry in entries:
+            print(f"   {entry.source} → {entry.dest}")
+    print()
+
+def generate_report(plan: MigrationPlan, migrations) -> str:
+    """Markdown report of a run."""
+    report = f"""# Phase 2A Migration Report
+
+**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Phase:** 2A - Quick Wins
+**Files Migrated:** {len(migrations)}
+
+---
+
+## Migration Summary
+
+### Categories Migrated
+
+"""
+    for number, (name, entries) in enumerate(plan.groups.items(), start=1):
+        dest_dirs = sorted({entry.dest.rsplit('/', 1)[0] for entry in entries})
+        noun = "file" if len(entries) == 1 else "files"
+        report += f"{number}. **{name}** ({len(entries)} {noun}) → " + ", ".join(f"`{d}/`" for d in dest_dirs) + "\n"
+
+    report += f"""
+**Total:** {len(plan.entries)} files
+
+---
+
+## Migrations Performed
+
+"""
+
+    for migration in migrations:
+        report += f"{migration}\n"
+
+    report += f"""
+
+---
+
+## Changes Applied
+
+### Added to Each File:
+1. **YAML Frontmatter** - Metadata including title, description, category, audience, tags
+2. **Breadcrumb Navigation** - Path from home to current document
+3. **Status Indicators** - Document status and last updated date
+4. **Related Documentation** - Cross-reference sections (where applicable)
+
+### Directory Structure:
+"""
+    for dest_dir, entries in sorted(plan.by_dir.items()):
+        report += f"- `{dest_dir}/` - {len(entries)} docs\n"
+
+    report += f"""
+---
+
+## Next Steps (Phase 2B)
+
+1. Migrate Architecture documentation
+2. Migrate Project Management content
+3. Migrate Contributing guides
+4. Update cross-references
+
+---
+
+*Generated by Phase 2A Migration Script*
+"""
+    return report
+
+def parse_args(argv=None):
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Execute the Phase 2A documentation migration.")
+    parser.add_argument(
+        '--root', type=Path, default=Path.cwd(), metavar='PATH',
+        help="docs checkout root (default: current directory)"
+    )
+    parser.add_argument(
+        '--manifest', type=Path, default=DEFAULT_MANIFEST, metavar='PATH',
+        help=f"migration manifest (default: {DEFAULT_MANIFEST.name})"
+    )
+    parser.add_argument(
+        '--dry-run', action='store_true',
+        help="show the compiled plan without writing anything"
+    )
+    parser.add_argument(
+        '--resume', action='store_true',
+        help="skip files the journal records as migrated, if their source is unchanged"
+    )
+    parser.add_argument(
+        '--journal', type=Path, default=None, metavar='PATH',
+        help=f"migration journal (default: {JOURNAL_FILENAME} in the checkout root)"
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    base_dir = args.root.resolve()
+
+    try:
+        manifest = load_manifest(args.manifest)
+        plan = compile_manifest(manifest, base_dir)
+    except ManifestError as e:
+        print(f"❌ {e}")
+        return 1
+    icons = group_icons(manifest)
+
+    print("=" * 70)
+    print("PHASE 2A MIGRATION" + (" (DRY RUN)" if args.dry_run else ""))
+    print("=" * 70)
+    print(f"Checkout: {base_dir}")
+    print(f"Plan: {len(plan.entries)} files into {len(plan.by_dir)} folders")
+    if plan.duplicates:
+        print(f"Skipped {plan.duplicates} duplicate manifest entries")
+    for source in plan.missing:
+        print(f"⚠️  Source not found: {source}")
+    for conflict in plan.conflicts:
+        print(f"❌ Destination claimed twice: {conflict}")
+    print()
+
+    if plan.conflicts:
+        return 1
+
+    if args.dry_run:
+        print_plan(plan)
+        return 0
+
+    # Track migrations
+    migrations = []
+    skipped = 0
+
+    for dest_dir, entries in plan.by_dir.items():
+        (base_dir / dest_dir).mkdir(parents=True, exist_ok=True)
+
+    journal_path = args.journal if args.journal is not None else base_dir / JOURNAL_FILENAME
+    with MigrationJournal(journal_path) as journal:
+        if args.resume:
+            print(f"Resuming: {len(journal)} steps in {journal_path.name}")
+            print()
+        for name, entries in plan.groups.items():
+            print(f"{icons.get(name, '')} Migrating {name}...".strip())
+            print("-" * 70)
+            for entry in entries:
+                if args.resume and journal.is_done(base_dir, entry.source, entry.dest):
+                    skipped += 1
+                    print(f"⏭️  Already migrated: {entry.source}")
+                    continue
+                migrate_file(base_dir, entry.source, entry.dest, entry.metadata, migrations, journal)
+            print()
+
+    # =============================================================================
+    # GENERATE REPORT
+    # =============================================================================
+    print("=" * 70)
+    print(f"MIGRATION COMPLETE: {len(migrations)} files migrated" + (f", {skipped} already done" if skipped else ""))
+    print("=" * 70)
+
+    report_path = base_dir / "Meta/Phase-2A-Migration-Report.md"
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(generate_report(plan, migrations), encoding='utf-8')
+    print(f"\n📄 Report saved: Meta/Phase-2A-Migration-Report.md")
+
+    failed = len(plan.entries) - len(migrations) - skipped
+    return 0 if failed == 0 and not plan.missing else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Shared YAML frontmatter model for the migration and validation scripts.
+
+Frontmatter is kept as raw text until a field is read. The first access
+indexes the top-level keys in one pass; a value is only parsed when that
+field is asked for. Emitting an unmodified Frontmatter returns the original
+text, and edited fields are re-rendered in place so field order is kept.
+
+Only the YAML subset used by the docs is understood: scalars (plain or
+quoted), inline [a, b] lists, block lists of scalars or of small maps
+(related_docs), and nested maps.
+
+frontmatter_offsets() finds the frontmatter by offset in a str, bytes or
+mmap without splitting the document, so large pages can be spliced as
+header + untouched body slice.
+"""
+
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Top-level "key: value" lines
+FIELD_PATTERN = re.compile(r'^([A-Za-z_][\w-]*):(.*)$')
+
+# Field order for new-style frontmatter written by the migrators
+FIELD_ORDER = [
+    'title', 'description', 'category', 'audience',
+    'difficulty', 'status', 'last_updated', 'tags', 'related_docs'
+]
+
+def _unquote(text: str) -> str:
+    """Strip YAML quotes from a scalar."""
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] == '"':
+        return text[1:-1].replace('\\"', '"').replace('\\\\', '\\')
+    if len(text) >= 2 and text[0] == text[-1] == "'":
+        return text[1:-1].replace("''", "'")
+    return text
+
+def _quote(value) -> str:
+    """Render a scalar as a double-quoted YAML string."""
+    text = str(value).replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{text}"'
+
+def _parse_block(lines: List[str]):
+    """Parse the indented lines under a key into a list or a dict."""
+    items = [line for line in lines if line.strip()]
+    if not items:
+        return None
+
+    if items[0].lstrip().startswith('-'):
+        result = []
+        current: Optional[Dict] = None
+        for line in items:
+            stripped = line.strip()
+            if stripped.startswith('-'):
+                item = stripped[1:].strip()
+                match = FIELD_PATTERN.match(item)
+                if match and not item.startswith(('"', "'")):
+                    current = {match.group(1): _unquote(match.group(2))}
+                    result.append(current)
+                else:
+                    current = None
+                    result.append(_unquote(item))
+            elif current is not None:
+                match = FIELD_PATTERN.match(stripped)
+                if match:
+                    current[match.group(1)] = _unquote(match.group(2))
+        return result
+
+    result = {}
+    for line in items:
+        match = FIELD_PATTERN.match(line.strip())
+        if match:
+            result[match.group(1)] = _unquote(match.group(2))
+    return result
+
+def _parse_inline(text: str):
+    """Parse a value written on the key's own line."""
+    if text.startswith('[') and text.endswith(']'):
+        inner = text[1:-1].strip()
+        return [_unquote(item) for item in inner.split(',')] if inner else []
+    return _unquote(text)
+
+class Frontmatter:
+    """Frontmatter fields with lazy parsing and order-preserving emit."""
+    __slots__ = ('_raw', '_index', '_values', '_dirty', '_deleted')
+
+    def __init__(self, raw: str = ''):
+        self._raw = raw
+        # key -> (inline text, block lines); built on first field access
+        self._index: Optional[Dict[str, Tuple[str, List[str]]]] = None
+        # key -> parsed or assigned value
+        self._values: Dict[str, object] = {}
+        # Keys assigned since parsing; re-rendered on emit
+        self._dirty: set = set()
+        self._deleted = False
+
+    @classmethod
+    def from_dict(cls, metadata: Dict, field_order: Optional[Iterable[str]] = None) -> 'Frontmatter':
+        """
+        Build frontmatter from a metadata dict.
+        With field_order, only those fields are kept, in that order.
+        Empty lists are dropped.
+        """
+        frontmatter = cls()
+        frontmatter._index = {}
+        keys = field_order if field_order is not None else metadata.keys()
+        for key in keys:
+            if key not in metadata:
+                continue
+            value = metadata[key]
+            if isinstance(value, list) and not value:
+                continue
+            frontmatter[key] = value
+        return frontmatter
+
+    def _build_index(self) -> Dict[str, Tuple[str, List[str]]]:
+        if self._index is None:
+            index: Dict[str, Tuple[str, List[str]]] = {}
+            block: List[str] = []
+            for line in self._raw.split('\n'):
+                match = FIELD_PATTERN.match(line)
+                if match:
+                    block = []
+                    index[match.group(1)] = (match.group(2).strip(), block)
+                elif index:
+                    block.append(line)
+            self._index = index
+        return self._index
+
+    def keys(self) -> List[str]:
+        return list(self._build_index().keys())
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._build_index()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def is_block(self, key: str) -> bool:
+        """True if key is present with nothing after the colon (e.g. a block list)."""
+        entry = self._build_index().get(key)
+        return entry is not None and key not in self._dirty and not entry[0]
+
+    def has_value(self, key: str) -> bool:
+        """True if key is present with a non-empty inline value or block."""
+        if key in self._values:
+            return self._values[key] not in (None, '', [], {})
+        entry = self._build_index().get(key)
+        if entry is None:
+            return False
+        inline, block = entry
+        return bool(inline) or any(line.strip() for line in block)
+
+    def get(self, key: str, default=None):
+        """Typed value: str for scalars, list or dict for blocks."""
+        if key in self._values:
+            return self._values[key]
+        entry = self._build_index().get(key)
+        if entry is None:
+            return default
+
+        inline, block = entry
+        if inline and inline not in ('|', '>', '|-', '>-'):
+            value = _parse_inline(inline)
+        elif inline:
+            # Literal/folded block scalar
+            value = '\n'.join(line.strip() for line in block).strip()
+        else:
+            value = _parse_block(block)
+
+        self._values[key] = value
+        return value
+
+    def get_str(self, key: str, default: str = '') -> str:
+        """Scalar value, or default if missing or not a scalar."""
+        value = self.get(key)
+        return value if isinstance(value, str) else default
+
+    def get_list(self, key: str) -> List:
+        """List value; a scalar becomes a one-item list."""
+        value = self.get(key)
+        if value is None or value == '':
+            return []
+        if isinstance(value, list):
+            return value
+        return [value]
+
+    def __getitem__(self, key: str):
+        if key not in self:
+            raise KeyError(key)
+        return self.get(key)
+
+    def __setitem__(self, key: str, value):
+        index = self._build_index()
+        if key not in index:
+            index[key] = ('', [])
+        self._values[key] = value
+        self._dirty.add(key)
+
+    def __delitem__(self, key: str):
+        del self._build_index()[key]
+        self._values.pop(key, None)
+        self._dirty.discard(key)
+        self._deleted = True
+
+    def has_wikilinks(self) -> bool:
+        """True if any field contains an Obsidian [[wikilink]]."""
+        return '[[' in self.emit()
+
+    def emit(self) -> str:
+        """Frontmatter text without delimiters; unmodified fields are emitted verbatim."""
+        if not self._dirty and not self._deleted:
+            return self._raw
+
+        lines: List[str] = []
+        for key, (inline, block) in self._build_index().items():
+            if key in self._dirty:
+                lines.extend(_render_field(key, self._values[key]))
+            else:
+                lines.append(f"{key}: {inline}" if inline else f"{key}:")
+                lines.extend(block)
+        # Drop trailing blank lines left over from the original block
+        while lines and not lines[-1].strip():
+            lines.pop()
+        return '\n'.join(lines)
+
+    def render(self) -> str:
+        """Frontmatter with --- delimiters, ending in a newline."""
+        body = self.emit()
+        return f"---\n{body}\n---\n" if body else "---\n---\n"
+
+def _render_field(key: str, value) -> List[str]:
+    if isinstance(value, list):
+        if not value:
+            return []
+        lines = [f"{key}:"]
+        for item in value:
+            if isinstance(item, dict):
+                # related_docs style entries
+                lines.append(f"  - title: {_quote(item.get('title', ''))}")
+                lines.append(f"    path: {_quote(item.get('path', ''))}")
+                if 'relationship' in item:
+                    lines.append(f"    relationship: {_quote(item['relationship'])}")
+            else:
+                lines.append(f"  - {_quote(item)}")
+        return lines
+    if isinstance(value, dict):
+        lines = [f"{key}:"]
+        for subkey, subvalue in value.items():
+            lines.append(f"  {subkey}: {_quote(subvalue)}")
+        return lines
+    return [f"{key}: {_quote(value)}"]
+
+# Longest line still compared against a delimiter; longer lines are skipped
+# without being copied out of the buffer
+MAX_DELIMITER_LINE = 64
+
+def frontmatter_offsets(buf, delimiters: Iterable[str] = ('---',)) -> Optional[Tuple[int, int, int]]:
+    """
+    Locate frontmatter in buf (a str, bytes or mmap) without copying it.
+    Returns (raw_start, raw_end, body_start): buf[raw_start:raw_end] is the
+    text between the delimiter lines and buf[body_start:] is the body.
+    Returns None if buf doesn't open and close frontmatter.
+    """
+    newline = '\n' if isinstance(buf, str) else b'\n'
+    if not isinstance(buf, str):
+        delimiters = tuple(d.encode('utf-8') for d in delimiters)
+
+    first_end = buf.find(newline)
+    if first_end == -1 or first_end > MAX_DELIMITER_LINE:
+        return None
+    delimiter = buf[:first_end].strip()
+    if delimiter not in delimiters:
+        return None
+
+    size = len(buf)
+    start = first_end + 1
+    pos = start
+    while pos <= size:
+        end = buf.find(newline, pos)
+        line_end = size if end == -1 else end
+        if line_end - pos <= MAX_DELIMITER_LINE and buf[pos:line_end].strip() == delimiter:
+            raw_end = pos - 1 if pos > start else start
+            return start, raw_end, line_end if end == -1 else end + 1
+        if end == -1:
+            break
+        pos = end + 1
+
+    return None
+
+@contextmanager
+def mapped_file(path):
+    """
+    A file's bytes with newlines as text mode reads them, for
+    frontmatter_offsets: a read-only mmap if the file only uses LF, else a
+    copy with CRLF and CR turned into LF. Release any memoryview of it
+    before the block ends.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if mapped.find(b'\r') == -1:
+                yield mapped
+            else:
+                yield mapped[:].replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+def split_frontmatter(content: str, delimiters: Iterable[str] = ('---',)) -> Tuple[Optional[Frontmatter], str]:
+    """
+    Split markdown into (frontmatter, body).
+    Returns (None, content) if the content doesn't open and close frontmatter.
+    """
+    offsets = frontmatter_offsets(content, delimiters)
+    if offsets is None:
+        return None, content
+    raw_start, raw_end, body_start = offsets
+    return Frontmatter(content[raw_start:raw_end]), content[body_start:]
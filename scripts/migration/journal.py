@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Append-only migration journal, so interrupted migrations can resume.
+
+Each completed source -> dest step is appended as one JSON line with the
+source's size, mtime and SHA-256 and the SHA-256 of what was written.
+Lines are flushed and fsync'd every batch_size records (and on close), so
+a crash loses at most one batch, and a torn last line is ignored on load.
+
+On a rerun, is_done() answers from an in-memory dict: a step is finished
+if it was journaled, the source still has the recorded size and mtime,
+and the destination still exists. Nothing is re-read or re-hashed.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+JOURNAL_FILENAME = '.migration-journal.jsonl'
+
+def content_sha256(*parts) -> str:
+    """
+    SHA-256 of the concatenated parts: str (as UTF-8), bytes, or memoryviews,
+    so spliced output can be hashed without joining it.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8') if isinstance(part, str) else part)
+    return digest.hexdigest()
+
+class MigrationJournal:
+    """Completed migration steps, loaded from and appended to a JSON lines file."""
+    def __init__(self, path: Path, batch_size: int = 32):
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.entries: Dict[Tuple[str, str], Dict] = {}
+        self.pending = 0
+        self._file = None
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # torn write from an interrupted run
+                    self.entries[(entry['source'], entry['dest'])] = entry
+        except OSError:
+            pass
+
+    def __enter__(self) -> 'MigrationJournal':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def is_done(self, base_dir: Path, source: str, dest: str) -> bool:
+        """True if source -> dest was journaled and neither side changed since."""
+        entry = self.entries.get((source, dest))
+        if entry is None:
+            return False
+        try:
+            stat = os.stat(base_dir / source)
+        except OSError:
+            return False
+        return (stat.st_size == entry['source_size']
+                and stat.st_mtime_ns == entry['source_mtime_ns']
+                and (base_dir / dest).exists())
+
+    def record(self, base_dir: Path, source: str, dest: str,
+               source_sha256: str, dest_sha256: str, stat: Optional[os.stat_result] = None):
+        """
+        Append a completed step, with content_sha256() hashes of what was
+        read and written. stat is the source's stat from when it was read;
+        it is taken now if not given.
+        """
+        if stat is None:
+            stat = os.stat(base_dir / source)
+        entry = {
+            'source': source,
+            'dest': dest,
+            'source_size': stat.st_size,
+            'source_mtime_ns': stat.st_mtime_ns,
+            'source_sha256': source_sha256,
+            'dest_sha256': dest_sha256,
+            'time': datetime.now().isoformat(timespec='seconds'),
+        }
+        self.entries[(source, dest)] = entry
+
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+            if self._ends_mid_line():
+                self._file.write('\n')
+        self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self.pending += 1
+        if self.pending >= self.batch_size:
+            self.sync()
+
+    def _ends_mid_line(self) -> bool:
+        """True if the file ends in a torn line, which the next record must not extend."""
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return False
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) != b'\n'
+        except OSError:
+            return False
+
+    def sync(self):
+        """Flush and fsync records written so far."""
+        if self._file is not None and self.pending:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.pending = 0
+
+    def close(self):
+        self.sync()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Whole-vault link graph for the docs vault.
+
+Every wikilink, markdown link and breadcrumb link becomes an edge from the
+page it is written in to the page it points at. Links to a folder point at
+the folder's index.md, links to images and other assets are checked but
+not added as edges, and links that don't resolve are kept as broken.
+
+The graph answers three questions:
+    broken links  - targets that don't exist in the vault
+    orphan pages  - pages no other page links to
+    cycles        - groups of pages that reach each other through links
+
+Breadcrumbs always point up the tree, so they count as inbound links for
+orphan detection but are left out of cycle detection; otherwise every
+index page would form a cycle with its children.
+
+update_file() re-parses a single file and re-links only what it touches,
+and LinkCache keeps parsed links between runs, so a check on save or in
+pre-commit only reads the files that changed.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from links import Link, LinkIndex, VaultPaths, iter_links
+
+CACHE_VERSION = 1
+CACHE_FILENAME = '.link-cache.json'
+
+class LinkCache:
+    """
+    Parsed links per file, keyed on size and mtime, stored as JSON.
+    Only the links as written are cached; resolution is redone on load
+    because it depends on the rest of the vault.
+    """
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        self.seen: Dict[str, Dict] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == CACHE_VERSION:
+            self.entries = data.get('files', {})
+
+    def links_for(self, root: Path, source: str) -> List[Link]:
+        """Links in source, from the cache if the file is unchanged."""
+        try:
+            stat = os.stat(root / source)
+        except OSError:
+            return []
+
+        entry = self.entries.get(source)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            self.hits += 1
+            links = [Link.from_list(item) for item in entry['links']]
+        else:
+            self.misses += 1
+            try:
+                with open(root / source, 'r', encoding='utf-8', newline='') as f:
+                    links = list(iter_links(f))
+            except (OSError, UnicodeDecodeError):
+                links = []
+            entry = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                     'links': [link.to_list() for link in links]}
+        self.seen[source] = entry
+        return links
+
+    def save(self):
+        """Write entries for the files seen this run."""
+        data = {'version': CACHE_VERSION, 'files': self.seen}
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+class LinkGraph:
+    """Page-to-page adjacency built on a LinkIndex."""
+    def __init__(self, index: LinkIndex):
+        self.index = index
+        # source page -> pages it links to (wiki and markdown links)
+        self.edges: Dict[str, Set[str]] = {}
+        # source page -> pages named in its breadcrumb
+        self.breadcrumbs: Dict[str, Set[str]] = {}
+        # page -> pages linking to it (any kind)
+        self.inbound: Dict[str, Set[str]] = {}
+        # source page -> links that don't resolve
+        self.broken: Dict[str, List[Link]] = {}
+        for source in index.by_source:
+            self._link_source(source)
+
+    @classmethod
+    def build(cls, root: Path, cache: Optional[LinkCache] = None) -> 'LinkGraph':
+        """Scan the vault once and build the graph, reusing cached parses."""
+        paths = VaultPaths.scan(root)
+        index = LinkIndex(root, paths)
+        for source in sorted(paths.files):
+            index.add_file(source, cache.links_for(root, source) if cache else None)
+        return cls(index)
+
+    def page_for(self, path: str) -> Optional[str]:
+        """Page a resolved path stands for: folders map to their index.md."""
+        paths = self.index.paths
+        if path in paths.files:
+            return path
+        if path == '' or path in paths.dirs:
+            index_page = f"{path}/index.md" if path else 'index.md'
+            return index_page if index_page in paths.files else None
+        return None
+
+    def _link_source(self, source: str):
+        edges: Set[str] = set()
+        breadcrumbs: Set[str] = set()
+        broken: List[Link] = []
+        for link in self.index.by_source.get(source, []):
+            path = link.resolved_path()
+            if path is None:
+                broken.append(link)
+                continue
+            page = self.page_for(path)
+            if page is None or page == source:
+                continue
+            (breadcrumbs if link.kind == 'breadcrumb' else edges).add(page)
+
+        self.edges[source] = edges
+        self.breadcrumbs[source] = breadcrumbs
+        for page in edges | breadcrumbs:
+            self.inbound.setdefault(page, set()).add(source)
+        if broken:
+            self.broken[source] = broken
+        else:
+            self.broken.pop(source, None)
+
+    def _unlink_source(self, source: str):
+        for page in self.edges.pop(source, set()) | self.breadcrumbs.pop(source, set()):
+            sources = self.inbound.get(page)
+            if sources:
+                sources.discard(source)
+                if not sources:
+                    del self.inbound[page]
+        self.broken.pop(source, None)
+
+    def update_file(self, source: str):
+        """
+        Bring the graph up to date after source was saved, created or deleted.
+        Only source is re-read. If a page appeared or disappeared, links in
+        other files that could change meaning are re-resolved in memory:
+        broken links, links to the page, and bare links sharing its name.
+        A folder's index.md re-links every page, still without reading any.
+        """
+        paths = self.index.paths
+        exists = (self.index.root / source).is_file()
+        created = exists and source not in paths.files
+        deleted = not exists and source in paths.files
+
+        affected: Set[str] = set()
+        if created or deleted:
+            stem = source.rsplit('/', 1)[-1][:-len('.md')]
+            affected.update(self.broken)
+            affected.update(self.index.links_to([source] + paths.stems.get(stem, [])))
+            if created:
+                paths.add_file(source)
+            else:
+                paths.remove_file(source)
+
+        self._unlink_source(source)
+        if exists:
+            self.index.add_file(source)
+            self._link_source(source)
+        else:
+            self.index.remove_file(source)
+
+        for other in affected - {source}:
+            self._unlink_source(other)
+            self.index.reresolve(other)
+            self._link_source(other)
+
+        if (created or deleted) and source.rsplit('/', 1)[-1] == 'index.md':
+            # Folder links now stand for a different page; resolution is
+            # unchanged, so re-linking needs no parsing
+            for other in list(self.edges):
+                if other != source and other not in affected:
+                    self._unlink_source(other)
+                    self._link_source(other)
+
+    def broken_links(self, sources: Optional[Iterable[str]] = None) -> List[Tuple[str, Link]]:
+        """Broken links, optionally only those written in sources."""
+        selected = sorted(self.broken) if sources is None else sorted(s for s in sources if s in self.broken)
+        return [(source, link) for source in selected for link in self.broken[source]]
+
+    def orphans(self) -> List[str]:
+        """Pages no other page links to (the vault's root index.md excepted)."""
+        return sorted(page for page in self.index.paths.files
+                      if page != 'index.md' and not self.inbound.get(page))
+
+    def cycles(self) -> List[List[str]]:
+        """
+        Strongly connected groups of two or more pages over wiki and markdown
+        links (Tarjan's algorithm, iterative so deep vaults don't hit the
+        recursion limit).
+        """
+        order: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        groups: List[List[str]] = []
+
+        for start in sorted(self.edges):
+            if start in order:
+                continue
+            work = [(start, iter(sorted(self.edges.get(start, ()))))]
+            order[start] = low[start] = len(order)
+            stack.append(start)
+            on_stack.add(start)
+            while work:
+                node, children = work[-1]
+                child = next(children, None)
+                if child is not None:
+                    if child not in order:
+                        order[child] = low[child] = len(order)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(sorted(self.edges.get(child, ())))))
+                    elif child in on_stack:
+                        low[node] = min(low[node], order[child])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == order[node]:
+                    group = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        group.append(member)
+                        if member == node:
+                            break
+                    if len(group) > 1:
+                        groups.append(sorted(group))
+
+        return sorted(groups)
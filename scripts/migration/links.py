@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Link parsing and an inverted link index for the docs vault.
+
+Wikilinks ([[Target]], [[path/to/page|Alias]], [[Page#Heading]]),
+markdown links ([text](../Folder/), [text](/Section/page.md)) and the
+links in breadcrumb lines ([Home](/) > [Section](../) > Page) are parsed
+with the line and column span of their target, so callers can rewrite a
+link in place without re-scanning the file. Links inside fenced code
+blocks and inline code are ignored; external URLs are skipped.
+
+Targets are resolved the way Quartz resolves them: a leading '/' is the
+content root, other markdown links are relative to the linking file, and
+a bare [[Name]] matches the one page with that file name anywhere.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+WIKILINK_PATTERN = re.compile(r'!?\[\[([^\]|#]*)(#[^\]|]*)?(\|[^\]]*)?\]\]')
+MARKDOWN_LINK_PATTERN = re.compile(r'!?\[[^\]]*\]\(([^)\s#?]*)([#?][^)\s]*)?(\s+"[^"]*")?\)')
+INLINE_CODE_PATTERN = re.compile(r'`[^`]*`')
+FENCE_PATTERN = re.compile(r'^\s*(```|~~~)')
+EXTERNAL_PATTERN = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*:')
+BREADCRUMB_LINE_PATTERN = re.compile(r'^\[Home\]\(/\)\s*>')
+
+class Link:
+    """A link target found in a file, with where its target text sits."""
+    __slots__ = ('kind', 'target', 'line_number', 'start', 'end', 'components')
+
+    def __init__(self, kind: str, target: str, line_number: int, start: int, end: int):
+        self.kind = kind              # 'wiki', 'markdown' or 'breadcrumb'
+        self.target = target          # target text as written (no anchor/alias)
+        self.line_number = line_number
+        self.start = start            # column span of target in the line
+        self.end = end
+        # [(component as written, resolved vault path or None)], set by resolve
+        self.components: List[Tuple[str, Optional[str]]] = []
+
+    def resolved_path(self) -> Optional[str]:
+        """
+        Vault path the link points at, or None if it doesn't resolve.
+        Links made only of '/', '.' and '..' resolve to a folder ('' is the root).
+        """
+        if not self.components:
+            return None
+        named = [path for part, path in self.components if part not in ('', '.', '..')]
+        if not named:
+            return self.components[-1][1]
+        return named[-1]
+
+    def to_list(self) -> list:
+        """Compact form for caches; components are re-resolved on load."""
+        return [self.kind, self.target, self.line_number, self.start, self.end]
+
+    @classmethod
+    def from_list(cls, data: list) -> 'Link':
+        return cls(*data)
+
+def iter_links(lines: Iterable[str]) -> Iterator[Link]:
+    """Yield every wikilink and relative/absolute markdown link in lines.
+    Markdown links on a breadcrumb line are yielded with kind 'breadcrumb'."""
+    in_fence = False
+    for line_number, line in enumerate(lines, start=1):
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence or ('[' not in line):
+            continue
+
+        # Blank out inline code, keeping column offsets
+        if '`' in line:
+            line = INLINE_CODE_PATTERN.sub(lambda m: ' ' * len(m.group(0)), line)
+
+        for match in WIKILINK_PATTERN.finditer(line):
+            target = match.group(1).strip()
+            if target:
+                yield Link('wiki', target, line_number, match.start(1), match.end(1))
+
+        kind = 'breadcrumb' if BREADCRUMB_LINE_PATTERN.match(line) else 'markdown'
+        for match in MARKDOWN_LINK_PATTERN.finditer(line):
+            target = match.group(1)
+            if target and not EXTERNAL_PATTERN.match(target):
+                yield Link(kind, target, line_number, match.start(1), match.end(1))
+
+class VaultPaths:
+    """
+    Directories and markdown files in the vault, as posix paths relative to its root.
+    assets holds any other files (images, PDFs) so links to them resolve too.
+    """
+    def __init__(self, dirs: Iterable[str], files: Iterable[str], assets: Iterable[str] = ()):
+        self.dirs: Set[str] = set(dirs)
+        self.files: Set[str] = set(files)
+        self.assets: Set[str] = set(assets)
+        # File name without .md -> paths, for bare [[Name]] links
+        self.stems: Dict[str, List[str]] = {}
+        for path in self.files:
+            self.add_stem(path)
+
+    def add_stem(self, path: str):
+        stem = path.rsplit('/', 1)[-1][:-len('.md')]
+        self.stems.setdefault(stem, []).append(path)
+
+    def add_file(self, path: str):
+        """Record a new markdown file and any folders above it."""
+        if path in self.files:
+            return
+        self.files.add(path)
+        self.add_stem(path)
+        parent = path.rsplit('/', 1)[0] if '/' in path else ''
+        while parent and parent not in self.dirs:
+            self.dirs.add(parent)
+            parent = parent.rsplit('/', 1)[0] if '/' in parent else ''
+
+    def remove_file(self, path: str):
+        """Forget a deleted markdown file (its folders are kept)."""
+        if path not in self.files:
+            return
+        self.files.discard(path)
+        stem = path.rsplit('/', 1)[-1][:-len('.md')]
+        matches = self.stems.get(stem, [])
+        if path in matches:
+            matches.remove(path)
+        if not matches:
+            self.stems.pop(stem, None)
+
+    @classmethod
+    def scan(cls, root: Path) -> 'VaultPaths':
+        dirs, files, assets = [], [], []
+        for dirpath, dirnames, filenames in os.walk(root):
+            rel = os.path.relpath(dirpath, root).replace(os.sep, '/')
+            prefix = '' if rel == '.' else rel + '/'
+            dirs.extend(prefix + d for d in dirnames)
+            for name in filenames:
+                (files if name.endswith('.md') else assets).append(prefix + name)
+        return cls(dirs, files, assets)
+
+    def _walk(self, base: str, parts: List[str]) -> List[Tuple[str, Optional[str]]]:
+        components = []
+        current: Optional[str] = base
+        for part in parts:
+            if current is None:
+                components.append((part, None))
+            elif part in ('', '.'):
+                components.append((part, current))
+            elif part == '..':
+                current = None if current == '' else current.rsplit('/', 1)[0] if '/' in current else ''
+                components.append((part, current))
+            else:
+                candidate = f"{current}/{part}" if current else part
+                if candidate in self.dirs:
+                    current = candidate
+                elif candidate + '.md' in self.files:
+                    current = candidate + '.md'
+                elif candidate in self.files or candidate in self.assets:
+                    current = candidate
+                else:
+                    current = None
+                components.append((part, current))
+        return components
+
+    def resolve(self, link: Link, source: str) -> List[Tuple[str, Optional[str]]]:
+        """Resolve each '/'-separated component of link's target from source."""
+        target = link.target if link.kind == 'wiki' else unquote(link.target)
+        source_dir = source.rsplit('/', 1)[0] if '/' in source else ''
+
+        if target.startswith('/'):
+            return self._walk('', target[1:].split('/'))
+
+        parts = target.split('/')
+        if link.kind == 'wiki' and len(parts) == 1:
+            # Bare [[Name]]: the unique page with that name
+            name = target[:-len('.md')] if target.endswith('.md') else target
+            matches = self.stems.get(name, [])
+            return [(target, matches[0] if len(matches) == 1 else None)]
+
+        components = self._walk(source_dir, parts)
+        if link.kind == 'wiki' and components[-1][1] is None and not target.startswith('.'):
+            # Wikilink paths may also be written from the vault root
+            from_root = self._walk('', parts)
+            if from_root[-1][1] is not None:
+                return from_root
+        return components
+
+class LinkIndex:
+    """
+    Inverted index from vault path to the links that name it.
+    Every path component a link spells out (folders as well as the final
+    page) is a key, so renaming a folder finds every link passing through
+    it without re-reading the vault.
+    """
+    def __init__(self, root: Path, paths: VaultPaths):
+        self.root = root
+        self.paths = paths
+        self.by_source: Dict[str, List[Link]] = {}
+        self.by_target: Dict[str, List[Tuple[str, Link]]] = {}
+
+    @classmethod
+    def build(cls, root: Path, paths: Optional[VaultPaths] = None) -> 'LinkIndex':
+        """Index every markdown file under root in one scan."""
+        index = cls(root, paths if paths is not None else VaultPaths.scan(root))
+        for source in sorted(index.paths.files):
+            index.add_file(source)
+        return index
+
+    def add_file(self, source: str, links: Optional[List[Link]] = None):
+        """
+        Index source's links, replacing any previous entries.
+        The file is parsed unless already-parsed links are passed in.
+        """
+        self.remove_file(source)
+        if links is None:
+            try:
+                with open(self.root / source, 'r', encoding='utf-8', newline='') as f:
+                    links = list(iter_links(f))
+            except (OSError, UnicodeDecodeError):
+                links = []
+
+        for link in links:
+            link.components = self.paths.resolve(link, source)
+            for part, path in link.components:
+                if path is not None and part not in ('', '.', '..'):
+                    self.by_target.setdefault(path, []).append((source, link))
+        self.by_source[source] = links
+
+    def remove_file(self, source: str):
+        """Drop source's links from the index."""
+        for link in self.by_source.pop(source, []):
+            for part, path in link.components:
+                refs = self.by_target.get(path)
+                if refs:
+                    refs[:] = [ref for ref in refs if ref[1] is not link]
+                    if not refs:
+                        del self.by_target[path]
+
+    def reresolve(self, source: str):
+        """Resolve source's links again after the vault's paths changed, without re-reading it."""
+        links = self.by_source.get(source)
+        if links is not None:
+            self.add_file(source, links)
+
+    def links_to(self, paths: Iterable[str]) -> Dict[str, List[Link]]:
+        """Links naming any of paths, grouped by source file (each link once)."""
+        found: Dict[str, Dict[int, Link]] = {}
+        for path in paths:
+            for source, link in self.by_target.get(path, []):
+                found.setdefault(source, {})[id(link)] = link
+        return {source: list(links.values()) for source, links in found.items()}
+
+def rewrite_target(link: Link, renamed: Dict[str, str]) -> str:
+    """
+    Link target text with renamed components swapped for their new names.
+    renamed maps vault path -> new file or folder name. The link keeps its
+    style: relative stays relative, and '.md' is only written if it was.
+    """
+    parts = []
+    for part, path in link.components:
+        new_name = renamed.get(path) if path is not None and part not in ('', '.', '..') else None
+        if new_name is None:
+            parts.append(part)
+        elif new_name.endswith('.md') and not part.endswith('.md'):
+            parts.append(new_name[:-len('.md')])
+        else:
+            parts.append(new_name)
+    target = '/'.join(parts)
+    return '/' + target if link.target.startswith('/') else target
+
+def apply_rewrites(path: Path, rewrites: List[Tuple[Link, str]]):
+    """Replace link targets in one file, right to left within each line."""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        lines = f.readlines()
+
+    for link, new_target in sorted(rewrites, key=lambda r: (r[0].line_number, r[0].start), reverse=True):
+        i = link.line_number - 1
+        lines[i] = lines[i][:link.start] + new_target + lines[i][link.end:]
+
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.writelines(lines)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Declarative migration manifests and the plans compiled from them.
+
+A manifest is a TOML file listing groups of source files, where each group
+sends its files to a destination pattern with shared metadata:
+
+    [defaults]
+    category = "development"
+    status = "active"
+
+    [[groups]]
+    name = "Testing Documentation"
+    dest = "Development/Testing/{filename}"
+    tags = ["testing", "quality"]          # any other key is metadata
+
+    [groups.sources]
+    "Testing/Coverage-Guide.md" = "test coverage guidelines"    # description
+    "Testing/Archive/*.md" = { status = "archived" }           # glob + overrides
+
+Destination patterns may use {filename} (with extension), {stem} and
+{parent} (the source's folder). Metadata is layered defaults < group <
+source, and a missing title is derived from the file name.
+
+compile_manifest() turns a manifest into a MigrationPlan: globs are
+resolved against a single scan of the checkout, duplicate entries are
+dropped, destination clashes are reported, and entries are grouped by
+destination folder so each folder is created once. All paths are
+relative to the checkout root, so a plan can run from any checkout.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib
+
+from frontmatter import FIELD_ORDER
+from tree_walk import GLOB_CHARS, glob_base, glob_to_regex
+
+class ManifestError(Exception):
+    """Raised when a manifest can't be read or compiled."""
+
+class PlanEntry:
+    """One file to migrate."""
+    __slots__ = ('source', 'dest', 'metadata', 'group')
+
+    def __init__(self, source: str, dest: str, metadata: Dict, group: str):
+        self.source = source
+        self.dest = dest
+        self.metadata = metadata
+        self.group = group
+
+    def as_tuple(self) -> Tuple[str, str, Dict]:
+        """(source, dest, metadata), as ContentMigrator.migrate_batch takes."""
+        return self.source, self.dest, self.metadata
+
+class MigrationPlan:
+    """Compiled manifest: entries grouped by destination folder."""
+    def __init__(self):
+        self.entries: List[PlanEntry] = []
+        self.by_dir: Dict[str, List[PlanEntry]] = {}
+        # group name -> entries, in manifest order
+        self.groups: Dict[str, List[PlanEntry]] = {}
+        # Literal sources that don't exist, and globs that matched nothing
+        self.missing: List[str] = []
+        self.duplicates = 0
+        self.conflicts: List[str] = []
+
+    def add(self, entry: PlanEntry):
+        self.entries.append(entry)
+        dest_dir = entry.dest.rsplit('/', 1)[0] if '/' in entry.dest else ''
+        self.by_dir.setdefault(dest_dir, []).append(entry)
+        self.groups.setdefault(entry.group, []).append(entry)
+
+def load_manifest(path: Path) -> Dict:
+    """Read a TOML manifest."""
+    try:
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    except OSError as e:
+        raise ManifestError(f"Could not read manifest {path}: {e}") from e
+    except tomllib.TOMLDecodeError as e:
+        raise ManifestError(f"Invalid manifest {path}: {e}") from e
+
+def scan_files(root: Path, bases: Iterable[str]) -> List[str]:
+    """
+    Every file under the given base folders, as posix paths relative to
+    root, from one walk of root that only descends towards a base.
+    """
+    bases = set(bases)
+    if not bases:
+        return []
+    found: List[str] = []
+    whole_tree = '' in bases
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel = os.path.relpath(dirpath, root).replace(os.sep, '/')
+        rel = '' if rel == '.' else rel
+        inside = whole_tree or any(rel == b or rel.startswith(b + '/') for b in bases)
+        if inside:
+            prefix = rel + '/' if rel else ''
+            found.extend(prefix + name for name in filenames)
+        else:
+            # Only descend into folders on the way to a base
+            kept = []
+            for d in dirnames:
+                child = f"{rel}/{d}" if rel else d
+                if any(b == child or b.startswith(child + '/') for b in bases):
+                    kept.append(d)
+            dirnames[:] = kept
+        dirnames.sort()
+    return sorted(found)
+
+def _title_from(filename: str) -> str:
+    return filename.replace('-', ' ').replace('.md', '')
+
+def _expand_dest(pattern: str, source: str) -> str:
+    parent, _, filename = source.rpartition('/')
+    stem = filename[:-len('.md')] if filename.endswith('.md') else filename
+    try:
+        return pattern.format(filename=filename, stem=stem, parent=parent)
+    except (KeyError, IndexError) as e:
+        raise ManifestError(f"Unknown placeholder in destination '{pattern}': {e}") from e
+
+def compile_manifest(manifest: Dict, root: Path) -> MigrationPlan:
+    """Compile a loaded manifest against the checkout at root."""
+    defaults = manifest.get('defaults', {})
+    groups = manifest.get('groups', [])
+    if not groups:
+        raise ManifestError("Manifest has no [[groups]]")
+
+    # Resolve every glob against a single scan
+    patterns: Dict[str, re.Pattern] = {}
+    for group in groups:
+        for source in group.get('sources', {}):
+            if GLOB_CHARS.search(source):
+                patterns[source] = glob_to_regex(source)
+    scanned = scan_files(root, {glob_base(p) for p in patterns}) if patterns else []
+
+    plan = MigrationPlan()
+    seen: Set[Tuple[str, str]] = set()
+    dest_sources: Dict[str, str] = {}
+
+    for position, group in enumerate(groups, start=1):
+        name = group.get('name', f"Group {position}")
+        dest_pattern = group.get('dest')
+        if not dest_pattern:
+            raise ManifestError(f"Group '{name}' has no dest")
+        group_metadata = {key: value for key, value in group.items()
+                          if key not in ('name', 'dest', 'sources', 'icon')}
+
+        for source_pattern, spec in group.get('sources', {}).items():
+            if isinstance(spec, str):
+                overrides = {'description': spec}
+            elif isinstance(spec, dict):
+                overrides = spec
+            else:
+                raise ManifestError(f"Source '{source_pattern}' in group '{name}' must be a string or table")
+
+            if source_pattern in patterns:
+                regex = patterns[source_pattern]
+                sources = [path for path in scanned if regex.match(path)]
+            else:
+                sources = [source_pattern] if (root / source_pattern).is_file() else []
+            if not sources:
+                plan.missing.append(source_pattern)
+                continue
+
+            for source in sources:
+                dest = _expand_dest(dest_pattern, source)
+                if (source, dest) in seen:
+                    plan.duplicates += 1
+                    continue
+                if dest in dest_sources:
+                    plan.conflicts.append(f"{dest} <- {dest_sources[dest]}, {source}")
+                    continue
+                seen.add((source, dest))
+                dest_sources[dest] = source
+
+                merged = {'title': _title_from(source.rsplit('/', 1)[-1])}
+                merged.update(defaults)
+                merged.update(group_metadata)
+                merged.update(overrides)
+                # Standard fields first, in FIELD_ORDER, then any extras
+                metadata = {key: merged[key] for key in FIELD_ORDER if key in merged}
+                metadata.update(merged)
+                plan.add(PlanEntry(source, dest, metadata, name))
+
+    return plan
+
+def group_icons(manifest: Dict) -> Dict[str, str]:
+    """Group name -> optional icon for progress output."""
+    return {group.get('name', ''): group.get('icon', '') for group in manifest.get('groups', [])}
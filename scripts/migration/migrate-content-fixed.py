@@ -1,274 +1,573 @@
-#!/usr/bin/env python3
-"""
-FIXED Content Migration Script for Phase 2
-Addresses Agent 1 validation findings:
-- Strips old frontmatter completely
-- Fixes breadcrumb generation
-- Integrates validation
-- Tests sample before batch
-"""
-
-import os
-import re
-from pathlib import Path
-from datetime import datetime
-
-class ContentMigrator:
-    def __init__(self, base_dir):
-        self.base_dir = Path(base_dir)
-        self.migrations = []
-        self.errors = []
-
-    def strip_old_frontmatter(self, content):
-        """
-        Strip existing frontmatter completely.
-        Handles both ---...--- and +++...+++ styles.
-        """
-        lines = content.split('\n')
-
-        # Check if file starts with frontmatter delimiter
-        if not lines or lines[0].strip() not in ['---', '+++']:
-            return content
-
-        delimiter = lines[0].strip()
-
-        # Find closing delimiter
-        for i in range(1, len(lines)):
-            if lines[i].strip() == delimiter:
-                # Return content after frontmatter (skip the closing delimiter line)
-                return '\n'.join(lines[i+1:])
-
-        # If no closing delimiter found, return original content
-        return content
-
-    def generate_breadcrumb(self, dest_path, title):
-        """
-        Generate proper breadcrumb navigation.
-        Fixed: Now ends with page title, not "---"
-        """
-        parts = dest_path.split('/')
-        breadcrumb_parts = ["[Home](/)"]
-
-        # Build breadcrumb from path
-        path_so_far = ""
-        for i, part in enumerate(parts[:-1]):  # Exclude filename
-            if part in [".", ".."]:
-                continue
-
-            # Add major sections
-            if part in ["Development", "User-Guide", "Technical-Reference",
-                       "Architecture-Decisions", "Project-Management", "Meta"]:
-                path_so_far = f"/{part}/"
-                display_name = part.replace('-', ' ')
-                breadcrumb_parts.append(f"[{display_name}]({path_so_far})")
-            # Add subsections
-            elif i > 0 and path_so_far:
-                path_so_far += part + "/"
-                display_name = part.replace('-', ' ')
-                breadcrumb_parts.append(f"[{display_name}]({path_so_far})")
-
-        # Add page title at the end (FIXED: was ending with "---")
-        breadcrumb = " > ".join(breadcrumb_parts) + f" > {title}"
-
-        return breadcrumb + "\n\n---\n\n"
-
-    def create_frontmatter(self, metadata):
-        """Create new-style YAML frontmatter."""
-        frontmatter = "---\n"
-
-        # Add fields in specific order
-        field_order = [
-            'title', 'description', 'category', 'audience',
-            'difficulty', 'status', 'last_updated', 'tags', 'related_docs'
-        ]
-
-        for field in field_order:
-            if field not in metadata:
-                continue
-
-            value = metadata[field]
-
-            if isinstance(value, list):
-                if not value:  # Skip empty lists
-                    continue
-                frontmatter += f"{field}:\n"
-                for item in value:
-                    if isinstance(item, dict):
-                        # Handle related_docs structure
-                        frontmatter += f"  - title: \"{item.get('title', '')}\"\n"
-                        frontmatter += f"    path: \"{item.get('path', '')}\"\n"
-                        if 'relationship' in item:
-                            frontmatter += f"    relationship: \"{item['relationship']}\"\n"
-                    else:
-                        frontmatter += f"  - \"{item}\"\n"
-            else:
-                frontmatter += f"{field}: \"{value}\"\n"
-
-        frontmatter += "---\n\n"
-        return frontmatter
-
-    def migrate_file(self, source_path, dest_path, metadata):
-        """
-        Migrate a single file with proper frontmatter and breadcrumb.
-        Returns: (success: bool, validation_issues: list)
-        """
-        source = self.base_dir / source_path
-        dest = self.base_dir / dest_path
-
-        if not source.exists():
-            error = f"Source not found: {source_path}"
-            self.errors.append(error)
-            return False, [error]
-
-        # Read source content
-        try:
-            content = source.read_text(encoding='utf-8')
-        except Exception as e:
-            error = f"Error reading {source_path}: {e}"
-            self.errors.append(error)
-            return False, [error]
-
-        # Step 1: Strip old frontmatter
-        content_without_frontmatter = self.strip_old_frontmatter(content)
-
-        # Step 2: Create new frontmatter
-        new_frontmatter = self.create_frontmatter(metadata)
-
-        # Step 3: Generate breadcrumb
-        title = metadata.get('title', Path(source_path).stem.replace('-', ' '))
-        breadcrumb = self.generate_breadcrumb(dest_path, title)
-
-        # Step 4: Combine all parts
-        final_content = new_frontmatter + breadcrumb + content_without_frontmatter.lstrip()
-
-        # Step 5: Validate before writing
-        validation_issues = self.validate_content(final_content, dest_path)
-
-        # Step 6: Write to destination
-        try:
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            dest.write_text(final_content, encoding='utf-8')
-
-            self.migrations.append({
-                'source': source_path,
-                'dest': dest_path,
-                'status': 'success' if not validation_issues else 'success_with_warnings',
-                'validation_issues': validation_issues
-            })
-
-            status_icon = "✅" if not validation_issues else "⚠️"
-            print(f"{status_icon} Migrated: {source_path} → {dest_path}")
-
-            if validation_issues:
-                for issue in validation_issues:
-                    print(f"   └─ {issue}")
-
-            return True, validation_issues
-
-        except Exception as e:
-            error = f"Error writing {dest_path}: {e}"
-            self.errors.append(error)
-            return False, [error]
-
-    def validate_content(self, content, filepath):
-        """
-        Basic validation of migrated content.
-        Returns list of validation issues (empty if valid).
-        """
-        issues = []
-        lines = content.split('\n')
-
-        # Check frontmatter
-        if not lines[0].strip() == '---':
-            issues.append("Missing frontmatter opening")
-            return issues
-
-        # Find frontmatter closing
-        frontmatter_end = -1
-        for i in range(1, min(50, len(lines))):  # Check first 50 lines
-            if lines[i].strip() == '---':
-                frontmatter_end = i
-                break
-
-        if frontmatter_end == -1:
-            issues.append("Missing frontmatter closing")
-            return issues
-
-        # Extract frontmatter
-        frontmatter = '\n'.join(lines[1:frontmatter_end])
-
-        # Check required fields
-        required_fields = ['title:', 'description:', 'category:', 'audience:', 'status:']
-        for field in required_fields:
-            if field not in frontmatter:
-                issues.append(f"Missing required field: {field[:-1]}")
-
-        # Check for old Obsidian fields
-        old_fields = ['created:', 'related:']  # Note: 'tags:' is valid in both
-        for field in old_fields:
-            if field in frontmatter:
-                issues.append(f"Old Obsidian field found: {field[:-1]}")
-
-        # Check breadcrumb
-        breadcrumb_line_idx = frontmatter_end + 1
-        if breadcrumb_line_idx < len(lines):
-            breadcrumb = lines[breadcrumb_line_idx]
-            if '[Home](/)' in breadcrumb:
-                if breadcrumb.strip().endswith('> ---'):
-                    issues.append("Breadcrumb ends with '> ---' instead of page title")
-                if not '>' in breadcrumb:
-                    issues.append("Breadcrumb missing navigation arrows")
-            else:
-                issues.append("No breadcrumb found after frontmatter")
-
-        return issues
-
-def test_migration_on_sample():
-    """Test migration on a single sample file before batch processing."""
-    print("=" * 70)
-    print("TESTING MIGRATION ON SAMPLE FILE")
-    print("=" * 70)
-    print()
-
-    base_dir = "/mnt/c/Users/chris_3zal3ta/Documents/ArcheryApprentice-Docs"
-    migrator = ContentMigrator(base_dir)
-
-    # Test on one file
-    test_source = "Testing/Coverage-Guide.md"
-    test_dest = "Development/Testing/Coverage-Guide-TEST.md"
-    test_metadata = {
-        "title": "Test Coverage Guide",
-        "description": "Guide to understanding and improving test coverage",
-        "category": "development",
-        "audience": ["developers"],
-        "difficulty": "intermediate",
-        "status": "active",
-        "last_updated": "2025-10-29",
-        "tags": ["testing", "coverage", "quality"],
-    }
-
-    success, issues = migrator.migrate_file(test_source, test_dest, test_metadata)
-
-    if success and not issues:
-        print("\n✅ TEST PASSED - Sample file migrated correctly!")
-        print(f"   Check: {test_dest}")
-        return True
-    elif success and issues:
-        print("\n⚠️  TEST PASSED WITH WARNINGS")
-        print(f"   Issues found: {len(issues)}")
-        for issue in issues:
-            print(f"   - {issue}")
-        return True
-    else:
-        print("\n❌ TEST FAILED")
-        print(f"   Errors: {migrator.errors}")
-        return False
-
-if __name__ == "__main__":
-    print("FIXED Migration Script - Agent 1 Issues Addressed")
-    print()
-    print("Run test_migration_on_sample() to test before batch migration")
-    print()
-
-    # Uncomment to run test:
-    # test_migration_on_sample()
+#!/usr/bin/env python3
+"""
+FIXED Content Migration Script for Phase 2
+Addresses Agent 1 validation findings:
+- Strips old frontmatter completely
+- Fixes breadcrumb generation
+- Integrates validation
+- Tests sample before batch
+- Migrates whole batches in parallel, all or nothing (migrate_batch)
+- Or streams files through an asyncio pipeline for slow mounts (migrate_concurrent)
+- Optionally journals completed files so reruns skip them (journal.py)
+- Optionally times each step per file and per batch (profiling.py):
+
+      profile = Profile()
+      migrator = ContentMigrator(base_dir, profile=profile)
+      with cprofile(Path('migrate.pstats')):   # optional cProfile dump
+          migrator.migrate_batch(plan)
+      print('\n'.join(profile.lines()))
+"""
+
+import os
+import re
+import shutil
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from frontmatter import FIELD_ORDER, Frontmatter, frontmatter_offsets, mapped_file
+from journal import MigrationJournal, content_sha256
+from pipeline import DEFAULT_CONCURRENCY, run_pipeline
+from profiling import NULL_TIMER, Profile, StageTimer
+from section_tree import SectionTree
+
+# (source_path, dest_path, metadata), relative to the migrator's base_dir
+PlanEntry = Tuple[str, str, Dict]
+
+# Migrator used by transform workers; set by _init_transform_worker
+_worker_migrator = None
+
+def _init_transform_worker():
+    global _worker_migrator
+    _worker_migrator = ContentMigrator('.')
+
+def _transform_task(task):
+    """Run ContentMigrator.transform in a worker process."""
+    content, source_path, dest_path, metadata = task
+    return _worker_migrator.transform(content, source_path, dest_path, metadata)
+
+def _pipeline_transform(task):
+    """
+    Transform stage of migrate_concurrent: (entry, content, error, stat) ->
+    (entry, final_content, issues, error, stat, source_sha256). The source
+    is hashed here, off the event loop, so its content isn't carried on.
+    """
+    entry, content, error, stat = task
+    if error:
+        return entry, None, [], error, None, None
+    final_content, validation_issues = _worker_migrator.transform(content, *entry)
+    return entry, final_content, validation_issues, None, stat, content_sha256(content)
+
+class ContentMigrator:
+    def __init__(self, base_dir, journal: Optional[MigrationJournal] = None,
+                 profile: Optional[Profile] = None):
+        self.base_dir = Path(base_dir)
+        self.migrations = []
+        self.errors = []
+        # Completed steps are recorded here and skipped on reruns
+        self.journal = journal
+        self.skipped = []
+        # Per-file and per-batch step timings, if given
+        self.profile = profile
+        # Breadcrumb prefixes, cached per destination folder
+        self.sections = SectionTree()
+
+    def strip_old_frontmatter(self, content):
+        """
+        Strip existing frontmatter completely.
+        Handles both ---...--- and +++...+++ styles.
+        """
+        offsets = frontmatter_offsets(content, ('---', '+++'))
+
+        # If no opening and closing delimiter found, return original content
+        if offsets is None:
+            return content
+
+        # Return content after frontmatter (skip the closing delimiter line)
+        return content[offsets[2]:]
+
+    def body_offset(self, buf):
+        """
+        Offset in buf (bytes or mmap) where the body starts: after any old
+        frontmatter and the whitespace that strip_old_frontmatter(...).lstrip()
+        would drop.
+        """
+        offsets = frontmatter_offsets(buf, ('---', '+++'))
+        pos = 0 if offsets is None else offsets[2]
+        size = len(buf)
+        while pos < size:
+            byte = buf[pos]
+            if byte < 0x80:
+                if not chr(byte).isspace():
+                    break
+                pos += 1
+            else:
+                # One UTF-8 character; str.lstrip also drops e.g. no-break spaces
+                length = 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+                try:
+                    char = bytes(buf[pos:pos + length]).decode('utf-8')
+                except UnicodeDecodeError:
+                    break
+                if not char.isspace():
+                    break
+                pos += length
+        return pos
+
+    def generate_breadcrumb(self, dest_path, title):
+        """
+        Generate proper breadcrumb navigation (see section_tree.py).
+        Fixed: Now ends with page title, not "---"
+        """
+        return self.sections.breadcrumb(dest_path, title) + "\n\n---\n\n"
+
+    def create_frontmatter(self, metadata):
+        """Create new-style YAML frontmatter (fields in FIELD_ORDER, empty lists skipped)."""
+        return Frontmatter.from_dict(metadata, FIELD_ORDER).render() + "\n"
+
+    def migrate_file(self, source_path, dest_path, metadata):
+        """
+        Migrate a single file with proper frontmatter and breadcrumb.
+        Returns: (success: bool, validation_issues: list)
+        """
+        timer = StageTimer() if self.profile is not None else NULL_TIMER
+        result = self._migrate_file(source_path, dest_path, metadata, timer)
+        if timer.enabled:
+            self.profile.add(source_path, timer.times, timer.counts)
+        return result
+
+    def _migrate_file(self, source_path, dest_path, metadata, timer):
+        source = self.base_dir / source_path
+        dest = self.base_dir / dest_path
+
+        if self.journal is not None:
+            with timer.stage('journal check'):
+                done = self.journal.is_done(self.base_dir, source_path, dest_path)
+            if done:
+                timer.count('skipped (journaled)')
+                self.record_skip(source_path, dest_path)
+                return True, []
+
+        if not source.exists():
+            error = f"Source not found: {source_path}"
+            self.errors.append(error)
+            return False, [error]
+
+        # Steps 2, 3 and 5: new frontmatter and breadcrumb, validated
+        with timer.stage('header'):
+            header, validation_issues = self.build_header(source_path, dest_path, metadata)
+            header_bytes = header.encode('utf-8')
+
+        # Steps 1, 4 and 6: map the source, find where its body starts, and
+        # write header + body slice; the body is never decoded or copied
+        try:
+            source_stat = os.stat(source)
+            with mapped_file(source) as buf, memoryview(buf) as view:
+                with timer.stage('body offset'):
+                    body_start = self.body_offset(buf)
+                with view[body_start:] as body:
+                    with timer.stage('write'):
+                        dest.parent.mkdir(parents=True, exist_ok=True)
+                        with open(dest, 'wb') as f:
+                            f.writelines([header_bytes, body])
+                    if self.journal is not None:
+                        with timer.stage('journal'):
+                            self.journal.record(self.base_dir, source_path, dest_path, content_sha256(view),
+                                                content_sha256(header_bytes, body), source_stat)
+        except Exception as e:
+            error = f"Error migrating {source_path} → {dest_path}: {e}"
+            self.errors.append(error)
+            return False, [error]
+
+        self.record_migration(source_path, dest_path, validation_issues)
+        return True, validation_issues
+
+    def build_header(self, source_path, dest_path, metadata):
+        """
+        New frontmatter and breadcrumb for a file, validated on their own
+        (validate_content only looks at the frontmatter and breadcrumb).
+        Returns: (header: str, validation_issues: list)
+        """
+        title = metadata.get('title', Path(source_path).stem.replace('-', ' '))
+        header = self.create_frontmatter(metadata) + self.generate_breadcrumb(dest_path, title)
+        return header, self.validate_content(header, dest_path)
+
+    def transform(self, content, source_path, dest_path, metadata):
+        """
+        Build migrated content from source content. No file access, so it
+        can run in a worker process.
+        Returns: (final_content: str, validation_issues: list)
+        """
+        # Step 1: Strip old frontmatter
+        content_without_frontmatter = self.strip_old_frontmatter(content)
+
+        # Steps 2, 3 and 5: new frontmatter and breadcrumb, validated
+        header, validation_issues = self.build_header(source_path, dest_path, metadata)
+
+        # Step 4: Combine all parts
+        return header + content_without_frontmatter.lstrip(), validation_issues
+
+    def record_migration(self, source_path, dest_path, validation_issues):
+        """Log a written file and print its status."""
+        self.migrations.append({
+            'source': source_path,
+            'dest': dest_path,
+            'status': 'success' if not validation_issues else 'success_with_warnings',
+            'validation_issues': validation_issues
+        })
+
+        status_icon = "✅" if not validation_issues else "⚠️"
+        print(f"{status_icon} Migrated: {source_path} → {dest_path}")
+
+        if validation_issues:
+            for issue in validation_issues:
+                print(f"   └─ {issue}")
+
+    def record_skip(self, source_path, dest_path):
+        """Log a file the journal says is already migrated."""
+        self.skipped.append({'source': source_path, 'dest': dest_path})
+        print(f"⏭️  Already migrated: {source_path} → {dest_path}")
+
+    def _read_source(self, source_path):
+        """Read one source file. Returns (content, error, stat)."""
+        source = self.base_dir / source_path
+        if not source.exists():
+            return None, f"Source not found: {source_path}", None
+        try:
+            stat = os.stat(source)
+            return source.read_text(encoding='utf-8'), None, stat
+        except Exception as e:
+            return None, f"Error reading {source_path}: {e}", None
+
+    def migrate_batch(self, plan: Iterable[PlanEntry], jobs: Optional[int] = None,
+                      io_threads: Optional[int] = None, strict: bool = True):
+        """
+        Migrate a batch of files, all or nothing.
+
+        plan is a list of (source_path, dest_path, metadata) entries. Sources
+        are read on a thread pool, transformed on a process pool (jobs
+        workers, default one per core; 1 runs in-process) and written to a
+        staging directory inside base_dir. Only if every file was read and
+        transformed, and with strict every file validated cleanly, are the
+        staged files moved into place with atomic renames. A failed rename
+        rolls back the ones already done, so the tree is never half-migrated.
+        With a journal, entries it records as done are skipped and the
+        committed files are journaled together, with one fsync. With a
+        profile, each step is timed as one 'batch ...' call.
+
+        Returns: (success: bool, issues: dict of dest_path -> list)
+        """
+        plan = list(plan)
+        timed = self.profile.time if self.profile is not None else NULL_TIMER.stage
+        if self.journal is not None:
+            pending = []
+            for entry in plan:
+                if self.journal.is_done(self.base_dir, entry[0], entry[1]):
+                    self.record_skip(entry[0], entry[1])
+                else:
+                    pending.append(entry)
+            plan = pending
+        jobs = jobs if jobs and jobs > 0 else (os.cpu_count() or 1)
+        io_threads = io_threads or min(32, (os.cpu_count() or 1) * 4)
+        issues: Dict[str, List[str]] = {}
+        batch_errors: List[str] = []
+
+        dests = [dest_path for _, dest_path, _ in plan]
+        for dest_path in sorted(d for d, count in Counter(dests).items() if count > 1):
+            batch_errors.append(f"Duplicate destination in batch: {dest_path}")
+        for dest_path in dests:
+            if (self.base_dir / dest_path).is_dir():
+                batch_errors.append(f"Destination is a directory: {dest_path}")
+
+        # Read
+        with timed('batch read'), ThreadPoolExecutor(max_workers=io_threads) as pool:
+            reads = list(pool.map(self._read_source, [source_path for source_path, _, _ in plan]))
+        for content, error, _ in reads:
+            if error:
+                batch_errors.append(error)
+
+        if batch_errors:
+            return self._fail_batch(batch_errors, issues)
+
+        # Transform
+        tasks = [(content, source_path, dest_path, metadata)
+                 for (content, _, _), (source_path, dest_path, metadata) in zip(reads, plan)]
+        with timed('batch transform'):
+            if jobs > 1 and len(tasks) > 1:
+                chunksize = max(1, len(tasks) // (jobs * 4))
+                with ProcessPoolExecutor(max_workers=jobs, initializer=_init_transform_worker) as pool:
+                    results = list(pool.map(_transform_task, tasks, chunksize=chunksize))
+            else:
+                results = [self.transform(*task) for task in tasks]
+
+        # Validate
+        for (_, dest_path, _), (_, validation_issues) in zip(plan, results):
+            issues[dest_path] = validation_issues
+            if strict and validation_issues:
+                batch_errors.append(f"Validation failed: {dest_path}")
+
+        if batch_errors:
+            return self._fail_batch(batch_errors, issues)
+
+        # Stage and commit
+        staging = Path(tempfile.mkdtemp(prefix='.migrate-staging-', dir=self.base_dir))
+        try:
+            staged = [staging / str(i) for i in range(len(plan))]
+
+            def write_staged(item):
+                path, (final_content, _) = item
+                path.write_text(final_content, encoding='utf-8')
+
+            with timed('batch stage'), ThreadPoolExecutor(max_workers=io_threads) as pool:
+                list(pool.map(write_staged, zip(staged, results)))
+
+            with timed('batch commit'):
+                self._commit_staged(staged, dests)
+        except Exception as e:
+            return self._fail_batch([f"Error writing batch: {e}"], issues)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        with timed('batch record'):
+            for (source_path, dest_path, _), (content, _, stat), (final_content, validation_issues) in zip(plan, reads, results):
+                if self.journal is not None:
+                    self.journal.record(self.base_dir, source_path, dest_path, content_sha256(content),
+                                        content_sha256(final_content), stat)
+                self.record_migration(source_path, dest_path, validation_issues)
+            if self.journal is not None:
+                self.journal.sync()
+        return True, issues
+
+    def migrate_concurrent(self, plan: Iterable[PlanEntry], concurrency: int = DEFAULT_CONCURRENCY,
+                           jobs: Optional[int] = None):
+        """
+        Migrate files independently, many at a time, for high-latency
+        filesystems (network mounts, /mnt/c under WSL).
+
+        Files go through an asyncio pipeline (pipeline.py): up to concurrency
+        reads and writes are in flight at once, transforms run on jobs worker
+        processes (default one per core; 1 runs on a thread), and bounded
+        queues hold back reads when writing falls behind. Unlike
+        migrate_batch, each file is written as soon as it's ready and a
+        failure affects only that file. Completed files are journaled as
+        they land, with one fsync at the end.
+
+        Returns: (success: bool, issues: dict of dest_path -> list)
+        """
+        plan = list(plan)
+        if self.journal is not None:
+            pending = []
+            for entry in plan:
+                if self.journal.is_done(self.base_dir, entry[0], entry[1]):
+                    self.record_skip(entry[0], entry[1])
+                else:
+                    pending.append(entry)
+            plan = pending
+        jobs = jobs if jobs and jobs > 0 else (os.cpu_count() or 1)
+        issues: Dict[str, List[str]] = {}
+        failed = 0
+
+        def read(entry):
+            return (entry,) + self._read_source(entry[0])
+
+        def write(result):
+            entry, final_content, validation_issues, error, stat, source_sha = result
+            if error:
+                return entry, validation_issues, error, None, None, None
+            dest = self.base_dir / entry[1]
+            try:
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                dest.write_text(final_content, encoding='utf-8')
+            except Exception as e:
+                return entry, validation_issues, f"Error writing {entry[1]}: {e}", None, None, None
+            return entry, validation_issues, None, stat, source_sha, content_sha256(final_content)
+
+        def done(index, result):
+            nonlocal failed
+            (source_path, dest_path, _), validation_issues, error, stat, source_sha, dest_sha = result
+            if error:
+                failed += 1
+                self.errors.append(error)
+                issues[dest_path] = [error]
+                print(f"❌ {error}")
+                return
+            issues[dest_path] = validation_issues
+            if self.journal is not None:
+                self.journal.record(self.base_dir, source_path, dest_path, source_sha, dest_sha, stat)
+            self.record_migration(source_path, dest_path, validation_issues)
+
+        timed = self.profile.time if self.profile is not None else NULL_TIMER.stage
+        with timed('pipeline'):
+            if jobs > 1 and len(plan) > 1:
+                with ProcessPoolExecutor(max_workers=jobs, initializer=_init_transform_worker) as pool:
+                    run_pipeline(plan, read, _pipeline_transform, write, concurrency,
+                                 executor=pool, transform_workers=jobs, on_result=done)
+            else:
+                _init_transform_worker()
+                run_pipeline(plan, read, _pipeline_transform, write, concurrency,
+                             transform_workers=1, on_result=done)
+        if self.journal is not None:
+            self.journal.sync()
+        return failed == 0, issues
+
+    def _commit_staged(self, staged: List[Path], dests: List[str]):
+        """
+        Move staged files over their destinations, grouped by folder.
+        Replaced files are kept in staging until every rename succeeded.
+        """
+        created_dirs: List[Path] = []
+        done: List[Tuple[Path, Optional[Path]]] = []
+        by_dir: Dict[Path, List[Tuple[Path, Path]]] = {}
+        for path, dest_path in zip(staged, dests):
+            dest = self.base_dir / dest_path
+            by_dir.setdefault(dest.parent, []).append((path, dest))
+
+        try:
+            for parent, moves in by_dir.items():
+                missing = []
+                ancestor = parent
+                while not ancestor.exists():
+                    missing.append(ancestor)
+                    ancestor = ancestor.parent
+                parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.extend(reversed(missing))
+
+                for path, dest in moves:
+                    backup = None
+                    if dest.is_file():
+                        backup = path.with_name(path.name + '.orig')
+                        os.replace(dest, backup)
+                    try:
+                        os.replace(path, dest)
+                    except OSError:
+                        if backup is not None:
+                            os.replace(backup, dest)
+                        raise
+                    done.append((dest, backup))
+        except OSError:
+            for dest, backup in reversed(done):
+                if backup is not None:
+                    os.replace(backup, dest)
+                else:
+                    dest.unlink()
+            for folder in reversed(created_dirs):
+                try:
+                    folder.rmdir()
+                except OSError:
+                    pass
+            raise
+
+    def _fail_batch(self, batch_errors: List[str], issues: Dict[str, List[str]]):
+        """Record and print why a batch was not written."""
+        self.errors.extend(batch_errors)
+        print(f"❌ Batch not migrated ({len(batch_errors)} problems, no files written):")
+        for error in batch_errors:
+            print(f"   └─ {error}")
+        return False, issues
+
+    def validate_content(self, content, filepath):
+        """
+        Basic validation of migrated content.
+        Returns list of validation issues (empty if valid).
+        """
+        issues = []
+        lines = content.split('\n')
+
+        # Check frontmatter
+        if not lines[0].strip() == '---':
+            issues.append("Missing frontmatter opening")
+            return issues
+
+        # Find frontmatter closing
+        frontmatter_end = -1
+        for i in range(1, min(50, len(lines))):  # Check first 50 lines
+            if lines[i].strip() == '---':
+                frontmatter_end = i
+                break
+
+        if frontmatter_end == -1:
+            issues.append("Missing frontmatter closing")
+            return issues
+
+        # Extract frontmatter
+        frontmatter = Frontmatter('\n'.join(lines[1:frontmatter_end]))
+
+        # Check required fields
+        required_fields = ['title', 'description', 'category', 'audience', 'status']
+        for field in required_fields:
+            if field not in frontmatter:
+                issues.append(f"Missing required field: {field}")
+
+        # Check for old Obsidian fields
+        old_fields = ['created', 'related']  # Note: 'tags' is valid in both
+        for field in old_fields:
+            if field in frontmatter:
+                issues.append(f"Old Obsidian field found: {field}")
+
+        # Check breadcrumb (first non-blank line after frontmatter)
+        breadcrumb_line_idx = frontmatter_end + 1
+        while breadcrumb_line_idx < len(lines) and not lines[breadcrumb_line_idx].strip():
+            breadcrumb_line_idx += 1
+        if breadcrumb_line_idx < len(lines):
+            breadcrumb = lines[breadcrumb_line_idx]
+            if '[Home](/)' in breadcrumb:
+                if breadcrumb.strip().endswith('> ---'):
+                    issues.append("Breadcrumb ends with '> ---' instead of page title")
+                if not '>' in breadcrumb:
+                    issues.append("Breadcrumb missing navigation arrows")
+            else:
+                issues.append("No breadcrumb found after frontmatter")
+
+        return issues
+
+def test_migration_on_sample():
+    """Test migration on a single sample file before batch processing."""
+    print("=" * 70)
+    print("TESTING MIGRATION ON SAMPLE FILE")
+    print("=" * 70)
+    print()
+
+    base_dir = "/mnt/c/Users/chris_3zal3ta/Documents/ArcheryApprentice-Docs"
+    migrator = ContentMigrator(base_dir)
+
+    # Test on one file
+    test_source = "Testing/Coverage-Guide.md"
+    test_dest = "Development/Testing/Coverage-Guide-TEST.md"
+    test_metadata = {
+        "title": "Test Coverage Guide",
+        "description": "Guide to understanding and improving test coverage",
+        "category": "development",
+        "audience": ["developers"],
+        "difficulty": "intermediate",
+        "status": "active",
+        "last_updated": "2025-10-29",
+        "tags": ["testing", "coverage", "quality"],
+    }
+
+    success, issues = migrator.migrate_file(test_source, test_dest, test_metadata)
+
+    if success and not issues:
+        print("\n✅ TEST PASSED - Sample file migrated correctly!")
+        print(f"   Check: {test_dest}")
+        return True
+    elif success and issues:
+        print("\n⚠️  TEST PASSED WITH WARNINGS")
+        print(f"   Issues found: {len(issues)}")
+        for issue in issues:
+            print(f"   - {issue}")
+        return True
+    else:
+        print("\n❌ TEST FAILED")
+        print(f"   Errors: {migrator.errors}")
+        return False
+
+if __name__ == "__main__":
+    print("FIXED Migration Script - Agent 1 Issues Addressed")
+    print()
+    print("Run test_migration_on_sample() to test before batch migration")
+    print()
+
+    # Uncomment to run test:
+    # test_migration_on_sample()
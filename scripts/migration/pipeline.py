@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Bounded-concurrency asyncio pipeline for per-file work on slow filesystems.
+
+On network mounts and WSL paths (/mnt/c/...) each file open, read and write
+pays a round trip, so one-file-at-a-time loops are bound by latency rather
+than by CPU or bandwidth. run_pipeline() overlaps that latency:
+
+    read       up to `concurrency` blocking reads in flight on a thread pool
+    transform  CPU work on an executor (a process pool, or threads if None)
+    write      up to `concurrency` blocking writes in flight on the same
+               thread pool (optional)
+
+Stages are joined by bounded queues, so when writes fall behind, transforms
+and then reads wait instead of piling file contents up in memory; at most
+about 2 * queue_size + 2 * concurrency items are in flight. Results come
+back in input order, and on_result sees each one as it finishes, on the
+event loop's thread, so it can update shared state (a journal, a cache,
+progress output) without locks.
+
+Stage functions should handle their own expected errors (return an error
+value); an exception escaping a stage cancels the pipeline and is raised.
+"""
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+Item = TypeVar('Item')
+
+DEFAULT_CONCURRENCY = 16
+
+_DONE = object()
+
+async def _run(items: List, read: Callable, transform: Callable, write: Optional[Callable],
+               concurrency: int, executor: Optional[Executor], queue_size: int,
+               transform_workers: int, on_result: Optional[Callable[[int, object], None]]) -> List:
+    loop = asyncio.get_running_loop()
+    results: List = [None] * len(items)
+    pending = iter(enumerate(items))
+    transformed: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    read_done: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as io_pool:
+        async def reader():
+            # Each reader pulls the next item; the shared iterator hands them out in order
+            for index, item in pending:
+                data = await loop.run_in_executor(io_pool, read, item)
+                await read_done.put((index, data))
+
+        async def transformer():
+            while True:
+                entry = await read_done.get()
+                if entry is _DONE:
+                    return
+                index, data = entry
+                value = await loop.run_in_executor(executor, transform, data)
+                await transformed.put((index, value))
+
+        async def writer():
+            while True:
+                entry = await transformed.get()
+                if entry is _DONE:
+                    return
+                index, value = entry
+                if write is not None:
+                    value = await loop.run_in_executor(io_pool, write, value)
+                results[index] = value
+                if on_result is not None:
+                    on_result(index, value)
+
+        async def stage(workers: List[asyncio.Task], queue: asyncio.Queue, consumers: int):
+            """Wait for a stage's tasks, then tell each consumer downstream to stop."""
+            await asyncio.gather(*workers)
+            for _ in range(consumers):
+                await queue.put(_DONE)
+
+        writer_count = concurrency if write is not None else 1
+        readers = [asyncio.ensure_future(reader()) for _ in range(concurrency)]
+        transformers = [asyncio.ensure_future(transformer()) for _ in range(transform_workers)]
+        writers = [asyncio.ensure_future(writer()) for _ in range(writer_count)]
+        tasks = [
+            asyncio.ensure_future(stage(readers, read_done, transform_workers)),
+            asyncio.ensure_future(stage(transformers, transformed, writer_count)),
+            *writers,
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in readers + transformers + tasks:
+                task.cancel()
+            raise
+    return results
+
+def run_pipeline(items: Iterable[Item], read: Callable, transform: Callable,
+                 write: Optional[Callable] = None, concurrency: int = DEFAULT_CONCURRENCY,
+                 executor: Optional[Executor] = None, transform_workers: Optional[int] = None,
+                 queue_size: Optional[int] = None,
+                 on_result: Optional[Callable[[int, object], None]] = None) -> List:
+    """
+    Run read(item) -> transform(data) -> write(value) for every item and
+    return the final values (write's results, or transform's if write is
+    None) in input order. transform runs on executor (the event loop's
+    default thread pool if None) with up to transform_workers calls in
+    flight (default: concurrency). queue_size bounds each hand-off queue
+    (default: 2 * concurrency). on_result(index, value) is called as each
+    item completes, in completion order. transform must be picklable for a
+    process pool.
+    """
+    items = list(items)
+    if not items:
+        return []
+    concurrency = max(1, concurrency)
+    return asyncio.run(_run(items, read, transform, write, concurrency, executor,
+                            queue_size or 2 * concurrency, transform_workers or concurrency,
+                            on_result))
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Lightweight timing instrumentation for the migration scripts.
+
+Code under measurement times its stages with a StageTimer, one per unit
+of work (usually a file), and hands the timer to a Profile, which keeps
+per-stage totals and duration histograms plus the slowest units:
+
+    timer = StageTimer() if profiling else NULL_TIMER
+    with timer.stage('read'):
+        ...
+    timer.count('cache hits')
+    profile.add(path, timer.times, timer.counts)
+
+    with profile.time('report'):     # a stage that isn't per file
+        ...
+    for line in profile.lines():
+        print(line)
+
+NULL_TIMER's stage() returns one shared no-op context, so instrumented
+code costs next to nothing when profiling is off. Timers are plain dicts
+underneath and pickle cheaply, so worker processes can send theirs back
+with their results. cprofile() wraps a block in cProfile and dumps pstats.
+"""
+
+import cProfile
+import heapq
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Histogram bucket upper bounds in seconds; the last bucket is open-ended
+BUCKET_BOUNDS = (0.0001, 0.001, 0.01, 0.1, 1.0)
+BUCKET_LABELS = ('<0.1ms', '<1ms', '<10ms', '<100ms', '<1s', '>=1s')
+BAR_WIDTH = 30
+
+_NULL_CONTEXT = nullcontext()
+
+class StageTimer:
+    """Seconds per stage and event counts for one unit of work."""
+    __slots__ = ('times', 'counts')
+    enabled = True
+
+    def __init__(self):
+        self.times: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.times[name] = self.times.get(name, 0.0) + time.perf_counter() - start
+
+    def count(self, name: str, n: int = 1):
+        self.counts[name] = self.counts.get(name, 0) + n
+
+class _NullTimer:
+    """Stand-in for StageTimer when profiling is off."""
+    __slots__ = ()
+    enabled = False
+    times: Dict[str, float] = {}
+    counts: Dict[str, int] = {}
+
+    def stage(self, name: str):
+        return _NULL_CONTEXT
+
+    def count(self, name: str, n: int = 1):
+        pass
+
+NULL_TIMER = _NullTimer()
+
+class StageStats:
+    """Totals and a duration histogram for one stage."""
+    __slots__ = ('calls', 'total', 'max', 'buckets')
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * len(BUCKET_LABELS)
+
+    def add(self, seconds: float):
+        self.calls += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        for i, bound in enumerate(BUCKET_BOUNDS):
+            if seconds < bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+class Profile:
+    """Per-stage statistics and the top slowest units across a run."""
+    def __init__(self, top: int = 10):
+        self.top = top
+        self.stages: Dict[str, StageStats] = {}
+        self.counters: Dict[str, int] = {}
+        self.units = 0
+        # Min-heap of (seconds, name) holding the slowest `top` units
+        self.slowest: List[Tuple[float, str]] = []
+
+    def record(self, stage: str, seconds: float):
+        stats = self.stages.get(stage)
+        if stats is None:
+            stats = self.stages[stage] = StageStats()
+        stats.add(seconds)
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def add(self, name: str, times: Dict[str, float], counts: Optional[Dict[str, int]] = None):
+        """Add one unit's stage times (from a StageTimer) under name."""
+        self.units += 1
+        for stage, seconds in times.items():
+            self.record(stage, seconds)
+        for counter, n in (counts or {}).items():
+            self.count(counter, n)
+        total = sum(times.values())
+        if len(self.slowest) < self.top:
+            heapq.heappush(self.slowest, (total, name))
+        elif self.top and total > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (total, name))
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        """Time a block as one call of stage, outside any unit."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def lines(self) -> List[str]:
+        """The profile as printable lines: stage table, histograms, slowest units."""
+        lines = [f"{'Stage':<20} {'Calls':>8} {'Total s':>10} {'Mean ms':>10} {'Max ms':>10}"]
+        for name, stats in self.stages.items():
+            mean_ms = 1000 * stats.total / stats.calls if stats.calls else 0.0
+            lines.append(f"{name:<20} {stats.calls:>8} {stats.total:>10.3f} {mean_ms:>10.3f} {1000 * stats.max:>10.3f}")
+
+        for name, stats in self.stages.items():
+            if stats.calls < 2:
+                continue
+            lines.append("")
+            lines.append(f"{name}:")
+            peak = max(stats.buckets)
+            for label, n in zip(BUCKET_LABELS, stats.buckets):
+                bar = '█' * (round(BAR_WIDTH * n / peak) if peak else 0)
+                lines.append(f"  {label:>7} {n:>8} {bar}")
+
+        if self.counters:
+            lines.append("")
+            for name, n in self.counters.items():
+                lines.append(f"{name}: {n}")
+
+        if self.slowest:
+            lines.append("")
+            lines.append(f"Slowest {len(self.slowest)} of {self.units}:")
+            for seconds, name in sorted(self.slowest, reverse=True):
+                lines.append(f"  {1000 * seconds:>10.3f} ms  {name}")
+        return lines
+
+@contextmanager
+def cprofile(path: Optional[Path]) -> Iterator[Optional[cProfile.Profile]]:
+    """Run the block under cProfile and dump pstats to path (no-op if path is None)."""
+    if path is None:
+        yield None
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(str(path))
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+The docs' section tree, and the breadcrumbs derived from it.
+
+A breadcrumb starts at one of the top-level SECTIONS: each folder from the
+section down adds a crumb whose text is the folder name with hyphens as
+spaces and whose link is the folder's absolute path:
+
+    Development/Guides/Best-Practices/Style.md
+    [Home](/) > [Development](/Development/) > [Guides](/Development/Guides/) >
+        [Best Practices](/Development/Guides/Best-Practices/) > Style
+
+Folders above a section (content/, for a path from the repo root) add
+nothing, and a section name further down restarts the link path.
+
+SectionTree caches every folder's crumbs and rendered prefix, each built
+from its parent's, so a breadcrumb for any path is one dictionary lookup
+once its folder has been seen, and at most O(depth) lookups the first
+time. The migrators generate breadcrumbs and validate-migration.py checks
+them through the same tree, so both sides always agree.
+
+FOLDERS is the planned folder layout with a description per folder (used
+by create-readmes.py); SectionTree.build() adds the folders found on disk.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Top-level folders a breadcrumb starts from
+SECTIONS = ("Development", "User-Guide", "Technical-Reference",
+            "Architecture-Decisions", "Project-Management", "Meta")
+
+HOME_CRUMB = "[Home](/)"
+
+# Planned folder structure with descriptions
+FOLDERS = {
+    "User-Guide": "comprehensive user documentation",
+    "User-Guide/Quick-Start": "getting started guides for users",
+    "User-Guide/Features": "detailed feature documentation",
+    "User-Guide/Features/Scoring": "scoring system documentation",
+    "User-Guide/Features/Equipment": "equipment management documentation",
+    "User-Guide/Features/Analytics": "analytics and statistics documentation",
+    "User-Guide/Features/Sync": "sync and cloud features documentation",
+    "User-Guide/How-To": "step-by-step guides for common tasks",
+    "User-Guide/How-To/Scoring-Scenarios": "guides for different scoring situations",
+    "User-Guide/How-To/Equipment-Tasks": "guides for equipment management tasks",
+    "User-Guide/How-To/Data-Management": "guides for managing your data",
+    "User-Guide/Reference": "quick reference materials",
+    "User-Guide/Troubleshooting": "solutions to common problems",
+    "Development": "developer documentation and guides",
+    "Development/Getting-Started": "setup guides for developers",
+    "Development/Architecture": "architecture documentation",
+    "Development/Architecture/Layers": "layer architecture documentation",
+    "Development/Architecture/Patterns": "design patterns and best practices",
+    "Development/Architecture/Diagrams": "architecture diagrams and visualizations",
+    "Development/Guides": "developer how-to guides",
+    "Development/Guides/Adding-Features": "guides for adding new features",
+    "Development/Guides/Working-With": "guides for working with specific systems",
+    "Development/Guides/Best-Practices": "coding standards and best practices",
+    "Development/Testing": "testing guides and strategies",
+    "Development/Contributing": "contribution guidelines",
+    "Development/Tools": "development tools documentation",
+    "Technical-Reference": "technical API and system documentation",
+    "Technical-Reference/Database": "database schema and documentation",
+    "Technical-Reference/Database/Tables": "database table schemas",
+    "Technical-Reference/Database/Migrations": "database migration history",
+    "Technical-Reference/API": "API documentation",
+    "Technical-Reference/API/Repositories": "repository layer API documentation",
+    "Technical-Reference/API/ViewModels": "ViewModel API documentation",
+    "Technical-Reference/API/Services": "service layer API documentation",
+    "Technical-Reference/API/DAOs": "DAO layer API documentation",
+    "Technical-Reference/Flows": "system and user flow documentation",
+    "Technical-Reference/Flows/User-Flows": "user interaction flows",
+    "Technical-Reference/Flows/System-Flows": "internal system flows",
+    "Technical-Reference/Flows/Integration-Flows": "integration and sync flows",
+    "Technical-Reference/Data-Models": "data model documentation",
+    "Technical-Reference/Data-Models/Equipment": "equipment data models",
+    "Technical-Reference/Data-Models/Scoring": "scoring data models",
+    "Technical-Reference/Data-Models/Tournament": "tournament data models",
+    "Technical-Reference/Data-Models/Analytics": "analytics data models",
+    "Technical-Reference/Code-Examples": "code examples and snippets",
+    "Technical-Reference/Code-Examples/Common-Patterns": "common coding patterns",
+    "Technical-Reference/Code-Examples/Feature-Examples": "feature implementation examples",
+    "Technical-Reference/Code-Examples/Testing-Examples": "testing code examples",
+    "Technical-Reference/Performance": "performance guidelines and optimization",
+    "Architecture-Decisions": "architecture decision records (ADRs)",
+    "Project-Management": "project tracking and status",
+    "Project-Management/Roadmap": "project roadmap and planning",
+    "Project-Management/Release-Notes": "version release notes",
+    "Project-Management/Known-Issues": "known issues and workarounds",
+    "Project-Management/Status": "current project status",
+    "Project-Management/Team": "team information and contacts",
+    "Meta": "documentation about the documentation",
+    "Meta/Templates": "documentation templates",
+    "assets": "images, videos, and downloadable files",
+    "assets/images": "all image assets",
+    "assets/videos": "video tutorials and demos",
+    "assets/downloads": "downloadable files and samples",
+}
+
+def display_name(folder: str) -> str:
+    """Crumb text for a folder name."""
+    return folder.replace('-', ' ')
+
+class SectionNode:
+    """One folder: its crumbs from the section root down, and its subfolders."""
+    __slots__ = ('path', 'crumbs', 'link_path', 'prefix', 'children', 'description')
+
+    def __init__(self, path: str, crumbs: Tuple[Tuple[str, str], ...], link_path: str):
+        self.path = path
+        # (text, link) per crumb, Home excluded
+        self.crumbs = crumbs
+        # Link of the last crumb ('' above any section)
+        self.link_path = link_path
+        self.prefix = " > ".join([HOME_CRUMB] + [f"[{text}]({link})" for text, link in crumbs])
+        self.children: List[str] = []
+        self.description: Optional[str] = None
+
+class SectionTree:
+    """Folder path -> SectionNode, built lazily from parents and cached."""
+    def __init__(self, sections: Iterable[str] = SECTIONS):
+        self.sections = frozenset(sections)
+        self.nodes: Dict[str, SectionNode] = {'': SectionNode('', (), '')}
+
+    @classmethod
+    def build(cls, root: Optional[Path] = None, folders: Dict[str, str] = FOLDERS,
+              sections: Iterable[str] = SECTIONS) -> 'SectionTree':
+        """Tree of the planned folders plus, if root is given, every folder under it."""
+        tree = cls(sections)
+        for folder, description in folders.items():
+            tree.node(folder).description = description
+        if root is not None:
+            for dirpath, dirnames, _ in os.walk(root):
+                dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+                rel = os.path.relpath(dirpath, root).replace(os.sep, '/')
+                for name in dirnames:
+                    tree.node(name if rel == '.' else f"{rel}/{name}")
+        return tree
+
+    def node(self, folder: str) -> SectionNode:
+        """The node for a folder path ('' for the root), creating it and its parents."""
+        node = self.nodes.get(folder)
+        if node is not None:
+            return node
+        parent_path, _, name = folder.rpartition('/')
+        parent = self.node(parent_path)
+        if name in ('.', '..'):
+            crumbs, link_path = parent.crumbs, parent.link_path
+        elif name in self.sections:
+            link_path = f"/{name}/"
+            crumbs = parent.crumbs + ((display_name(name), link_path),)
+        elif parent.link_path:
+            link_path = parent.link_path + name + "/"
+            crumbs = parent.crumbs + ((display_name(name), link_path),)
+        else:
+            crumbs, link_path = parent.crumbs, parent.link_path
+        node = self.nodes[folder] = SectionNode(folder, crumbs, link_path)
+        parent.children.append(folder)
+        return node
+
+    def folder_of(self, path: str) -> SectionNode:
+        """The node for the folder containing a file path."""
+        return self.node(path.rpartition('/')[0])
+
+    def breadcrumb(self, path: str, title: str) -> str:
+        """Breadcrumb line for a file, ending with its title."""
+        return f"{self.folder_of(path).prefix} > {title}"
+
+    def expected_names(self, path: str) -> List[str]:
+        """Crumb texts a file's breadcrumb must contain, section root first."""
+        return [text for text, _ in self.folder_of(path).crumbs]
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Pruned directory walks and path globs for the migration scripts.
+
+walk_files() lists files under a root with os.scandir and decides per
+directory whether to open it at all:
+
+    include     globs a file must match; folders that can't lead to a
+                match are never listed
+    exclude     globs for files, or whole folders, to skip
+    .gitignore  rules from the root's and any nested .gitignore files
+
+Globs are relative to the root (or to the .gitignore's folder) and follow
+.gitignore conventions: * and ? stay within one folder and ** spans
+folders; a pattern with no / except a trailing one matches a name at any
+depth ('node_modules', '*.tmp', 'build/'); a trailing / matches folders
+only; and a pattern that matches a folder covers everything under it.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+GLOB_CHARS = re.compile(r'[*?\[]')
+
+def glob_to_regex(pattern: str) -> re.Pattern:
+    """Compile a glob where * and ? stay within one folder and ** spans folders."""
+    regex = ''
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            regex += '(?:.*/)?'
+            i += 3
+            continue
+        if pattern.startswith('**', i) and i + 2 == len(pattern):
+            regex += '.*'
+            break
+        char = pattern[i]
+        if char == '*':
+            regex += '[^/]*'
+        elif char == '?':
+            regex += '[^/]'
+        elif char == '[':
+            end = pattern.find(']', i + 1)
+            if end == -1:
+                regex += re.escape(char)
+            else:
+                regex += pattern[i:end + 1]
+                i = end
+        else:
+            regex += re.escape(char)
+        i += 1
+    return re.compile(regex + r'\Z')
+
+def glob_base(pattern: str) -> str:
+    """Folder part of a glob before its first wildcard."""
+    match = GLOB_CHARS.search(pattern)
+    literal = pattern[:match.start()] if match else pattern
+    return literal.rsplit('/', 1)[0] if '/' in literal else ''
+
+class PathPattern:
+    """One glob, matched against a path relative to base or, if unanchored, a name."""
+    __slots__ = ('regex', 'anchored', 'dir_only', 'negate', 'base', 'prefix')
+
+    def __init__(self, pattern: str, base: str = ''):
+        self.negate = pattern.startswith('!')
+        if self.negate:
+            pattern = pattern[1:]
+        self.dir_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+        self.anchored = '/' in pattern
+        pattern = pattern.lstrip('/')
+        if pattern.endswith('/**'):
+            # 'dir/**' is the folder itself, as far as pruning goes
+            pattern = pattern[:-3]
+            self.dir_only = True
+        self.regex = glob_to_regex(pattern)
+        self.base = base
+        # Literal folder this pattern starts in, relative to the walk root
+        self.prefix = '/'.join(p for p in (base, glob_base(pattern + '/x') if self.anchored else '') if p)
+
+    def matches(self, rel: str, name: str, is_dir: bool) -> bool:
+        """rel is relative to the walk root."""
+        if self.dir_only and not is_dir:
+            return False
+        if not self.anchored:
+            return self.regex.match(name) is not None
+        if self.base:
+            if not rel.startswith(self.base + '/'):
+                return False
+            rel = rel[len(self.base) + 1:]
+        return self.regex.match(rel) is not None
+
+    def may_match_under(self, rel_dir: str) -> bool:
+        """Whether anything under folder rel_dir could match."""
+        if not self.anchored or not self.prefix:
+            return True
+        return self.prefix == rel_dir or self.prefix.startswith(rel_dir + '/') or rel_dir.startswith(self.prefix + '/')
+
+def compile_patterns(patterns: Iterable[str], base: str = '') -> List[PathPattern]:
+    return [PathPattern(p, base) for p in patterns]
+
+def read_gitignore(path: Path, base: str) -> List[PathPattern]:
+    """Rules from one .gitignore; base is its folder relative to the walk root."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return []
+    rules = []
+    for line in lines:
+        line = line.rstrip()
+        if not line or line.startswith('#'):
+            continue
+        if line.startswith('\\'):
+            line = line[1:]
+        rules.append(PathPattern(line, base))
+    return rules
+
+def is_ignored(rules: Sequence[PathPattern], rel: str, name: str, is_dir: bool) -> bool:
+    """Last matching rule wins, as in git."""
+    ignored = False
+    for rule in rules:
+        if rule.matches(rel, name, is_dir):
+            ignored = not rule.negate
+    return ignored
+
+def walk_files(root: Path, include: Sequence[str] = (), exclude: Sequence[str] = (),
+               gitignore: bool = True) -> Iterator[Path]:
+    """
+    Yield files under root that match an include glob (any file if none
+    are given) and no exclude glob or .gitignore rule. Each folder's files
+    come before its subfolders, both in directory order, like Path.rglob.
+    """
+    include_patterns = compile_patterns(include)
+    exclude_patterns = compile_patterns(exclude)
+
+    # (folder rel path, inside an included folder, .gitignore rules in force)
+    stack: List[Tuple[str, bool, List[PathPattern]]] = [('', not include_patterns, [])]
+    while stack:
+        rel_dir, included, rules = stack.pop()
+        if gitignore:
+            nested = read_gitignore(root / rel_dir / '.gitignore', rel_dir)
+            if nested:
+                rules = rules + nested
+        try:
+            with os.scandir(root / rel_dir if rel_dir else root) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            rel = f"{rel_dir}/{name}" if rel_dir else name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if is_dir:
+                if name == '.git':
+                    continue
+                if any(p.matches(rel, name, True) for p in exclude_patterns):
+                    continue
+                if rules and is_ignored(rules, rel, name, True):
+                    continue
+                sub_included = included or any(p.matches(rel, name, True) for p in include_patterns)
+                if sub_included or any(p.may_match_under(rel) for p in include_patterns):
+                    subdirs.append((rel, sub_included, rules))
+                continue
+            if not included and not any(p.matches(rel, name, False) for p in include_patterns):
+                continue
+            if any(p.matches(rel, name, False) for p in exclude_patterns):
+                continue
+            if rules and is_ignored(rules, rel, name, False):
+                continue
+            yield Path(entry.path)
+
+        # Reversed so the first subfolder is walked first
+        stack.extend(reversed(subdirs))
@@ -1,487 +1,1229 @@
-#!/usr/bin/env python3
-"""
-Migration Validation Script
-Validates migrated documentation files for proper frontmatter and structure.
-
-Usage:
-    python validate-migration.py
-
-Output:
-    - Detailed validation report
-    - List of files with issues
-    - Suggested fixes
-"""
-
-import os
-import re
-import sys
-from pathlib import Path
-from typing import Dict, List, Tuple
-from datetime import datetime
-
-# Fix Windows console encoding for Unicode characters
-if sys.platform == 'win32':
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-
-# ANSI color codes for terminal output
-class Colors:
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    BLUE = '\033[94m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
-
-class ValidationIssue:
-    """Represents a validation issue found in a file."""
-    def __init__(self, severity: str, category: str, message: str, line_number: int = None):
-        self.severity = severity  # 'error', 'warning', 'info'
-        self.category = category  # 'frontmatter', 'breadcrumb', 'structure'
-        self.message = message
-        self.line_number = line_number
-
-    def __str__(self):
-        color = Colors.RED if self.severity == 'error' else Colors.YELLOW if self.severity == 'warning' else Colors.BLUE
-        prefix = "❌" if self.severity == 'error' else "⚠️" if self.severity == 'warning' else "ℹ️"
-        line_info = f" (line {self.line_number})" if self.line_number else ""
-        return f"{color}{prefix} [{self.category.upper()}]{line_info} {self.message}{Colors.END}"
-
-class FileValidation:
-    """Validation results for a single file."""
-    def __init__(self, filepath: Path):
-        self.filepath = filepath
-        self.issues: List[ValidationIssue] = []
-        self.has_frontmatter = False
-        self.has_new_style_frontmatter = False
-        self.has_old_style_frontmatter = False
-        self.has_breadcrumb = False
-        self.breadcrumb_valid = False
-        self.content_lines = []
-
-    def add_issue(self, severity: str, category: str, message: str, line_number: int = None):
-        self.issues.append(ValidationIssue(severity, category, message, line_number))
-
-    def is_valid(self) -> bool:
-        return len([i for i in self.issues if i.severity == 'error']) == 0
-
-    def error_count(self) -> int:
-        return len([i for i in self.issues if i.severity == 'error'])
-
-    def warning_count(self) -> int:
-        return len([i for i in self.issues if i.severity == 'warning'])
-
-def extract_frontmatter(content: str) -> Tuple[str, str, int]:
-    """
-    Extract frontmatter from markdown content.
-    Returns: (frontmatter, remaining_content, frontmatter_end_line)
-    """
-    lines = content.split('\n')
-    if not lines or not lines[0].strip() == '---':
-        return "", content, 0
-
-    # Find the closing ---
-    for i in range(1, len(lines)):
-        if lines[i].strip() == '---':
-            frontmatter = '\n'.join(lines[1:i])
-            remaining = '\n'.join(lines[i+1:])
-            return frontmatter, remaining, i + 1
-
-    return "", content, 0
-
-def validate_new_style_frontmatter(frontmatter: str) -> List[ValidationIssue]:
-    """Validate that frontmatter has new-style YAML structure."""
-    issues = []
-
-    required_fields = ['title', 'description', 'category', 'audience', 'status']
-    recommended_fields = ['difficulty', 'last_updated', 'tags']
-
-    # Check for required fields
-    for field in required_fields:
-        pattern = rf'^{field}:\s*.+$'
-        if not re.search(pattern, frontmatter, re.MULTILINE):
-            issues.append(ValidationIssue(
-                'error',
-                'frontmatter',
-                f"Missing required field: '{field}'"
-            ))
-
-    # Check for recommended fields
-    for field in recommended_fields:
-        pattern = rf'^{field}:\s*.+$'
-        if not re.search(pattern, frontmatter, re.MULTILINE):
-            issues.append(ValidationIssue(
-                'warning',
-                'frontmatter',
-                f"Missing recommended field: '{field}'"
-            ))
-
-    # Check for old Obsidian-style fields (should not exist)
-    old_style_fields = ['created', 'related']
-    for field in old_style_fields:
-        pattern = rf'^{field}:\s*.+$'
-        if re.search(pattern, frontmatter, re.MULTILINE):
-            issues.append(ValidationIssue(
-                'error',
-                'frontmatter',
-                f"Found old Obsidian field: '{field}' (should be removed or converted)"
-            ))
-
-    # Check for Obsidian-style links [[...]] in frontmatter
-    if '[[' in frontmatter:
-        issues.append(ValidationIssue(
-            'error',
-            'frontmatter',
-            "Found Obsidian-style wikilinks [[...]] (should use 'related_docs' array)"
-        ))
-
-    # Validate category value
-    valid_categories = ['development', 'user-guide', 'technical-reference', 'meta']
-    category_match = re.search(r'^category:\s*["\']?(\w+)["\']?$', frontmatter, re.MULTILINE)
-    if category_match:
-        category = category_match.group(1)
-        if category not in valid_categories:
-            issues.append(ValidationIssue(
-                'warning',
-                'frontmatter',
-                f"Unusual category value: '{category}' (valid: {', '.join(valid_categories)})"
-            ))
-
-    # Validate status value
-    valid_statuses = ['active', 'draft', 'archived', 'deprecated']
-    status_match = re.search(r'^status:\s*["\']?(\w+)["\']?$', frontmatter, re.MULTILINE)
-    if status_match:
-        status = status_match.group(1)
-        if status not in valid_statuses:
-            issues.append(ValidationIssue(
-                'warning',
-                'frontmatter',
-                f"Unusual status value: '{status}' (valid: {', '.join(valid_statuses)})"
-            ))
-
-    return issues
-
-def validate_breadcrumb(content: str, filepath: Path) -> List[ValidationIssue]:
-    """Validate breadcrumb navigation format."""
-    issues = []
-
-    # Look for breadcrumb pattern in first 20 lines after frontmatter
-    lines = content.split('\n')[:20]
-    breadcrumb_pattern = r'\[Home\]\(/\)\s*>'
-
-    breadcrumb_line = None
-    breadcrumb_line_num = None
-    for i, line in enumerate(lines):
-        if re.search(breadcrumb_pattern, line):
-            breadcrumb_line = line.strip()
-            breadcrumb_line_num = i + 1
-            break
-
-    if not breadcrumb_line:
-        issues.append(ValidationIssue(
-            'error',
-            'breadcrumb',
-            "No breadcrumb navigation found (should start with '[Home](/) >')"
-        ))
-        return issues
-
-    # Check for malformed breadcrumb ending with "---"
-    if breadcrumb_line.endswith('> ---'):
-        issues.append(ValidationIssue(
-            'error',
-            'breadcrumb',
-            f"Breadcrumb ends with '> ---' (should end with page title)",
-            breadcrumb_line_num
-        ))
-
-    # Check if breadcrumb ends with a proper page title
-    if not breadcrumb_line.endswith('> ---') and '>' in breadcrumb_line:
-        # Extract last segment
-        last_segment = breadcrumb_line.split('>')[-1].strip()
-        if not last_segment or last_segment.startswith('['):
-            issues.append(ValidationIssue(
-                'warning',
-                'breadcrumb',
-                f"Breadcrumb may be malformed - last segment: '{last_segment}'",
-                breadcrumb_line_num
-            ))
-
-    # Validate breadcrumb path matches file location
-    relative_path = filepath.relative_to(Path.cwd())
-    parts = list(relative_path.parts[:-1])  # Exclude filename
-
-    for part in parts:
-        # Convert directory name to expected breadcrumb format
-        expected_text = part.replace('-', ' ').title()
-        if expected_text not in breadcrumb_line:
-            issues.append(ValidationIssue(
-                'warning',
-                'breadcrumb',
-                f"Breadcrumb may not match file path - expected '{expected_text}' in breadcrumb",
-                breadcrumb_line_num
-            ))
-            break  # Only report first mismatch
-
-    return issues
-
-def validate_structure(content: str) -> List[ValidationIssue]:
-    """Validate document structure."""
-    issues = []
-
-    lines = content.split('\n')
-
-    # Check for main heading (# Title)
-    has_h1 = False
-    h1_count = 0
-    for i, line in enumerate(lines[:30]):  # Check first 30 lines
-        if line.startswith('# '):
-            has_h1 = True
-            h1_count += 1
-
-    if not has_h1:
-        issues.append(ValidationIssue(
-            'warning',
-            'structure',
-            "No H1 heading found in first 30 lines"
-        ))
-
-    if h1_count > 1:
-        issues.append(ValidationIssue(
-            'warning',
-            'structure',
-            f"Multiple H1 headings found ({h1_count}) - should have exactly 1"
-        ))
-
-    return issues
-
-def validate_file(filepath: Path) -> FileValidation:
-    """Validate a single markdown file."""
-    validation = FileValidation(filepath)
-
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            validation.content_lines = content.split('\n')
-    except Exception as e:
-        validation.add_issue('error', 'file', f"Failed to read file: {str(e)}")
-        return validation
-
-    # Extract frontmatter
-    frontmatter, remaining_content, fm_end_line = extract_frontmatter(content)
-
-    if not frontmatter:
-        validation.add_issue('error', 'frontmatter', "No frontmatter found (should start with '---')")
-        return validation
-
-    validation.has_frontmatter = True
-
-    # Check if it's new-style or old-style frontmatter
-    has_title = 'title:' in frontmatter
-    has_old_tags = re.search(r'^tags:\s*$', frontmatter, re.MULTILINE)  # Old style: tags at root level
-    has_old_created = 'created:' in frontmatter
-    has_old_related = 'related:' in frontmatter or '[[' in frontmatter
-
-    if has_title:
-        validation.has_new_style_frontmatter = True
-
-    if has_old_tags or has_old_created or has_old_related:
-        validation.has_old_style_frontmatter = True
-        validation.add_issue('error', 'frontmatter', "Found old Obsidian-style frontmatter (needs migration)")
-
-    # Validate new-style frontmatter
-    frontmatter_issues = validate_new_style_frontmatter(frontmatter)
-    validation.issues.extend(frontmatter_issues)
-
-    # Validate breadcrumb
-    breadcrumb_issues = validate_breadcrumb(remaining_content, filepath)
-    validation.issues.extend(breadcrumb_issues)
-    if not breadcrumb_issues:
-        validation.has_breadcrumb = True
-        validation.breadcrumb_valid = True
-    elif len([i for i in breadcrumb_issues if i.severity == 'error']) == 0:
-        validation.has_breadcrumb = True
-        validation.breadcrumb_valid = False
-
-    # Validate structure
-    structure_issues = validate_structure(remaining_content)
-    validation.issues.extend(structure_issues)
-
-    return validation
-
-def scan_directory(directory: Path) -> List[FileValidation]:
-    """Scan directory for markdown files and validate them."""
-    validations = []
-
-    # Find all markdown files (excluding README.md)
-    for md_file in directory.rglob('*.md'):
-        if md_file.name.lower() == 'readme.md':
-            continue
-
-        # Only validate files in target directories
-        relative_path = md_file.relative_to(directory)
-        if relative_path.parts[0] in ['Development', 'Technical-Reference', 'User-Guide', 'Meta']:
-            validation = validate_file(md_file)
-            validations.append(validation)
-
-    return validations
-
-def generate_report(validations: List[FileValidation]) -> str:
-    """Generate a detailed validation report."""
-    lines = []
-
-    # Header
-    lines.append(f"{Colors.BOLD}{'='*80}{Colors.END}")
-    lines.append(f"{Colors.BOLD}Documentation Migration Validation Report{Colors.END}")
-    lines.append(f"{Colors.BOLD}{'='*80}{Colors.END}")
-    lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("")
-
-    # Summary statistics
-    total_files = len(validations)
-    valid_files = len([v for v in validations if v.is_valid()])
-    invalid_files = total_files - valid_files
-    total_errors = sum(v.error_count() for v in validations)
-    total_warnings = sum(v.warning_count() for v in validations)
-
-    lines.append(f"{Colors.BOLD}Summary:{Colors.END}")
-    lines.append(f"  Total files validated: {total_files}")
-    lines.append(f"  {Colors.GREEN}✅ Valid files: {valid_files}{Colors.END}")
-    lines.append(f"  {Colors.RED}❌ Files with errors: {invalid_files}{Colors.END}")
-    lines.append(f"  {Colors.RED}Total errors: {total_errors}{Colors.END}")
-    lines.append(f"  {Colors.YELLOW}Total warnings: {total_warnings}{Colors.END}")
-    lines.append("")
-
-    # Frontmatter statistics
-    new_style = len([v for v in validations if v.has_new_style_frontmatter])
-    old_style = len([v for v in validations if v.has_old_style_frontmatter])
-    no_fm = len([v for v in validations if not v.has_frontmatter])
-
-    lines.append(f"{Colors.BOLD}Frontmatter Statistics:{Colors.END}")
-    lines.append(f"  New-style frontmatter: {new_style}/{total_files} ({100*new_style/total_files:.1f}%)")
-    lines.append(f"  Old-style frontmatter: {old_style}/{total_files} ({100*old_style/total_files:.1f}%)")
-    lines.append(f"  No frontmatter: {no_fm}/{total_files}")
-    lines.append("")
-
-    # Breadcrumb statistics
-    has_breadcrumb = len([v for v in validations if v.has_breadcrumb])
-    valid_breadcrumb = len([v for v in validations if v.breadcrumb_valid])
-
-    lines.append(f"{Colors.BOLD}Breadcrumb Statistics:{Colors.END}")
-    lines.append(f"  Has breadcrumb: {has_breadcrumb}/{total_files}")
-    lines.append(f"  Valid breadcrumb: {valid_breadcrumb}/{total_files}")
-    lines.append("")
-
-    # Files with issues
-    if invalid_files > 0:
-        lines.append(f"{Colors.BOLD}{'='*80}{Colors.END}")
-        lines.append(f"{Colors.BOLD}Files with Issues:{Colors.END}")
-        lines.append(f"{Colors.BOLD}{'='*80}{Colors.END}")
-        lines.append("")
-
-        for validation in validations:
-            if not validation.is_valid():
-                relative_path = validation.filepath.relative_to(Path.cwd())
-                error_count = validation.error_count()
-                warning_count = validation.warning_count()
-
-                lines.append(f"{Colors.RED}❌ {relative_path}{Colors.END}")
-                lines.append(f"   Errors: {error_count}, Warnings: {warning_count}")
-
-                for issue in validation.issues:
-                    lines.append(f"   {issue}")
-
-                lines.append("")
-
-    # Files with only warnings
-    warning_only_files = [v for v in validations if v.is_valid() and v.warning_count() > 0]
-    if warning_only_files:
-        lines.append(f"{Colors.BOLD}{'='*80}{Colors.END}")
-        lines.append(f"{Colors.BOLD}Files with Warnings (No Errors):{Colors.END}")
-        lines.append(f"{Colors.BOLD}{'='*80}{Colors.END}")
-        lines.append("")
-
-        for validation in warning_only_files:
-            relative_path = validation.filepath.relative_to(Path.cwd())
-            warning_count = validation.warning_count()
-
-            lines.append(f"{Colors.YELLOW}⚠️  {relative_path}{Colors.END} ({warning_count} warnings)")
-
-            for issue in validation.issues:
-                if issue.severity == 'warning':
-                    lines.append(f"   {issue}")
-
-            lines.append("")
-
-    # Recommendations
-    lines.append(f"{Colors.BOLD}{'='*80}{Colors.END}")
-    lines.append(f"{Colors.BOLD}Recommendations:{Colors.END}")
-    lines.append(f"{Colors.BOLD}{'='*80}{Colors.END}")
-    lines.append("")
-
-    if old_style > 0:
-        lines.append(f"{Colors.RED}1. Fix Old-Style Frontmatter ({old_style} files){Colors.END}")
-        lines.append("   - Remove 'created', 'related', and root-level 'tags' fields")
-        lines.append("   - Add required fields: title, description, category, audience, status")
-        lines.append("   - Convert [[wikilinks]] to 'related_docs' array")
-        lines.append("")
-
-    if invalid_files - old_style > 0:
-        lines.append(f"{Colors.RED}2. Fix Malformed Breadcrumbs{Colors.END}")
-        lines.append("   - Breadcrumbs should end with page title, not '---'")
-        lines.append("   - Format: [Home](/) > [Section](/Section/) > Page Title")
-        lines.append("")
-
-    if total_warnings > 0:
-        lines.append(f"{Colors.YELLOW}3. Address Warnings{Colors.END}")
-        lines.append("   - Add missing recommended fields (difficulty, last_updated, tags)")
-        lines.append("   - Verify breadcrumb paths match file locations")
-        lines.append("   - Ensure single H1 heading per document")
-        lines.append("")
-
-    lines.append(f"{Colors.BOLD}{'='*80}{Colors.END}")
-
-    return '\n'.join(lines)
-
-def main():
-    """Main validation entry point."""
-    print(f"\n{Colors.BOLD}Starting Documentation Migration Validation...{Colors.END}\n")
-
-    # Get current directory (should be docs repo root)
-    docs_root = Path.cwd()
-
-    # Validate that we're in the right directory
-    if not (docs_root / 'Development').exists():
-        print(f"{Colors.RED}Error: Not in documentation repository root!{Colors.END}")
-        print(f"Current directory: {docs_root}")
-        print(f"Expected to find 'Development/' directory")
-        return 1
-
-    print(f"Scanning directory: {docs_root}")
-    print(f"Looking for markdown files in: Development/, Technical-Reference/, User-Guide/, Meta/")
-    print("")
-
-    # Scan and validate
-    validations = scan_directory(docs_root)
-
-    print(f"Found {len(validations)} files to validate")
-    print("")
-
-    # Generate report
-    report = generate_report(validations)
-    print(report)
-
-    # Save report to file
-    report_path = docs_root / 'validation-report.txt'
-    with open(report_path, 'w', encoding='utf-8') as f:
-        # Strip ANSI color codes for file output
-        clean_report = re.sub(r'\033\[[0-9;]+m', '', report)
-        f.write(clean_report)
-
-    print(f"\n{Colors.GREEN}Report saved to: {report_path}{Colors.END}\n")
-
-    # Exit code based on validation results
-    invalid_count = len([v for v in validations if not v.is_valid()])
-    return 0 if invalid_count == 0 else 1
-
-if __name__ == '__main__':
-    exit(main())
+#!/usr/bin/env python3
+"""
+Migration Validation Script
+Validates migrated documentation files for proper frontmatter and structure.
+
+Usage:
+    python validate-migration.py
+    python validate-migration.py --jobs 8   # Validate across 8 worker processes
+    python validate-migration.py --jobs 0   # One worker per CPU core
+    python validate-migration.py --no-cache # Ignore and skip writing the validation cache
+    python validate-migration.py --concurrency 32  # Overlap file reads (network/WSL mounts)
+    python validate-migration.py --rules my-rules.json  # Use another rule set
+    python validate-migration.py --jsonl results.jsonl  # Stream per-file JSON as files finish
+    python validate-migration.py --sarif results.sarif  # SARIF 2.1.0 for code scanning
+    python validate-migration.py --junit results.xml    # JUnit XML for CI test reports
+    python validate-migration.py --context  # Show the source line under each issue
+    python validate-migration.py --watch    # Keep running, revalidating files as they change
+    python validate-migration.py --include 'docs/**' --exclude '**/drafts/'  # Choose what to scan
+    python validate-migration.py --profile  # Per-stage timings and the 10 slowest files
+    python validate-migration.py --cprofile run.pstats  # cProfile dump (use with --jobs 1)
+
+Scope:
+    Files are found with a pruned walk (see tree_walk.py): only folders that
+    can hold an --include match are opened (default: Development/,
+    Technical-Reference/, User-Guide/, Meta/), and --exclude globs and
+    .gitignore rules drop whole subtrees before they are read.
+
+Rules:
+    Frontmatter rules (required, recommended, forbidden and enum fields) are
+    read from validation-rules.json next to this script unless --rules is given.
+
+Output:
+    - Detailed validation report
+    - List of files with issues
+    - Suggested fixes
+    - Optional JSON Lines, SARIF and JUnit files (see validation_formats.py)
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import time
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from datetime import datetime
+
+from frontmatter import Frontmatter
+from pipeline import run_pipeline
+from profiling import NULL_TIMER, Profile, StageTimer, cprofile
+from section_tree import SectionTree
+from tree_walk import walk_files
+from validation_formats import EMITTERS
+
+# Fix Windows console encoding for Unicode characters
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+DEFAULT_RULES_PATH = Path(__file__).with_name('validation-rules.json')
+
+# Bump when validation logic changes in a way the rule set doesn't capture.
+# Together with the rule set this forms the cache fingerprint.
+CACHE_VERSION = 4
+CACHE_FILENAME = '.validation-cache.json'
+
+# How far past the frontmatter the breadcrumb and H1 checks look
+BREADCRUMB_SCAN_LINES = 20
+H1_SCAN_LINES = 30
+BREADCRUMB_PATTERN = re.compile(r'\[Home\]\(/\)\s*>')
+
+# Folders validated unless --include is given
+DEFAULT_INCLUDE = ('Development/**', 'Technical-Reference/**', 'User-Guide/**', 'Meta/**')
+
+# ANSI color codes for terminal output
+class Colors:
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    BOLD = '\033[1m'
+    END = '\033[0m'
+
+class ValidationIssue:
+    """
+    Represents a validation issue found in a file.
+
+    Slotted, with severity and category interned, since a large scan keeps
+    every issue until the report is written; the same few strings are
+    shared instead of repeated per issue and per worker.
+    """
+    __slots__ = ('severity', 'category', 'message', 'line_number')
+
+    def __init__(self, severity: str, category: str, message: str, line_number: int = None):
+        self.severity = sys.intern(severity)  # 'error', 'warning', 'info'
+        self.category = sys.intern(category)  # 'frontmatter', 'breadcrumb', 'structure'
+        self.message = message
+        self.line_number = line_number
+
+    def __reduce__(self):
+        # Rebuild through __init__ so issues from worker processes are interned too
+        return ValidationIssue, (self.severity, self.category, self.message, self.line_number)
+
+    def styled(self):
+        """(color, text) for report sinks."""
+        color = Colors.RED if self.severity == 'error' else Colors.YELLOW if self.severity == 'warning' else Colors.BLUE
+        prefix = "❌" if self.severity == 'error' else "⚠️" if self.severity == 'warning' else "ℹ️"
+        line_info = f" (line {self.line_number})" if self.line_number else ""
+        return color, f"{prefix} [{self.category.upper()}]{line_info} {self.message}"
+
+    def __str__(self):
+        color, text = self.styled()
+        return f"{color}{text}{Colors.END}"
+
+    def to_dict(self) -> Dict:
+        return {
+            'severity': self.severity,
+            'category': self.category,
+            'message': self.message,
+            'line_number': self.line_number,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ValidationIssue':
+        return cls(data['severity'], data['category'], data['message'], data.get('line_number'))
+
+class FileValidation:
+    """
+    Validation results for a single file. Issues are added through
+    add_issue()/add_issues(), which keep the per-severity counts current.
+    No file content is kept once the checks finish; source_line() reads a
+    line back from disk when a reporter asks for context.
+    """
+    def __init__(self, filepath: Path):
+        self.filepath = filepath
+        self.issues: List[ValidationIssue] = []
+        self.errors = 0
+        self.warnings = 0
+        self.infos = 0
+        self.has_frontmatter = False
+        self.has_new_style_frontmatter = False
+        self.has_old_style_frontmatter = False
+        self.has_breadcrumb = False
+        self.breadcrumb_valid = False
+        # Issue line numbers count from here (the closing '---')
+        self.frontmatter_end_line = 0
+        self._source: Optional[SourceLines] = None
+        # Stage -> seconds, set only while profiling (never cached)
+        self.timings: Optional[Dict[str, float]] = None
+
+    def add_issue(self, severity: str, category: str, message: str, line_number: int = None):
+        self.add_issues([ValidationIssue(severity, category, message, line_number)])
+
+    def add_issues(self, issues: Iterable[ValidationIssue]):
+        for issue in issues:
+            self.issues.append(issue)
+            if issue.severity == 'error':
+                self.errors += 1
+            elif issue.severity == 'warning':
+                self.warnings += 1
+            else:
+                self.infos += 1
+
+    def is_valid(self) -> bool:
+        return self.errors == 0
+
+    def source_line(self, issue: ValidationIssue) -> Optional[str]:
+        """The file line an issue points at, re-read from disk, or None."""
+        if not issue.line_number:
+            return None
+        if self._source is None:
+            self._source = SourceLines(self.filepath)
+        return self._source.line(self.frontmatter_end_line + issue.line_number)
+
+    def release_source(self):
+        """Drop the line offsets gathered by source_line()."""
+        self._source = None
+
+    def error_count(self) -> int:
+        return self.errors
+
+    def warning_count(self) -> int:
+        return self.warnings
+
+    def to_dict(self) -> Dict:
+        """Serialize the results (not the path or content) for the validation cache."""
+        return {
+            'issues': [issue.to_dict() for issue in self.issues],
+            'has_frontmatter': self.has_frontmatter,
+            'has_new_style_frontmatter': self.has_new_style_frontmatter,
+            'has_old_style_frontmatter': self.has_old_style_frontmatter,
+            'has_breadcrumb': self.has_breadcrumb,
+            'breadcrumb_valid': self.breadcrumb_valid,
+            'frontmatter_end_line': self.frontmatter_end_line,
+        }
+
+    @classmethod
+    def from_dict(cls, filepath: Path, data: Dict) -> 'FileValidation':
+        validation = cls(filepath)
+        validation.add_issues(ValidationIssue.from_dict(issue) for issue in data['issues'])
+        validation.has_frontmatter = data['has_frontmatter']
+        validation.has_new_style_frontmatter = data['has_new_style_frontmatter']
+        validation.has_old_style_frontmatter = data['has_old_style_frontmatter']
+        validation.has_breadcrumb = data['has_breadcrumb']
+        validation.breadcrumb_valid = data['breadcrumb_valid']
+        validation.frontmatter_end_line = data['frontmatter_end_line']
+        return validation
+
+class RuleSet:
+    """
+    Declarative frontmatter rules, checked against the file's parsed Frontmatter.
+
+    Config format (JSON):
+        required:    fields that must have a value (error if missing)
+        recommended: fields that should have a value (warning if missing)
+        forbidden:   old Obsidian fields that must not appear (error)
+        enums:       {field: [allowed values]} (warning on other values)
+    """
+    def __init__(self, required: List[str], recommended: List[str],
+                 forbidden: List[str], enums: Dict[str, List[str]]):
+        self.required = list(required)
+        self.recommended = list(recommended)
+        self.forbidden = list(forbidden)
+        self.enums = {field: list(values) for field, values in enums.items()}
+        self._enum_sets = {field: set(values) for field, values in self.enums.items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'RuleSet':
+        return cls(
+            data.get('required', []),
+            data.get('recommended', []),
+            data.get('forbidden', []),
+            data.get('enums', {}),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> 'RuleSet':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    def to_dict(self) -> Dict:
+        return {
+            'required': self.required,
+            'recommended': self.recommended,
+            'forbidden': self.forbidden,
+            'enums': self.enums,
+        }
+
+    def check_presence(self, frontmatter: Frontmatter) -> List[ValidationIssue]:
+        """Check required, recommended and forbidden fields; each is a dict lookup."""
+        issues = []
+
+        for field in self.required:
+            if not frontmatter.has_value(field):
+                issues.append(ValidationIssue('error', 'frontmatter', f"Missing required field: '{field}'"))
+
+        for field in self.recommended:
+            if not frontmatter.has_value(field):
+                issues.append(ValidationIssue('warning', 'frontmatter', f"Missing recommended field: '{field}'"))
+
+        for field in self.forbidden:
+            if frontmatter.has_value(field):
+                issues.append(ValidationIssue(
+                    'error',
+                    'frontmatter',
+                    f"Found old Obsidian field: '{field}' (should be removed or converted)"
+                ))
+
+        return issues
+
+    def check_values(self, frontmatter: Frontmatter) -> List[ValidationIssue]:
+        """Check enum fields against their allowed values."""
+        issues = []
+
+        for field, allowed in self._enum_sets.items():
+            # Only scalar values are checked, not lists
+            value = frontmatter.get(field)
+            if not value or not isinstance(value, str):
+                continue
+            if value not in allowed:
+                issues.append(ValidationIssue(
+                    'warning',
+                    'frontmatter',
+                    f"Unusual {field} value: '{value}' (valid: {', '.join(self.enums[field])})"
+                ))
+
+        return issues
+
+_active_rules: Optional[RuleSet] = None
+_profiling = False
+# Expected breadcrumb crumbs, cached per folder
+_sections = SectionTree()
+
+def set_rules(rules: RuleSet):
+    """Install the rule set used by validate_file() in this process."""
+    global _active_rules
+    _active_rules = rules
+
+def get_rules() -> RuleSet:
+    """Return the active rule set, loading the bundled config on first use."""
+    if _active_rules is None:
+        set_rules(RuleSet.load(DEFAULT_RULES_PATH))
+    return _active_rules
+
+def set_profiling(enabled: bool):
+    """Have validate_file() in this process record stage timings."""
+    global _profiling
+    _profiling = enabled
+
+def _init_worker(rules: RuleSet, profiling: bool):
+    set_rules(rules)
+    set_profiling(profiling)
+
+def rules_fingerprint() -> str:
+    """Hash of the active rule set, used to invalidate cached results."""
+    rules = {'version': CACHE_VERSION, 'rules': get_rules().to_dict()}
+    return hashlib.sha256(json.dumps(rules, sort_keys=True).encode('utf-8')).hexdigest()
+
+def file_sha256(filepath: Path) -> str:
+    """Hash a file in fixed-size chunks."""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class ValidationCache:
+    """
+    Persistent per-file validation results, keyed on (size, mtime, sha).
+    An unchanged size and mtime is a hit without reading the file; otherwise
+    the content hash decides. The whole cache is dropped when the rule set
+    fingerprint changes.
+    """
+    def __init__(self, path: Path, root: Path):
+        self.path = path
+        self.root = root
+        self.fingerprint = rules_fingerprint()
+        self.entries: Dict[str, Dict] = {}
+        self.seen: Dict[str, Dict] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('fingerprint') == self.fingerprint:
+            self.entries = data.get('files', {})
+
+    def _key(self, filepath: Path) -> str:
+        try:
+            return filepath.relative_to(self.root).as_posix()
+        except ValueError:
+            return filepath.as_posix()
+
+    def lookup(self, filepath: Path) -> Optional[FileValidation]:
+        """Return the cached validation for filepath, or None if it must be revalidated."""
+        key = self._key(filepath)
+        try:
+            stat = filepath.stat()
+        except OSError:
+            self.misses += 1
+            return None
+
+        entry = self.entries.get(key)
+        record = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            record['sha'] = entry['sha']
+        else:
+            try:
+                record['sha'] = file_sha256(filepath)
+            except OSError:
+                self.misses += 1
+                return None
+            if not entry or entry['sha'] != record['sha']:
+                self.seen[key] = record
+                self.misses += 1
+                return None
+
+        # Hit: keep the entry, refreshing size/mtime after a touch-only change
+        record['result'] = entry['result']
+        self.seen[key] = record
+        self.hits += 1
+        return FileValidation.from_dict(filepath, entry['result'])
+
+    def store(self, validation: FileValidation):
+        record = self.seen.get(self._key(validation.filepath))
+        # Files that could not be stat'ed or hashed are never cached
+        if record is not None:
+            record['result'] = validation.to_dict()
+
+    def forget(self, filepath: Path):
+        """Drop a deleted file so the next save() leaves it out."""
+        self.seen.pop(self._key(filepath), None)
+
+    def save(self):
+        """Write entries for files seen in this run; deleted files drop out."""
+        files = {key: record for key, record in self.seen.items() if 'result' in record}
+        data = {'fingerprint': self.fingerprint, 'files': files}
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+        # Later lookups in this process (--watch) compare against what was saved
+        self.entries = files
+
+class SourceLines:
+    """
+    Lazy line access to a file on disk. Byte offsets of line starts are
+    recorded only as far as the furthest line asked for, and each line is
+    read back with a seek, so no content is held between calls.
+    """
+    def __init__(self, path: Path):
+        self.path = path
+        self.offsets = [0]
+        self.complete = False
+
+    def line(self, number: int) -> Optional[str]:
+        """1-based line, without its line ending; None past the end or if unreadable."""
+        try:
+            with open(self.path, 'rb') as f:
+                if number > len(self.offsets) - 1 and not self.complete:
+                    f.seek(self.offsets[-1])
+                    while len(self.offsets) <= number:
+                        raw = f.readline()
+                        if not raw:
+                            self.complete = True
+                            break
+                        self.offsets.append(self.offsets[-1] + len(raw))
+                if number < 1 or number >= len(self.offsets):
+                    return None
+                f.seek(self.offsets[number - 1])
+                raw = f.read(self.offsets[number] - self.offsets[number - 1])
+        except OSError:
+            return None
+        return raw.decode('utf-8', errors='replace').rstrip('\r\n')
+
+class DocumentScan:
+    """What the checks need from a file, collected in one forward pass."""
+    def __init__(self):
+        self.frontmatter = ""
+        self.frontmatter_end_line = 0
+        self.breadcrumb_line: Optional[str] = None
+        self.breadcrumb_line_num: Optional[int] = None
+        self.h1_count = 0
+
+def scan_document(lines: Iterable[str]) -> DocumentScan:
+    """
+    Scan markdown lines for frontmatter, breadcrumb and H1 headings.
+    Stops once every check is decided: the frontmatter has closed and the
+    breadcrumb and H1 windows after it have been read, so the rest of a large
+    file is never loaded. Line numbers are relative to the end of frontmatter.
+    """
+    scan = DocumentScan()
+    lines = iter(lines)
+
+    first = next(lines, None)
+    if first is None or first.strip() != '---':
+        return scan
+
+    # Collect frontmatter up to the closing ---
+    frontmatter_lines = []
+    for line_number, line in enumerate(lines, start=2):
+        line = line.rstrip('\n')
+        if line.strip() == '---':
+            scan.frontmatter = '\n'.join(frontmatter_lines)
+            scan.frontmatter_end_line = line_number
+            break
+        frontmatter_lines.append(line)
+    else:
+        # Never closed: treat as no frontmatter
+        return scan
+
+    if not scan.frontmatter:
+        return scan
+
+    # Breadcrumb and H1 windows after the frontmatter
+    window = max(BREADCRUMB_SCAN_LINES, H1_SCAN_LINES)
+    for i, line in enumerate(lines):
+        if i >= window:
+            break
+        line = line.rstrip('\n')
+        if scan.breadcrumb_line is None and i < BREADCRUMB_SCAN_LINES and BREADCRUMB_PATTERN.search(line):
+            scan.breadcrumb_line = line.strip()
+            scan.breadcrumb_line_num = i + 1
+        if i < H1_SCAN_LINES and line.startswith('# '):
+            scan.h1_count += 1
+
+    return scan
+
+def validate_new_style_frontmatter(frontmatter: Frontmatter) -> List[ValidationIssue]:
+    """Validate that frontmatter has new-style YAML structure."""
+    rules = get_rules()
+    issues = rules.check_presence(frontmatter)
+
+    # Check for Obsidian-style links [[...]] in frontmatter
+    if frontmatter.has_wikilinks():
+        issues.append(ValidationIssue(
+            'error',
+            'frontmatter',
+            "Found Obsidian-style wikilinks [[...]] (should use 'related_docs' array)"
+        ))
+
+    issues.extend(rules.check_values(frontmatter))
+
+    return issues
+
+def validate_breadcrumb(scan: DocumentScan, filepath: Path) -> List[ValidationIssue]:
+    """Validate breadcrumb navigation format."""
+    issues = []
+
+    # Breadcrumb is looked for in the first 20 lines after frontmatter
+    breadcrumb_line = scan.breadcrumb_line
+    breadcrumb_line_num = scan.breadcrumb_line_num
+
+    if not breadcrumb_line:
+        issues.append(ValidationIssue(
+            'error',
+            'breadcrumb',
+            "No breadcrumb navigation found (should start with '[Home](/) >')"
+        ))
+        return issues
+
+    # Check for malformed breadcrumb ending with "---"
+    if breadcrumb_line.endswith('> ---'):
+        issues.append(ValidationIssue(
+            'error',
+            'breadcrumb',
+            f"Breadcrumb ends with '> ---' (should end with page title)",
+            breadcrumb_line_num
+        ))
+
+    # Check if breadcrumb ends with a proper page title
+    if not breadcrumb_line.endswith('> ---') and '>' in breadcrumb_line:
+        # Extract last segment
+        last_segment = breadcrumb_line.split('>')[-1].strip()
+        if not last_segment or last_segment.startswith('['):
+            issues.append(ValidationIssue(
+                'warning',
+                'breadcrumb',
+                f"Breadcrumb may be malformed - last segment: '{last_segment}'",
+                breadcrumb_line_num
+            ))
+
+    # Validate breadcrumb path matches file location: the crumbs the
+    # migrators generate for this folder (section_tree.py)
+    relative_path = filepath.relative_to(Path.cwd()).as_posix()
+
+    for expected_text in _sections.expected_names(relative_path):
+        if expected_text not in breadcrumb_line:
+            issues.append(ValidationIssue(
+                'warning',
+                'breadcrumb',
+                f"Breadcrumb may not match file path - expected '{expected_text}' in breadcrumb",
+                breadcrumb_line_num
+            ))
+            break  # Only report first mismatch
+
+    return issues
+
+def validate_structure(scan: DocumentScan) -> List[ValidationIssue]:
+    """Validate document structure."""
+    issues = []
+
+    # Main headings (# Title) counted in the first 30 lines after frontmatter
+    h1_count = scan.h1_count
+
+    if h1_count == 0:
+        issues.append(ValidationIssue(
+            'warning',
+            'structure',
+            "No H1 heading found in first 30 lines"
+        ))
+
+    if h1_count > 1:
+        issues.append(ValidationIssue(
+            'warning',
+            'structure',
+            f"Multiple H1 headings found ({h1_count}) - should have exactly 1"
+        ))
+
+    return issues
+
+def validate_file(filepath: Path) -> FileValidation:
+    """Validate a single markdown file (with stage timings if profiling)."""
+    validation = FileValidation(filepath)
+    timer = StageTimer() if _profiling else NULL_TIMER
+    _check_file(validation, timer)
+    if timer.enabled:
+        validation.timings = timer.times
+    return validation
+
+def read_source(filepath: Path):
+    """Read stage of the concurrent pipeline: (filepath, text, error)."""
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return filepath, f.read(), None
+    except Exception as e:
+        return filepath, None, str(e)
+
+def validate_source(source) -> FileValidation:
+    """validate_file() on text already read by read_source()."""
+    filepath, text, error = source
+    validation = FileValidation(filepath)
+    timer = StageTimer() if _profiling else NULL_TIMER
+    if error is not None:
+        validation.add_issue('error', 'file', f"Failed to read file: {error}")
+    else:
+        _check_file(validation, timer, io.StringIO(text))
+    if timer.enabled:
+        validation.timings = timer.times
+    return validation
+
+def _check_file(validation: FileValidation, timer, lines: Optional[Iterable[str]] = None):
+    """Run every check, reading the file unless its lines are given."""
+    filepath = validation.filepath
+
+    if lines is not None:
+        with timer.stage('scan'):
+            scan = scan_document(lines)
+    else:
+        try:
+            with timer.stage('read+scan'), open(filepath, 'r', encoding='utf-8') as f:
+                scan = scan_document(f)
+        except Exception as e:
+            validation.add_issue('error', 'file', f"Failed to read file: {str(e)}")
+            return
+
+    if not scan.frontmatter:
+        validation.add_issue('error', 'frontmatter', "No frontmatter found (should start with '---')")
+        return
+
+    validation.has_frontmatter = True
+    validation.frontmatter_end_line = scan.frontmatter_end_line
+    with timer.stage('frontmatter'):
+        frontmatter = Frontmatter(scan.frontmatter)
+
+        # Check if it's new-style or old-style frontmatter
+        has_title = 'title' in frontmatter
+        has_old_tags = frontmatter.is_block('tags')  # Old style: tags at root level
+        has_old_created = 'created' in frontmatter
+        has_old_related = 'related' in frontmatter or frontmatter.has_wikilinks()
+
+    if has_title:
+        validation.has_new_style_frontmatter = True
+
+    if has_old_tags or has_old_created or has_old_related:
+        validation.has_old_style_frontmatter = True
+        validation.add_issue('error', 'frontmatter', "Found old Obsidian-style frontmatter (needs migration)")
+
+    # Validate new-style frontmatter
+    with timer.stage('frontmatter rules'):
+        frontmatter_issues = validate_new_style_frontmatter(frontmatter)
+    validation.add_issues(frontmatter_issues)
+
+    # Validate breadcrumb
+    with timer.stage('breadcrumb'):
+        breadcrumb_issues = validate_breadcrumb(scan, filepath)
+    validation.add_issues(breadcrumb_issues)
+    if not breadcrumb_issues:
+        validation.has_breadcrumb = True
+        validation.breadcrumb_valid = True
+    elif not any(i.severity == 'error' for i in breadcrumb_issues):
+        validation.has_breadcrumb = True
+        validation.breadcrumb_valid = False
+
+    # Validate structure
+    with timer.stage('structure'):
+        structure_issues = validate_structure(scan)
+    validation.add_issues(structure_issues)
+
+def find_markdown_files(directory: Path, include: Sequence[str] = DEFAULT_INCLUDE,
+                        exclude: Sequence[str] = (), gitignore: bool = True) -> List[Path]:
+    """Find the markdown files to validate (excluding READMEs), in traversal order."""
+    return [path for path in walk_files(directory, include, exclude, gitignore)
+            if path.suffix == '.md' and path.name.lower() != 'readme.md']
+
+def iter_validate_files(files: List[Path], jobs: int = 1) -> Iterator[FileValidation]:
+    """
+    Validate files, yielding each result in order as soon as it is ready.
+    With jobs > 1 the list is split across worker processes; results come
+    back in the same order as a serial run so the report is identical.
+    """
+    if jobs <= 1 or len(files) < 2:
+        for md_file in files:
+            yield validate_file(md_file)
+        return
+
+    workers = min(jobs, len(files))
+    # A few chunks per worker keeps the pool balanced without per-file IPC
+    chunksize = max(1, len(files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(get_rules(), _profiling)) as executor:
+        yield from executor.map(validate_file, files, chunksize=chunksize)
+
+def validate_files_concurrently(files: List[Path], jobs: int = 1, concurrency: int = 16,
+                                on_result: Optional[Callable[[int, FileValidation], None]] = None
+                                ) -> List[FileValidation]:
+    """
+    Validate files through the asyncio pipeline (pipeline.py): up to
+    concurrency reads overlap, which pays off when each read waits on a
+    network or WSL mount, and checks run on jobs worker processes (a thread
+    if jobs is 1). Returns results in file order; on_result(index, result)
+    is called as each file finishes, in completion order.
+    """
+    if jobs <= 1 or len(files) < 2:
+        return run_pipeline(files, read_source, validate_source, concurrency=concurrency,
+                            transform_workers=1, on_result=on_result)
+    with ProcessPoolExecutor(max_workers=min(jobs, len(files)), initializer=_init_worker,
+                             initargs=(get_rules(), _profiling)) as executor:
+        return run_pipeline(files, read_source, validate_source, concurrency=concurrency,
+                            executor=executor, transform_workers=jobs, on_result=on_result)
+
+def validate_files(files: List[Path], jobs: int = 1) -> List[FileValidation]:
+    """Validate files, in order."""
+    return list(iter_validate_files(files, jobs))
+
+def scan_directory(directory: Path, jobs: int = 1,
+                   cache: Optional[ValidationCache] = None,
+                   on_result: Optional[Callable[[FileValidation], None]] = None,
+                   scope: Optional[Dict] = None,
+                   profile: Optional[Profile] = None,
+                   concurrency: int = 1) -> List[FileValidation]:
+    """
+    Scan directory for markdown files and validate them. scope holds
+    find_markdown_files() keyword arguments (include, exclude, gitignore).
+    With a profile, the walk and cache lookups are timed and each
+    validated file's stage timings are added to it. With concurrency > 1,
+    files are validated by validate_files_concurrently(), and on_result
+    sees them in completion order.
+    Files with a cache hit are not re-read; only misses are validated.
+    on_result is called with each validation as soon as it is available
+    (cache hits first); the returned list is in file order.
+    """
+    timed = profile.time if profile is not None else NULL_TIMER.stage
+    with timed('walk'):
+        files = find_markdown_files(directory, **(scope or {}))
+
+    validations: List[Optional[FileValidation]] = [None] * len(files)
+    if cache is not None:
+        with timed('cache lookup'):
+            for i, md_file in enumerate(files):
+                validations[i] = cache.lookup(md_file)
+                if validations[i] is not None and on_result is not None:
+                    on_result(validations[i])
+    missing = [i for i, validation in enumerate(validations) if validation is None]
+
+    def finish(i: int, validation: FileValidation):
+        if cache is not None:
+            cache.store(validation)
+        if on_result is not None:
+            on_result(validation)
+        if profile is not None and validation.timings is not None:
+            profile.add(validation.filepath.relative_to(directory).as_posix(), validation.timings)
+            validation.timings = None
+        validations[i] = validation
+
+    to_validate = [files[i] for i in missing]
+    if concurrency > 1:
+        validate_files_concurrently(to_validate, jobs, concurrency,
+                                    on_result=lambda k, validation: finish(missing[k], validation))
+    else:
+        for i, validation in zip(missing, iter_validate_files(to_validate, jobs)):
+            finish(i, validation)
+
+    return validations
+
+class ReportSink:
+    """
+    A text stream the report is written to. Styled parts get ANSI colors
+    only if color is set, so each sink formats its own copy of each line.
+    """
+    def __init__(self, stream, color: bool = False):
+        self.stream = stream
+        self.color = color
+
+    def write_line(self, parts: Iterable):
+        if self.color:
+            text = ''.join(f"{part[0]}{part[1]}{Colors.END}" if isinstance(part, tuple) else part
+                           for part in parts)
+        else:
+            text = ''.join(part[1] if isinstance(part, tuple) else part for part in parts)
+        self.stream.write(text + '\n')
+
+class ReportWriter:
+    """Streams report lines to every sink as they are produced."""
+    def __init__(self, sinks: List[ReportSink]):
+        self.sinks = sinks
+
+    def line(self, *parts):
+        """Write one line made of plain strings and (color, text) tuples."""
+        for sink in self.sinks:
+            sink.write_line(parts)
+
+    def heading(self, title: str):
+        """Section title between two rules."""
+        self.line((Colors.BOLD, '='*80))
+        self.line((Colors.BOLD, title))
+        self.line((Colors.BOLD, '='*80))
+
+class ReportStats:
+    """Summary figures for a report, gathered in one pass over the results."""
+    def __init__(self):
+        self.total_files = 0
+        self.valid_files = 0
+        self.total_errors = 0
+        self.total_warnings = 0
+        self.new_style = 0
+        self.old_style = 0
+        self.no_frontmatter = 0
+        self.has_breadcrumb = 0
+        self.valid_breadcrumb = 0
+        self.invalid: List[FileValidation] = []
+        self.warning_only: List[FileValidation] = []
+
+    @property
+    def invalid_files(self) -> int:
+        return self.total_files - self.valid_files
+
+    def add(self, v: FileValidation, sign: int = 1):
+        """Count a result in (or out, with sign=-1); the file lists are left alone."""
+        self.total_files += sign
+        self.total_errors += sign * v.errors
+        self.total_warnings += sign * v.warnings
+        if not v.errors:
+            self.valid_files += sign
+        self.new_style += sign * v.has_new_style_frontmatter
+        self.old_style += sign * v.has_old_style_frontmatter
+        self.no_frontmatter += sign * (not v.has_frontmatter)
+        self.has_breadcrumb += sign * v.has_breadcrumb
+        self.valid_breadcrumb += sign * v.breadcrumb_valid
+
+    def remove(self, v: FileValidation):
+        self.add(v, -1)
+
+    @classmethod
+    def collect(cls, validations: Iterable[FileValidation]) -> 'ReportStats':
+        stats = cls()
+        for v in validations:
+            stats.add(v)
+            if v.errors:
+                stats.invalid.append(v)
+            elif v.warnings:
+                stats.warning_only.append(v)
+        return stats
+
+def peak_rss_mb() -> Optional[Tuple[float, float]]:
+    """Peak resident memory in MB of this process and of its largest worker, if known."""
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+    workers = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale
+    return own, workers
+
+def write_issues(validation: FileValidation, issues: Iterable[ValidationIssue],
+                 writer: ReportWriter, context: bool = False):
+    """Write a file's issues, each followed by its source line if context is set."""
+    for issue in issues:
+        writer.line("   ", issue.styled())
+        if context:
+            source = validation.source_line(issue)
+            if source is not None:
+                writer.line(f"      | {source}")
+    validation.release_source()
+
+def write_report(validations: List[FileValidation], writer: ReportWriter, context: bool = False):
+    """
+    Write a detailed validation report, line by line. With context, each
+    issue that has a line number is followed by that line, read back from
+    the file.
+    """
+    rules = get_rules()
+
+    # Header
+    writer.heading("Documentation Migration Validation Report")
+    writer.line(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    writer.line()
+
+    # Summary statistics
+    stats = ReportStats.collect(validations)
+    total_files = stats.total_files
+    invalid_files = stats.invalid_files
+    old_style = stats.old_style
+
+    writer.line((Colors.BOLD, "Summary:"))
+    writer.line(f"  Total files validated: {total_files}")
+    writer.line("  ", (Colors.GREEN, f"✅ Valid files: {stats.valid_files}"))
+    writer.line("  ", (Colors.RED, f"❌ Files with errors: {invalid_files}"))
+    writer.line("  ", (Colors.RED, f"Total errors: {stats.total_errors}"))
+    writer.line("  ", (Colors.YELLOW, f"Total warnings: {stats.total_warnings}"))
+    writer.line()
+
+    # Frontmatter statistics
+    new_style = stats.new_style
+
+    writer.line((Colors.BOLD, "Frontmatter Statistics:"))
+    writer.line(f"  New-style frontmatter: {new_style}/{total_files} ({100*new_style/total_files:.1f}%)")
+    writer.line(f"  Old-style frontmatter: {old_style}/{total_files} ({100*old_style/total_files:.1f}%)")
+    writer.line(f"  No frontmatter: {stats.no_frontmatter}/{total_files}")
+    writer.line()
+
+    # Breadcrumb statistics
+    writer.line((Colors.BOLD, "Breadcrumb Statistics:"))
+    writer.line(f"  Has breadcrumb: {stats.has_breadcrumb}/{total_files}")
+    writer.line(f"  Valid breadcrumb: {stats.valid_breadcrumb}/{total_files}")
+    writer.line()
+
+    # Files with issues
+    if stats.invalid:
+        writer.heading("Files with Issues:")
+        writer.line()
+
+        for validation in stats.invalid:
+            relative_path = validation.filepath.relative_to(Path.cwd())
+
+            writer.line((Colors.RED, f"❌ {relative_path}"))
+            writer.line(f"   Errors: {validation.errors}, Warnings: {validation.warnings}")
+
+            write_issues(validation, validation.issues, writer, context)
+
+            writer.line()
+
+    # Files with only warnings
+    if stats.warning_only:
+        writer.heading("Files with Warnings (No Errors):")
+        writer.line()
+
+        for validation in stats.warning_only:
+            relative_path = validation.filepath.relative_to(Path.cwd())
+
+            writer.line((Colors.YELLOW, f"⚠️  {relative_path}"), f" ({validation.warnings} warnings)")
+
+            warnings = (issue for issue in validation.issues if issue.severity == 'warning')
+            write_issues(validation, warnings, writer, context)
+
+            writer.line()
+
+    # Recommendations
+    writer.heading("Recommendations:")
+    writer.line()
+
+    if old_style > 0:
+        writer.line((Colors.RED, f"1. Fix Old-Style Frontmatter ({old_style} files)"))
+        writer.line("   - Remove 'created', 'related', and root-level 'tags' fields")
+        writer.line(f"   - Add required fields: {', '.join(rules.required)}")
+        writer.line("   - Convert [[wikilinks]] to 'related_docs' array")
+        writer.line()
+
+    if invalid_files - old_style > 0:
+        writer.line((Colors.RED, "2. Fix Malformed Breadcrumbs"))
+        writer.line("   - Breadcrumbs should end with page title, not '---'")
+        writer.line("   - Format: [Home](/) > [Section](/Section/) > Page Title")
+        writer.line()
+
+    if stats.total_warnings > 0:
+        writer.line((Colors.YELLOW, "3. Address Warnings"))
+        writer.line(f"   - Add missing recommended fields ({', '.join(rules.recommended)})")
+        writer.line("   - Verify breadcrumb paths match file locations")
+        writer.line("   - Ensure single H1 heading per document")
+        writer.line()
+
+    writer.line((Colors.BOLD, '='*80))
+
+def take_snapshot(directory: Path, scope: Optional[Dict] = None) -> Dict[Path, tuple]:
+    """(mtime, size) of every file to validate, for change detection."""
+    snapshot = {}
+    for md_file in find_markdown_files(directory, **(scope or {})):
+        try:
+            stat = md_file.stat()
+        except OSError:
+            continue  # deleted mid-scan
+        snapshot[md_file] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+def watch(directory: Path, validations: List[FileValidation],
+          cache: Optional[ValidationCache] = None,
+          interval: float = 0.5, debounce: float = 0.2,
+          scope: Optional[Dict] = None) -> int:
+    """
+    Poll for changed, added and deleted files and revalidate only those.
+    A burst of saves is batched: once a change is seen, polling continues
+    every debounce seconds until the tree stops changing. The summary counts
+    are adjusted per file rather than recomputed. Runs until interrupted and
+    returns the exit code for the last state.
+    """
+    results = {v.filepath: v for v in validations}
+    stats = ReportStats.collect(validations)
+    snapshot = take_snapshot(directory, scope)
+
+    print(f"{Colors.BOLD}Watching {len(snapshot)} files for changes (Ctrl+C to stop)...{Colors.END}\n")
+    try:
+        while True:
+            time.sleep(interval)
+            current = take_snapshot(directory, scope)
+            if current == snapshot:
+                continue
+            while True:
+                time.sleep(debounce)
+                settled = take_snapshot(directory, scope)
+                if settled == current:
+                    break
+                current = settled
+
+            started = time.perf_counter()
+            changed = [path for path, state in current.items() if snapshot.get(path) != state]
+            removed = [path for path in snapshot if path not in current]
+            snapshot = current
+
+            print(f"{Colors.BOLD}[{datetime.now().strftime('%H:%M:%S')}]{Colors.END} "
+                  f"{len(changed)} changed, {len(removed)} removed")
+            for path in removed:
+                stats.remove(results.pop(path))
+                if cache is not None:
+                    cache.forget(path)
+                print(f"  🗑️  {path.relative_to(directory)}")
+            for path in changed:
+                if path in results:
+                    stats.remove(results[path])
+                validation = cache.lookup(path) if cache is not None else None
+                if validation is None:
+                    validation = validate_file(path)
+                    if cache is not None:
+                        cache.store(validation)
+                results[path] = validation
+                stats.add(validation)
+
+                relative_path = path.relative_to(directory)
+                if validation.errors:
+                    print(f"  {Colors.RED}❌ {relative_path}{Colors.END} "
+                          f"({validation.errors} errors, {validation.warnings} warnings)")
+                    for issue in validation.issues:
+                        print(f"     {issue}")
+                elif validation.warnings:
+                    print(f"  {Colors.YELLOW}⚠️  {relative_path}{Colors.END} ({validation.warnings} warnings)")
+                else:
+                    print(f"  {Colors.GREEN}✅ {relative_path}{Colors.END}")
+            if cache is not None:
+                cache.save()
+
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            print(f"  Files: {stats.total_files}, valid: {stats.valid_files}, "
+                  f"{Colors.RED}errors: {stats.total_errors}{Colors.END}, "
+                  f"{Colors.YELLOW}warnings: {stats.total_warnings}{Colors.END} ({elapsed_ms:.0f} ms)\n")
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+
+    return 0 if stats.invalid_files == 0 else 1
+
+def parse_args(argv=None):
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Validate migrated documentation files.")
+    parser.add_argument(
+        '--jobs', '-j', type=int, default=1, metavar='N',
+        help="number of worker processes (0 = one per CPU core, default: 1)"
+    )
+    parser.add_argument(
+        '--concurrency', type=int, default=1, metavar='N',
+        help="keep up to N file reads in flight (asyncio pipeline, for network/WSL mounts; default: 1)"
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help=f"revalidate every file and leave {CACHE_FILENAME} untouched"
+    )
+    parser.add_argument(
+        '--rules', type=Path, default=DEFAULT_RULES_PATH, metavar='PATH',
+        help=f"frontmatter rule set (default: {DEFAULT_RULES_PATH.name})"
+    )
+    parser.add_argument(
+        '--jsonl', type=Path, metavar='PATH',
+        help="stream one JSON object per file to PATH as files finish ('-' for stdout)"
+    )
+    parser.add_argument(
+        '--sarif', type=Path, metavar='PATH',
+        help="write a SARIF 2.1.0 log to PATH"
+    )
+    parser.add_argument(
+        '--junit', type=Path, metavar='PATH',
+        help="write JUnit XML to PATH"
+    )
+    parser.add_argument(
+        '--context', action='store_true',
+        help="show the source line under each issue in the report (re-read from disk)"
+    )
+    parser.add_argument(
+        '--include', action='append', metavar='GLOB',
+        help="scan only paths matching GLOB; repeatable (default: " + ", ".join(DEFAULT_INCLUDE) + ")"
+    )
+    parser.add_argument(
+        '--exclude', action='append', default=[], metavar='GLOB',
+        help="skip files or whole folders matching GLOB; repeatable"
+    )
+    parser.add_argument(
+        '--no-gitignore', action='store_true',
+        help="don't skip paths ignored by .gitignore files"
+    )
+    parser.add_argument(
+        '--profile', type=int, nargs='?', const=10, metavar='N',
+        help="print per-stage timings, histograms and the N slowest files (default N: 10)"
+    )
+    parser.add_argument(
+        '--cprofile', type=Path, metavar='PATH',
+        help="dump cProfile stats for the scan and report to PATH (worker processes aren't covered)"
+    )
+    parser.add_argument(
+        '--watch', action='store_true',
+        help="after the report, keep polling for changes and revalidate changed files"
+    )
+    parser.add_argument(
+        '--interval', type=float, default=0.5, metavar='SECONDS',
+        help="polling interval for --watch (default: 0.5)"
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Main validation entry point."""
+    args = parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    print(f"\n{Colors.BOLD}Starting Documentation Migration Validation...{Colors.END}\n")
+
+    try:
+        set_rules(RuleSet.load(args.rules))
+    except (OSError, ValueError) as e:
+        print(f"{Colors.RED}Error: Could not load rules from {args.rules}: {e}{Colors.END}")
+        return 1
+
+    # Get current directory (should be docs repo root)
+    docs_root = Path.cwd()
+    scope = {
+        'include': args.include or DEFAULT_INCLUDE,
+        'exclude': args.exclude,
+        'gitignore': not args.no_gitignore,
+    }
+
+    print(f"Scanning directory: {docs_root}")
+    print(f"Looking for markdown files in: {', '.join(scope['include'])}")
+    if scope['exclude']:
+        print(f"Excluding: {', '.join(scope['exclude'])}")
+    if jobs > 1:
+        print(f"Using {jobs} worker processes")
+    if args.concurrency > 1:
+        print(f"Up to {args.concurrency} file reads in flight")
+    print("")
+
+    profile = Profile(args.profile) if args.profile is not None else None
+    set_profiling(profile is not None)
+    timed = profile.time if profile is not None else NULL_TIMER.stage
+
+    cache = None
+    if not args.no_cache:
+        cache = ValidationCache(docs_root / CACHE_FILENAME, docs_root)
+        cache.load()
+
+    # Profiled (with --cprofile) from the scan through the report
+    with cprofile(args.cprofile):
+        # Scan and validate, streaming results to any structured outputs
+        with ExitStack() as outputs:
+            emitters = []
+            for name, emitter_class in EMITTERS.items():
+                path = getattr(args, name)
+                if path is None:
+                    continue
+                stream = sys.stdout if str(path) == '-' else outputs.enter_context(open(path, 'w', encoding='utf-8'))
+                emitters.append(emitter_class(stream, docs_root))
+
+            def emit(validation: FileValidation):
+                for emitter in emitters:
+                    emitter.file_done(validation)
+
+            validations = scan_directory(docs_root, jobs, cache, on_result=emit if emitters else None,
+                                         scope=scope, profile=profile, concurrency=args.concurrency)
+            for emitter in emitters:
+                emitter.close()
+
+        if not validations:
+            print(f"{Colors.RED}Error: No markdown files to validate!{Colors.END}")
+            print(f"Current directory: {docs_root}")
+            print(f"Run from the documentation root, or choose folders with --include")
+            return 1
+
+        print(f"Found {len(validations)} files to validate")
+        if cache is not None:
+            print(f"Cache: {cache.hits} hits, {cache.misses} misses")
+            cache.save()
+        peak = peak_rss_mb()
+        if peak is not None:
+            own, workers = peak
+            print(f"Peak memory: {own:.1f} MB" + (f" (largest worker: {workers:.1f} MB)" if jobs > 1 else ""))
+        print("")
+
+        # Stream the report to the terminal (colored) and the report file (plain)
+        report_path = docs_root / 'validation-report.txt'
+        with open(report_path, 'w', encoding='utf-8') as report_file:
+            writer = ReportWriter([ReportSink(sys.stdout, color=True), ReportSink(report_file)])
+            with timed('report'):
+                write_report(validations, writer, args.context)
+
+        print(f"\n{Colors.GREEN}Report saved to: {report_path}{Colors.END}\n")
+
+    if profile is not None:
+        print(f"{Colors.BOLD}Profile:{Colors.END}")
+        for line in profile.lines():
+            print(f"  {line}" if line else "")
+        print("")
+    if args.cprofile:
+        print(f"cProfile stats saved to: {args.cprofile} (view with: python -m pstats {args.cprofile})\n")
+
+    if args.watch:
+        return watch(docs_root, validations, cache, args.interval, scope=scope)
+
+    # Exit code based on validation results
+    return 0 if all(v.is_valid() for v in validations) else 1
+
+if __name__ == '__main__':
+    exit(main())
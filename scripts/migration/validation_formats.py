@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Machine-readable outputs for validate-migration.py.
+
+Each emitter is fed FileValidation objects through file_done() as files
+finish validating, and close() completes the output:
+
+    JsonLinesEmitter  one JSON object per file, written and flushed at once
+    SarifEmitter      SARIF 2.1.0 log for code-scanning tools
+    JUnitEmitter      JUnit XML, one test case per file
+
+SARIF and JUnit are single documents, so they keep a compact record per
+issue until close(); no file content is held.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, TextIO, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+TOOL_NAME = 'validate-migration'
+
+SARIF_LEVELS = {'error': 'error', 'warning': 'warning', 'info': 'note'}
+
+def relative_path(filepath: Path, root: Path) -> str:
+    """Posix path of filepath relative to root (as-is if outside it)."""
+    try:
+        return filepath.relative_to(root).as_posix()
+    except ValueError:
+        return filepath.as_posix()
+
+class JsonLinesEmitter:
+    """Streams one JSON object per validated file."""
+    def __init__(self, stream: TextIO, root: Path):
+        self.stream = stream
+        self.root = root
+
+    def file_done(self, validation):
+        record = {
+            'file': relative_path(validation.filepath, self.root),
+            'valid': validation.is_valid(),
+            'errors': validation.error_count(),
+            'warnings': validation.warning_count(),
+            'issues': [issue.to_dict() for issue in validation.issues],
+        }
+        self.stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.stream.flush()
+
+    def close(self):
+        self.stream.flush()
+
+class SarifEmitter:
+    """SARIF 2.1.0 log with one result per issue; rules are issue categories."""
+    def __init__(self, stream: TextIO, root: Path):
+        self.stream = stream
+        self.root = root
+        self.results: List[Dict] = []
+        self.rule_ids: Dict[str, int] = {}
+
+    def file_done(self, validation):
+        uri = relative_path(validation.filepath, self.root)
+        for issue in validation.issues:
+            rule_id = f"migration/{issue.category}"
+            rule_index = self.rule_ids.setdefault(rule_id, len(self.rule_ids))
+            location = {'artifactLocation': {'uri': uri}}
+            if issue.line_number:
+                location['region'] = {'startLine': issue.line_number}
+            self.results.append({
+                'ruleId': rule_id,
+                'ruleIndex': rule_index,
+                'level': SARIF_LEVELS.get(issue.severity, 'note'),
+                'message': {'text': issue.message},
+                'locations': [{'physicalLocation': location}],
+            })
+
+    def close(self):
+        rules = [{'id': rule_id, 'name': rule_id.split('/', 1)[1]}
+                 for rule_id, _ in sorted(self.rule_ids.items(), key=lambda item: item[1])]
+        log = {
+            '$schema': 'https://json.schemastore.org/sarif-2.1.0.json',
+            'version': '2.1.0',
+            'runs': [{
+                'tool': {'driver': {'name': TOOL_NAME, 'rules': rules}},
+                'results': self.results,
+            }],
+        }
+        json.dump(log, self.stream, indent=2, ensure_ascii=False)
+        self.stream.write('\n')
+        self.stream.flush()
+
+class JUnitEmitter:
+    """
+    JUnit XML test suite: files with errors fail, warnings and info go to
+    the test case's system-out.
+    """
+    def __init__(self, stream: TextIO, root: Path):
+        self.stream = stream
+        self.root = root
+        # (file, error lines, other lines)
+        self.cases: List[Tuple[str, List[str], List[str]]] = []
+        self.failures = 0
+
+    @staticmethod
+    def _issue_line(issue) -> str:
+        line_info = f":{issue.line_number}" if issue.line_number else ""
+        return f"{issue.severity}{line_info} [{issue.category}] {issue.message}"
+
+    def file_done(self, validation):
+        errors = [self._issue_line(i) for i in validation.issues if i.severity == 'error']
+        others = [self._issue_line(i) for i in validation.issues if i.severity != 'error']
+        if errors:
+            self.failures += 1
+        self.cases.append((relative_path(validation.filepath, self.root), errors, others))
+
+    def close(self):
+        write = self.stream.write
+        write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        write(f'<testsuite name={quoteattr(TOOL_NAME)} tests="{len(self.cases)}" '
+              f'failures="{self.failures}" errors="0">\n')
+        for name, errors, others in self.cases:
+            write(f'  <testcase classname={quoteattr(TOOL_NAME)} name={quoteattr(name)}>\n')
+            if errors:
+                message = f"{len(errors)} error" + ("s" if len(errors) != 1 else "")
+                write(f'    <failure message={quoteattr(message)}>{escape(chr(10).join(errors))}</failure>\n')
+            if others:
+                write(f'    <system-out>{escape(chr(10).join(others))}</system-out>\n')
+            write('  </testcase>\n')
+        write('</testsuite>\n')
+        self.stream.flush()
+
+EMITTERS = {
+    'jsonl': JsonLinesEmitter,
+    'sarif': SarifEmitter,
+    'junit': JUnitEmitter,
+}